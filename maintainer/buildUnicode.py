@@ -87,13 +87,13 @@ def emitCategoryMap (data_file='UnicodeData-3.1.0.txt'):
         category_map.setdefault(category[0], []).append(codepoint)
     
     print '# Unicode general category properties: %d properties' % (len(category_map),)
-    print 'PropertyMap = {'
+    print 'PropertyRanges = {'
     for k in sorted(category_map.keys()):
         v = category_map.get(k)
         print '  # %s: %d codepoint markers (*not* codepoints)' % (k, len(v))
-        print "  %-4s : CodePointSet([" % ("'%s'" % k,)
+        print "  %-4s : (" % ("'%s'" % k,)
         print "           %s" % (rangesToPython(condenseCodepoints(v), indent=11, width=67),)
-        print "         ]),"
+        print "         ),"
     print '  }'
 
 def emitBlockMap (data_file='Blocks-4.txt'):
@@ -113,17 +113,16 @@ def emitBlockMap (data_file='Blocks-4.txt'):
         block_map.setdefault(block, []).append( (rmin, rmax) )
 
     print '# Unicode code blocks: %d blocks' % (len(block_map),)
-    print 'BlockMap = {'
+    print 'BlockRanges = {'
     for k in sorted(block_map.keys()):
         v = block_map.get(k)
-        print '  %s : CodePointSet(' % (repr(k),)
+        print '  %s : (' % (repr(k),)
         print '     %s' % (rangesToPython(v, indent=6, width=67),)
         print '  ),'
     print '  }'
 
-print '''# Unicode property and category maps.
-
-from unicode import CodePointSet
+print '''# Unicode property and category code point ranges.  This module is
+# loaded on demand by pyxb.utils.unicode; do not import it directly.
 '''
 
 emitBlockMap()
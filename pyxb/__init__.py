@@ -53,6 +53,9 @@ class cscRoot (object):
         if issubclass(self.__class__.mro()[-2], ( list, dict )):
             super(cscRoot, self).__init__(*args)
 
+    # Permit subclasses to hold their members in slots
+    __slots__ = ()
+
 __version__ = '1.1.2'
 """The version of PyXB"""
 
@@ -114,12 +117,20 @@ XMLStyle_saxdom.  However, since the pyxb.xmlschema.structures classes require
 a DOM model, XMLStyle_saxdom will be used for pyxb.utils.domutils.StringToDOM
 if this style is selected."""
 
+XMLStyle_expat = 3
+"""As with XMLStyle_saxer, but the handlers receive events directly from
+xml.parsers.expat rather than through the xml.sax reader interface, avoiding
+some per-element overhead.  Documents are processed with
+pyxb.utils.saxutils.DirectExpatParser whenever a SAX parser would otherwise
+be used."""
+
 _XMLStyle = XMLStyle_saxer
 """The current XML processing style."""
 
 _XMLStyleMap = { 'minidom' : XMLStyle_minidom,
                  'saxdom' : XMLStyle_saxdom,
-                 'saxer' : XMLStyle_saxer }
+                 'saxer' : XMLStyle_saxer,
+                 'expat' : XMLStyle_expat }
 _XMLStyleMapReverse = dict([ (_v, _k) for (_k, _v) in _XMLStyleMap.items() ])
 
 _XMLStyle_envvar = 'PYXB_XML_STYLE'
@@ -129,10 +140,12 @@ def _SetXMLStyle (style=None):
 
     This can be invoked within code.  The system default of L{XMLStyle_saxer}
     can also be overridden at runtime by setting the environment variable
-    C{PYXB_XML_STYLE} to one of C{minidom}, C{saxdom}, or C{saxer}.
+    C{PYXB_XML_STYLE} to one of C{minidom}, C{saxdom}, C{saxer}, or
+    C{expat}.
 
     @param style: One of L{XMLStyle_minidom}, L{XMLStyle_saxdom},
-    L{XMLStyle_saxer}.  If not provided, the system default is used.
+    L{XMLStyle_saxer}, L{XMLStyle_expat}.  If not provided, the system default
+    is used.
     """
     global _XMLStyle
     if style is None:
@@ -220,6 +233,83 @@ def RequireValidWhenParsing (value=None):
     _ParsingRequiresValid = value
     return _ParsingRequiresValid
 
+_ParsingTrustsInput = False
+def TrustInputWhenParsing (value=None):
+    """Query or set a flag that marks parsed documents as known to be valid.
+
+    This is stronger than disabling L{RequireValidWhenParsing}.  When set,
+    SAX-based parsing stores each element directly in the binding slot for
+    its element use without consulting the content model, and creates
+    simple values without checking their constraining facets.  Documents
+    that are not in fact valid may produce bindings that are incorrect in
+    ways that are not detected.  The value at the time a parser is created
+    applies to that parser.
+
+    @keyword value: If absent or C{None}, no change is made; otherwise, this
+    enables (C{True}) or disables (C{False}) trusted parsing.
+    @type value: C{bool}
+
+    @return: C{True} iff parsers trust their input."""
+    global _ParsingTrustsInput
+    if value is None:
+        return _ParsingTrustsInput
+    if not isinstance(value, bool):
+        raise TypeError(value)
+    _ParsingTrustsInput = value
+    return _ParsingTrustsInput
+
+_ParsingTracksLocations = True
+def TrackLocationsWhenParsing (value=None):
+    """Query or set a flag that controls whether SAX-based parsers record the
+    location of each element.
+
+    Locations identify the line and column at which the element for a
+    binding instance or DOM node began, for use in diagnostics.  Recording
+    them costs time and memory for every element, and may be disabled when
+    they are not needed.  The value at the time a parser is created applies
+    to that parser.
+
+    @keyword value: If absent or C{None}, no change is made; otherwise, this
+    enables (C{True}) or disables (C{False}) location tracking.
+    @type value: C{bool}
+
+    @return: C{True} iff parsers record locations."""
+    global _ParsingTracksLocations
+    if value is None:
+        return _ParsingTracksLocations
+    if not isinstance(value, bool):
+        raise TypeError(value)
+    _ParsingTracksLocations = value
+    return _ParsingTracksLocations
+
+_ParsingDefersConversion = False
+def DeferConversionWhenParsing (value=None):
+    """Query or set a flag that delays conversion of simple values in parsed
+    documents until they are used.
+
+    When set, SAX-based parsing holds the text of each simple-typed element
+    and attribute in place of its binding instance.  The text is converted
+    to the binding type, and checked against its constraining facets, on
+    first access through the binding; the result replaces the text.  The
+    structure of the document is validated as usual, but values that do not
+    satisfy their types raise L{BadTypeValueError} when used rather than
+    when parsed.  Elements with complex types or with C{xsi:nil} are not
+    deferred.  The value at the time a parser is created applies to that
+    parser.
+
+    @keyword value: If absent or C{None}, no change is made; otherwise, this
+    enables (C{True}) or disables (C{False}) deferred conversion.
+    @type value: C{bool}
+
+    @return: C{True} iff parsers defer conversion of simple values."""
+    global _ParsingDefersConversion
+    if value is None:
+        return _ParsingDefersConversion
+    if not isinstance(value, bool):
+        raise TypeError(value)
+    _ParsingDefersConversion = value
+    return _ParsingDefersConversion
+
 ## Local Variables:
 ## fill-column:78
 ## End:
@@ -20,6 +20,8 @@ import xml.dom
 import pyxb.utils.domutils as domutils
 import pyxb.utils.utility as utility
 import types
+import re
+import weakref
 import pyxb.namespace
 from pyxb.namespace.builtin import XMLSchema_instance as XSI
 
@@ -37,6 +39,8 @@ def ConfigureBindingStyle (style):
     CURRENT_BINDING_STYLE = style
 
 class _TypeBinding_mixin (utility.Locatable_mixin):
+    # Members are held in slots declared by complexTypeDefinition
+    __slots__ = ()
 
     @classmethod
     def _PerformValidation (cls):
@@ -247,6 +251,10 @@ class _TypeBinding_mixin (utility.Locatable_mixin):
         the string as a constructor argument to the this class.  This flag is
         set to C{False} when testing automaton transitions.
 
+        Which of these conversions applies depends only on the Python type of
+        the value, so it is determined once per value type and cached for the
+        class.
+
         @raise pyxb.BadTypeValueError: if the value is not both
         type-consistent and value-consistent with the element's type.
         """
@@ -259,6 +267,62 @@ class _TypeBinding_mixin (utility.Locatable_mixin):
             # @todo: Consider whether we should change the associated _element
             # of this value.  (**Consider** it, don't just do it.)
             return value
+        path = cls.__CompatibleValuePathCache.get((cls, type(value), convert_string_values))
+        if path is None:
+            path = cls.__CompatibleValuePath(value, convert_string_values)
+        if cls.__CVP_Construct == path:
+            return cls(value)
+        if isinstance(path, tuple):
+            # A union, with the member types that might accept the value
+            # in order, followed by the path to use if none do.
+            (member_types, path) = path
+            for mt in member_types:
+                try:
+                    return mt._CompatibleValue(value, **kw)
+                except Exception:
+                    pass
+        if cls.__CVP_Identity == path:
+            return value
+        if cls.__CVP_Bind == path:
+            return value.createInstance(cls.Factory, **kw)
+        value_type = type(value)
+        if str == value_type:
+            value_type = unicode
+        raise pyxb.BadTypeValueError('No conversion from %s to %s' % (value_type, cls))
+
+    # Conversion paths recorded by __CompatibleValuePath.  Downcasting a
+    # Python value, widening a numeric value, and parsing a string all
+    # use the value as a constructor argument.
+    __CVP_Identity = 'identity'
+    __CVP_Construct = 'construct'
+    __CVP_Bind = 'bind'
+    __CVP_Incompatible = 'incompatible'
+
+    # Map from triples (cls, value_type, convert_string_values) to the
+    # conversion path _CompatibleValue uses for values of that type.
+    __CompatibleValuePathCache = { }
+
+    @classmethod
+    def __CompatibleValuePath (cls, value, convert_string_values):
+        """Return the conversion path that L{_CompatibleValue} uses for values
+        of the same Python type as C{value}.
+
+        The path depends only on the type of the value, so it is computed
+        once per type and cached for the class.  For unions, the path is a
+        pair C{(member_types, path)} where C{member_types} are the member
+        types, in order, that are not type-incompatible with the value, and
+        C{path} is used when none of them accept it."""
+        key = (cls, type(value), convert_string_values)
+        path = cls.__CompatibleValuePathCache.get(key)
+        if path is None:
+            path = cls.__CompatibleValuePathCache[key] = cls.__ProbeCompatibleValuePath(value, convert_string_values)
+        return path
+
+    @classmethod
+    def __ProbeCompatibleValuePath (cls, value, convert_string_values):
+        # Already an instance?
+        if isinstance(value, cls):
+            return cls.__CVP_Identity
         value_type = type(value)
         # All string-based PyXB binding types use unicode, not str
         if str == value_type:
@@ -267,47 +331,49 @@ class _TypeBinding_mixin (utility.Locatable_mixin):
         # See if we got passed a Python value which needs to be "downcasted"
         # to the _TypeBinding_mixin version.
         if issubclass(cls, value_type):
-            return cls(value)
+            return cls.__CVP_Construct
 
         # See if we have a numeric type that needs to be cast across the
         # numeric hierarchy.  int to long is the *only* conversion we accept.
         if isinstance(value, int) and issubclass(cls, long):
-            return cls(value)
+            return cls.__CVP_Construct
 
         # Same, but for boolean, which Python won't let us subclass
         if isinstance(value, bool) and issubclass(cls, pyxb.binding.datatypes.boolean):
-            return cls(value)
+            return cls.__CVP_Construct
 
         # See if we have convert_string_values on, and have a string type that
         # somebody understands.
         if convert_string_values and (unicode == value_type):
-            return cls(value)
+            return cls.__CVP_Construct
 
-        # Maybe this is a union?
-        if issubclass(cls, STD_union):
-            for mt in cls._MemberTypes:
-                try:
-                    return mt._CompatibleValue(value, **kw)
-                except:
-                    pass
+        path = cls.__CVP_Incompatible
 
         # Any type is compatible with the corresponding ur-type
         if (pyxb.binding.datatypes.anySimpleType == cls) and issubclass(value_type, simpleTypeDefinition):
-            return value
-        if (pyxb.binding.datatypes.anyType == cls) and issubclass(value_type, complexTypeDefinition):
-            return value
+            path = cls.__CVP_Identity
+        elif (pyxb.binding.datatypes.anyType == cls) and issubclass(value_type, complexTypeDefinition):
+            path = cls.__CVP_Identity
 
         # Is this the wrapper class that indicates we should create a binding
         # from arguments?
-        if isinstance(value, pyxb.BIND):
-            return value.createInstance(cls.Factory, **kw)
+        elif isinstance(value, pyxb.BIND):
+            path = cls.__CVP_Bind
 
         # There may be other things that can be converted to the desired type,
         # but we can't tell that from the type hierarchy.  Too many of those
         # things result in an undesirable loss of information: for example,
         # when an all model supports both numeric and string transitions, the
         # candidate is a number, and the string transition is tested first.
-        raise pyxb.BadTypeValueError('No conversion from %s to %s' % (value_type, cls))
+
+        # Maybe this is a union?  Whether a member accepts the value can
+        # depend on the value, but members that can't accept its type need
+        # never be tried.
+        if issubclass(cls, STD_union):
+            member_types = tuple([ _mt for _mt in cls._MemberTypes if cls.__CVP_Incompatible != _mt.__CompatibleValuePath(value, convert_string_values) ])
+            if 0 < len(member_types):
+                path = (member_types, path)
+        return path
 
     @classmethod
     def _IsSimpleTypeContent (cls):
@@ -369,6 +435,30 @@ class _TypeBinding_mixin (utility.Locatable_mixin):
             dom = dom.documentElement
         return dom.toxml()
 
+    def writexml (self, output, root_only=False, encoding=None, **kw):
+        """Write the object as an XML document to a file-like object.
+
+        The document is written as the binding is traversed, without creating
+        a DOM instance, so large documents require less time and memory than
+        with L{toxml}.
+
+        @param output: The object to which the document is written
+        @type output: An object with a C{write} method
+        @keyword root_only: If C{True}, the XML declaration is omitted.
+        @keyword encoding: If C{None} (default), C{unicode} text is written;
+        otherwise the text is encoded with the named encoding.
+        @keyword bds: Optional L{pyxb.utils.domutils.BindingXMLWriter}
+        instance to use.  If not provided, one is created using C{output},
+        C{root_only}, C{encoding}, and any remaining keywords, which are those
+        accepted by L{pyxb.utils.domutils.BindingDOMSupport}.
+        @return: C{output}
+        """
+        bds = kw.pop('bds', None)
+        if bds is None:
+            bds = domutils.BindingXMLWriter(output, encoding=encoding, xml_declaration=not root_only, **kw)
+        self.toDOM(bds)
+        return output
+
     def _toDOM_csc (self, dom_support, parent):
         assert parent is not None
         if self.__xsiNil:
@@ -425,7 +515,9 @@ class _DynamicCreate_mixin (pyxb.cscRoot):
       raw.wsdl._SetSupersedingClass(mywsdl)
 
     """
-    
+
+    __slots__ = ()
+
     @classmethod
     def __SupersedingClassAttribute (cls):
         return '_%s__SupersedingClass' % (cls.__name__,)
@@ -804,9 +896,9 @@ class simpleTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixin
         super_fn = getattr(super(simpleTypeDefinition, cls), '_XsdConstraintsPreCheck_vb', lambda *a,**kw: value)
         return super_fn(value)
 
-    # Cache of pre-computed sequences of class facets in the order required
-    # for constraint validation
-    __ClassFacetSequence = { }
+    # Cache of functions that check values against the constraints on each
+    # class; see __CompileConstraints
+    __ClassConstraintValidator = { }
 
     @classmethod
     def XsdConstraintsOK (cls, value):
@@ -815,38 +907,81 @@ class simpleTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixin
         @raise pyxb.BadTypeValueError: if any constraint is violated.
         """
 
-        value = cls._XsdConstraintsPreCheck_vb(value)
-
-        facet_values = cls.__ClassFacetSequence.get(cls)
-        if facet_values is None:
-            # Constraints for simple type definitions are inherited.  Check them
-            # from least derived to most derived.
-            classes = [ _x for _x in cls.mro() if issubclass(_x, simpleTypeDefinition) ]
-            classes.reverse()
-            cache_result = True
-            facet_values = []
-            for clazz in classes:
-                # When setting up the datatypes, if we attempt to validate
-                # something before the facets have been initialized (e.g., a
-                # nonNegativeInteger used as a length facet for the parent
-                # integer datatype), just ignore that for now.  Don't cache
-                # the value, though, since a subsequent check after
-                # initialization should succceed.
-                try:
-                    clazz_facets = clazz._FacetMap().values()
-                except AttributeError, e:
-                    cache_result = False
-                    clazz_facets = []
-                for v in clazz_facets:
-                    if not (v in facet_values):
-                        facet_values.append(v)
+        validator = cls.__ClassConstraintValidator.get(cls)
+        if validator is None:
+            (validator, cache_result) = cls.__CompileConstraints()
             if cache_result:
-                cls.__ClassFacetSequence[cls] = facet_values
+                cls.__ClassConstraintValidator[cls] = validator
+        return validator(value)
+
+    @classmethod
+    def __ClassFacets (cls):
+        # Return the facets of the class in the order required for
+        # constraint validation, and whether that sequence is complete.
+        
+        # Constraints for simple type definitions are inherited.  Check them
+        # from least derived to most derived.
+        classes = [ _x for _x in cls.mro() if issubclass(_x, simpleTypeDefinition) ]
+        classes.reverse()
+        complete = True
+        facet_values = []
+        for clazz in classes:
+            # When setting up the datatypes, if we attempt to validate
+            # something before the facets have been initialized (e.g., a
+            # nonNegativeInteger used as a length facet for the parent
+            # integer datatype), just ignore that for now.  Don't cache
+            # the value, though, since a subsequent check after
+            # initialization should succceed.
+            try:
+                clazz_facets = clazz._FacetMap().values()
+            except AttributeError, e:
+                complete = False
+                clazz_facets = []
+            for v in clazz_facets:
+                if not (v in facet_values):
+                    facet_values.append(v)
+        return (facet_values, complete)
+
+    @classmethod
+    def __CompileConstraints (cls):
+        """Create a function that checks a value against the constraints on
+        this class, as L{XsdConstraintsOK} does.
+
+        Each facet provides a function specialized to its value and to this
+        class, or nothing if no instance of the class can violate it.
+
+        @return: C{( validator, complete )}, where C{complete} is C{False} if
+        the facets of some ancestor class have not yet been initialized"""
+        (facet_values, complete) = cls.__ClassFacets()
+        checks = []
         for f in facet_values:
-            if not f.validateConstraint(value):
-                raise pyxb.BadTypeValueError('%s violation for %s in %s' % (f.Name(), value, cls.__name__))
-            #print '%s ok for %s' % (f, value)
-        return value
+            fn = f._validatorFor(cls)
+            if fn is not None:
+                checks.append( (f, fn) )
+        precheck = cls._XsdConstraintsPreCheck_vb
+        if precheck.im_func is simpleTypeDefinition._XsdConstraintsPreCheck_vb.im_func:
+            # No subclass checks anything
+            precheck = None
+        class_name = cls.__name__
+        if 0 == len(checks):
+            if precheck is None:
+                return (lambda _value: _value, complete)
+            return (precheck, complete)
+        if (1 == len(checks)) and (precheck is None):
+            ( ( facet, fn ), ) = checks
+            def validator (value):
+                if not fn(value):
+                    raise pyxb.BadTypeValueError('%s violation for %s in %s' % (facet.Name(), value, class_name))
+                return value
+            return (validator, complete)
+        def validator (value):
+            if precheck is not None:
+                value = precheck(value)
+            for (facet, fn) in checks:
+                if not fn(value):
+                    raise pyxb.BadTypeValueError('%s violation for %s in %s' % (facet.Name(), value, class_name))
+            return value
+        return (validator, complete)
 
     def xsdConstraintsOK (self):
         """Validate the value of this instance against its constraints."""
@@ -898,7 +1033,7 @@ class simpleTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixin
 
     def _toDOM_csc (self, dom_support, parent):
         assert parent is not None
-        parent.appendChild(dom_support.document().createTextNode(self.xsdLiteral()))
+        dom_support.appendTextChild(self.xsdLiteral(), parent)
         return getattr(super(simpleTypeDefinition, self), '_toDOM_csc', lambda *_args,**_kw: dom_support)(dom_support, parent)
 
     @classmethod
@@ -1007,15 +1142,17 @@ class STD_union (simpleTypeDefinition):
         # NB: get, not pop: preserve it for the member type invocations
         validate_constraints = kw.get('_validate_constraints', cls._PerformValidation())
         assert isinstance(validate_constraints, bool)
+        member_types = cls._MemberTypes
         if 0 < len(args):
             arg = args[0]
+            member_types = cls._MemberTypesForValue(arg)
             try:
                 rv = cls._ValidatedMember(arg)
             except pyxb.BadTypeValueError, e:
                 pass
         if rv is None:
             kw['_validate_constraints'] = True
-            for mt in cls._MemberTypes:
+            for mt in member_types:
                 try:
                     rv = mt.Factory(*args, **kw)
                     break
@@ -1039,7 +1176,7 @@ class STD_union (simpleTypeDefinition):
         @raise pyxb.BadTypeValueError: the value is not an instance of a
         member type."""
         if not isinstance(value, cls._MemberTypes):
-            for mt in cls._MemberTypes:
+            for mt in cls._MemberTypesForValue(value):
                 try:
                     # Force validation so we get the correct type, otherwise
                     # first member will be accepted.
@@ -1050,6 +1187,65 @@ class STD_union (simpleTypeDefinition):
             raise pyxb.BadTypeValueError('%s cannot hold a member of type %s' % (cls.__name__, value.__class__.__name__))
         return value
 
+    # Lexical shapes of strings that numeric and boolean member types might
+    # accept.  These are deliberately no stricter than the Python conversions
+    # those types use.
+    __IntegerShape_re = re.compile(r'^\s*[-+]?\d+[lL]?\s*$', re.UNICODE)
+    __FloatShape_re = re.compile(r'^\s*[-+]?((\d+\.?\d*|\.\d+)(e[-+]?\d+)?|inf|infinity|nan)\s*$', re.UNICODE | re.IGNORECASE)
+    __ShapeInteger = 'integer'
+    __ShapeFloat = 'float'
+    __ShapeBoolean = 'boolean'
+    __ShapeOther = 'other'
+
+    @classmethod
+    def __LexicalShape (cls, text):
+        if cls.__IntegerShape_re.match(text):
+            return cls.__ShapeInteger
+        if cls.__FloatShape_re.match(text):
+            return cls.__ShapeFloat
+        if text.strip() in ('true', 'false'):
+            return cls.__ShapeBoolean
+        return cls.__ShapeOther
+
+    # Map from pairs (union class, lexical shape) to the member types of the
+    # union that might accept a string of that shape.
+    __MemberTypesForShapeCache = { }
+
+    @classmethod
+    def __MemberTypesForShape (cls, shape):
+        key = (cls, shape)
+        member_types = cls.__MemberTypesForShapeCache.get(key)
+        if member_types is None:
+            member_types = cls.__MemberTypesForShapeCache[key] = tuple([ _mt for _mt in cls._MemberTypes if cls.__MemberAcceptsShape(_mt, shape) ])
+        return member_types
+
+    @classmethod
+    def __MemberAcceptsShape (cls, member_type, shape):
+        if issubclass(member_type, STD_union):
+            return 0 < len(member_type.__MemberTypesForShape(shape))
+        if issubclass(member_type, pyxb.binding.datatypes.boolean):
+            return shape in (cls.__ShapeInteger, cls.__ShapeBoolean)
+        if issubclass(member_type, (pyxb.binding.datatypes.integer, pyxb.binding.datatypes.int)):
+            return cls.__ShapeInteger == shape
+        if issubclass(member_type, (pyxb.binding.datatypes.decimal, pyxb.binding.datatypes.float, pyxb.binding.datatypes.double)):
+            return shape in (cls.__ShapeInteger, cls.__ShapeFloat)
+        return True
+
+    @classmethod
+    def _MemberTypesForValue (cls, value):
+        """Return the member types that should be tried, in order, when
+        converting the given value to a member of this union.
+
+        For string values, members with numeric or boolean types whose
+        lexical space cannot include the value are omitted, so that parsing a
+        value normally costs a single member construction.  The members that
+        remain for each lexical shape (integer-like, float-like, boolean, or
+        anything else) are cached.  The order of C{_MemberTypes} is
+        preserved, so the member selected is the same as if all were tried."""
+        if not isinstance(value, basestring):
+            return cls._MemberTypes
+        return cls.__MemberTypesForShape(cls.__LexicalShape(value))
+
     def __init__ (self, *args, **kw):
         raise pyxb.LogicError('%s: cannot construct instances of union' % (self.__class__.__name__,))
 
@@ -1182,6 +1378,126 @@ class STD_list (simpleTypeDefinition, types.ListType):
     def remove (self, x):
         super(STD_list, self).remove(self._ValidatedItem(x))
 
+class _PluralValues (types.ListType):
+    """The list holding the values of a plural element within a
+    L{complexTypeDefinition} instance.
+
+    Changes made to the list in place are reported to the instance, so that
+    cached validation results are discarded; see
+    L{complexTypeDefinition._noteModified}."""
+
+    __slots__ = ( '__container', )
+
+    def __init__ (self, container, values=()):
+        super(_PluralValues, self).__init__(values)
+        self.__container = container
+
+    def __reduce__ (self):
+        return (_PluralValues, (self.__container, list(self)))
+
+    def __noteModified (self):
+        self.__container._noteModified()
+
+    def __setitem__ (self, key, value):
+        self.__noteModified()
+        super(_PluralValues, self).__setitem__(key, value)
+
+    def __delitem__ (self, key):
+        self.__noteModified()
+        super(_PluralValues, self).__delitem__(key)
+
+    def __setslice__ (self, start, end, values):
+        self.__noteModified()
+        super(_PluralValues, self).__setslice__(start, end, values)
+
+    def __delslice__ (self, start, end):
+        self.__noteModified()
+        super(_PluralValues, self).__delslice__(start, end)
+
+    def __iadd__ (self, values):
+        self.__noteModified()
+        return super(_PluralValues, self).__iadd__(values)
+
+    def __imul__ (self, count):
+        self.__noteModified()
+        return super(_PluralValues, self).__imul__(count)
+
+    # Standard mutable sequence methods, per Python Library Reference "Mutable Sequence Types"
+
+    def append (self, x):
+        self.__noteModified()
+        super(_PluralValues, self).append(x)
+
+    def extend (self, x):
+        self.__noteModified()
+        super(_PluralValues, self).extend(x)
+
+    def insert (self, i, x):
+        self.__noteModified()
+        super(_PluralValues, self).insert(i, x)
+
+    def pop (self, *args):
+        self.__noteModified()
+        return super(_PluralValues, self).pop(*args)
+
+    def remove (self, x):
+        self.__noteModified()
+        super(_PluralValues, self).remove(x)
+
+    def reverse (self):
+        self.__noteModified()
+        super(_PluralValues, self).reverse()
+
+    def sort (self, *args, **kw):
+        self.__noteModified()
+        super(_PluralValues, self).sort(*args, **kw)
+
+class _DeferredValue (pyxb.cscRoot):
+    """The text of a simple-typed element or attribute, held in place of its
+    binding instance until the value is first used.
+
+    Instances are created by the SAX parser when
+    L{pyxb.DeferConversionWhenParsing} is enabled, and replaced by the
+    result of L{materialize} when the containing binding is queried.  They
+    are never visible through the public binding interface."""
+
+    def __init__ (self, factory, args, kw=None, location=None, namespace_context=None):
+        """Record what is needed to create the binding instance.
+
+        @param factory: The callable that creates the binding instance
+        @param args: Positional parameters for C{factory}, normally the text
+        @keyword kw: Keyword parameters for C{factory}
+        @keyword location: The location to associate with the binding instance
+        @keyword namespace_context: The namespace context to associate with
+        the binding instance
+        """
+        self.__factory = factory
+        self.__args = args
+        self.__kw = kw or {}
+        self.__location = location
+        self.__namespaceContext = namespace_context
+
+    # Set to True when __value holds the binding instance
+    __materialized = False
+    __value = None
+
+    def materialize (self):
+        """Return the binding instance for the held text, creating it if
+        this has not already been done.
+
+        @raise pyxb.BadTypeValueError: the text does not satisfy the type
+        """
+        if not self.__materialized:
+            value = self.__factory(*self.__args, **self.__kw)
+            if (self.__location is not None) and isinstance(value, utility.Locatable_mixin):
+                value._setLocation(self.__location)
+            if self.__namespaceContext is not None:
+                value._setNamespaceContext(self.__namespaceContext)
+            self.__value = value
+            self.__materialized = True
+            self.__factory = self.__args = self.__kw = None
+        return self.__value
+
 class element (utility._DeconflictSymbols_mixin, _DynamicCreate_mixin):
     """Class that represents a schema element.
 
@@ -1336,6 +1652,10 @@ class element (utility._DeconflictSymbols_mixin, _DynamicCreate_mixin):
             return [ self.compatibleValue(_v) for _v in value ]
         if isinstance(value, _TypeBinding_mixin) and (value._element() is not None) and value._element().substitutesFor(self):
             return value
+        # Deferred values were associated with this element when parsed, and
+        # are checked when materialized.
+        if isinstance(value, _DeferredValue):
+            return value
         return self.typeDefinition()._CompatibleValue(value, **kw)
 
     # element
@@ -1521,6 +1841,67 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
     defines it.  Similarly, subclasses should define an _ElementMap variable.
     """
 
+    # Instance members are held in slots rather than in a per-instance
+    # dictionary; generated subclasses add slots for their element and
+    # attribute values.  Slots for members of the mix-in classes are
+    # declared here, since those classes are also bases of simple types
+    # derived from built-in types, which cannot have non-empty slots.  A
+    # slot has no class-level default, so initial values are assigned in
+    # __new__.
+    __SlotDefaults = ( ('_Locatable_mixin__location', None),
+                       ('_TypeBinding_mixin__namespaceContext', None),
+                       ('_TypeBinding_mixin__element', None),
+                       ('_TypeBinding_mixin__xsiNil', None),
+                       ('_TypeBinding_mixin__constructedWithValue', False),
+                       ('_complexTypeDefinition__wildcardAttributeMap', None),
+                       ('_complexTypeDefinition__wildcardElements', None),
+                       ('_complexTypeDefinition__content', None),
+                       ('_complexTypeDefinition__deferredUses', None),
+                       ('_complexTypeDefinition__modelState', None),
+                       ('_complexTypeDefinition__validatedOrder', None),
+                       ('_complexTypeDefinition__validatedBinding', False),
+                       ('_complexTypeDefinition__validatedSubtree', False),
+                       ('_complexTypeDefinition__containers', None),
+                       ('_complexTypeDefinition__xmlFragment', None) )
+    __slots__ = tuple(_sd[0] for _sd in __SlotDefaults) + ( '__weakref__', )
+
+    def __new__ (cls, *args, **kw):
+        self = super(complexTypeDefinition, cls).__new__(cls)
+        for (name, value) in cls.__SlotDefaults:
+            setattr(self, name, value)
+        return self
+
+    # Support pickling.  Without a __dict__, only pickle protocol 2 can
+    # save an instance unaided, so the state is the map from slot names
+    # (for every class in the hierarchy) to their values.  Slots holding
+    # attribute values that were not provided are left unset.  Values held
+    # for deferred conversion reference the parser's factory and namespace
+    # context, so they are materialized first.  References to containing
+    # instances are not saved, so neither is the record that the subtree
+    # has been validated.
+    def __getstate__ (self):
+        self.__materializeDeferredValues()
+        state = getattr(self, '__dict__', { }).copy()
+        for cls in type(self).mro():
+            for name in cls.__dict__.get('__slots__', ()):
+                if name in self.__UnpickledSlots:
+                    continue
+                try:
+                    state[name] = getattr(self, name)
+                except AttributeError:
+                    pass
+        return state
+
+    __UnpickledSlots = ( '__dict__', '__weakref__',
+                         '_complexTypeDefinition__validatedSubtree',
+                         '_complexTypeDefinition__containers' )
+
+    def __setstate__ (self, state):
+        for (name, value) in self.__SlotDefaults:
+            setattr(self, name, value)
+        for (name, value) in state.iteritems():
+            setattr(self, name, value)
+
     _CT_EMPTY = 'EMPTY'                 #<<< No content
     _CT_SIMPLE = 'SIMPLE'               #<<< Simple (character) content
     _CT_MIXED = 'MIXED'                 #<<< Children may be elements or other (e.g., character) content
@@ -1550,7 +1931,6 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
 
     # Per-instance map from tags to attribute values for wildcard attributes.
     # Value is C{None} if the type does not support wildcard attributes.
-    __wildcardAttributeMap = None
 
     def wildcardAttributeMap (self):
         """Obtain access to wildcard attributes.
@@ -1568,7 +1948,6 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
 
     # Per-instance list of DOM nodes interpreted as wildcard elements.
     # Value is None if the type does not support wildcard elements.
-    __wildcardElements = None
 
     def wildcardElements (self):
         """Obtain access to wildcard elements.
@@ -1736,20 +2115,172 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
         original element order is desired).  See L{__childrenForDOM} as an
         example of an alternative approach.
 
+        The result is reused by later calls until the instance is modified;
+        see L{_noteModified}.
+
         @return: C{None} or a list as described above.
         """
+        if self.__validatedOrderIsCurrent():
+            return self.__validatedOrder[0]
         if self._ContentTypeTag in (self._CT_EMPTY, self._CT_SIMPLE):
-            return []
-        
-        if  self._ContentModel is None:
-            raise pyxb.NoContentModel(self)
-        path = self._ContentModel.validate(self._symbolSet())
-        if path is not None:
+            sequence = []
+        else:
+            if  self._ContentModel is None:
+                raise pyxb.NoContentModel(self)
+            path = self._ContentModel.validate(self._symbolSet())
+            if path is None:
+                return None
             ( symbols, sequence ) = path
-            if 0 == len(symbols):
-                return sequence
-            raise pyxb.BindingValidationError('Ungenerated symbols: %s' % (symbols,) )
-        return None
+            if 0 != len(symbols):
+                raise pyxb.BindingValidationError('Ungenerated symbols: %s' % (symbols,) )
+        self.__validatedOrder = (sequence, self.__storedValueSnapshot())
+        return sequence
+
+    # Validation results are cached in __validatedOrder, which holds the
+    # sequence most recently returned by _validatedChildren along with a
+    # snapshot of the stored element values it was computed from, and
+    # __validatedBinding, which is True if _validateBinding_vx succeeded.
+    # Both are discarded when the instance is modified, as is any fragment
+    # recorded by _setXMLFragment.
+    #
+    # __validatedSubtree is True if _validateBinding_vx also succeeded for
+    # every complex member, recursively, and none of them has changed since.
+    # Validation stops at such an instance.  To keep the flag accurate, each
+    # complex member records weak references to the instances that hold it
+    # (in __containers) when they are validated, and modifying a member
+    # clears the flag in every instance above it.  The flag is only set for
+    # types where L{_FragmentCacheable} holds, since otherwise a member value
+    # could change without the instance noticing.
+
+    def _noteModified (self):
+        """Record that the content or attributes of this instance have
+        changed, so that cached validation results may not be reused.
+
+        This is invoked by L{content.ElementUse} and L{content.AttributeUse}
+        when a value is stored, by the list holding the values of a plural
+        element when it is changed, and by L{append} and L{reset}.  The
+        instances that contain this one are informed that their subtree has
+        changed."""
+        self.__validatedOrder = None
+        self.__validatedBinding = False
+        self.__xmlFragment = None
+        if self.__validatedSubtree:
+            self.__noteSubtreeModified()
+
+    def __noteSubtreeModified (self):
+        pending = [ self ]
+        while pending:
+            instance = pending.pop()
+            if not instance.__validatedSubtree:
+                continue
+            instance.__validatedSubtree = False
+            for ref in (instance.__containers or ()):
+                container = ref()
+                if container is not None:
+                    pending.append(container)
+
+    def __noteContainer (self, container):
+        # Record that container holds this instance as an element value.
+        ref = weakref.ref(container)
+        if self.__containers is None:
+            self.__containers = [ ref ]
+        elif ref not in self.__containers:
+            self.__containers = [ _r for _r in self.__containers if _r() is not None ]
+            self.__containers.append(ref)
+
+    def __validatedMembers (self, order):
+        # Record this instance as the container of each complex member, and
+        # return True iff the subtree of each has been validated.
+        rv = True
+        for (eu, value) in order:
+            if isinstance(value, complexTypeDefinition):
+                value.__noteContainer(self)
+                rv = rv and value.__validatedSubtree
+        return rv
+
+    def __storedValueSnapshot (self):
+        # Plural values and wildcard elements are held in lists that can be
+        # changed in place without passing through any binding method, so
+        # keep a copy of their members to detect such changes.
+        snapshot = []
+        for eu in self._ElementMap.values():
+            if eu.isPlural():
+                values = eu._storedValue(self)
+                snapshot.append( (values, tuple(values)) )
+        wce = self.__wildcardElements
+        if wce is not None:
+            snapshot.append( (wce, tuple(wce)) )
+        return snapshot
+
+    @classmethod
+    def __SnapshotIsCurrent (cls, snapshot):
+        for (values, saved) in snapshot:
+            if len(values) != len(saved):
+                return False
+            for (v, s) in zip(values, saved):
+                if v is not s:
+                    return False
+        return True
+
+    def __validatedOrderIsCurrent (self):
+        if self.__validatedOrder is None:
+            return False
+        return self.__SnapshotIsCurrent(self.__validatedOrder[1])
+
+    def _xmlFragment (self):
+        """Return the serialization most recently provided to
+        L{_setXMLFragment}, or C{None} if there is none or the instance has
+        been modified since it was provided.
+
+        The serialization is an opaque object maintained by
+        L{pyxb.utils.domutils.BindingXMLWriter}."""
+        if self.__xmlFragment is None:
+            return None
+        ( fragment, snapshot ) = self.__xmlFragment
+        if not self.__SnapshotIsCurrent(snapshot):
+            return None
+        return fragment
+
+    def _setXMLFragment (self, fragment):
+        """Record the serialization of this instance.
+
+        Nothing is recorded for types where a member value could change
+        without the instance noticing; see L{_FragmentCacheable}."""
+        if self._FragmentCacheable():
+            self.__xmlFragment = (fragment, self.__storedValueSnapshot())
+
+    @classmethod
+    def _FragmentCacheable (cls):
+        """Return C{True} iff the serialization of instances of this type
+        can be recorded for reuse, as can the fact that an instance and its
+        members have been validated.
+
+        This is not the case if the type permits wildcard elements, which
+        may be modifiable DOM nodes, or if an attribute, element, or simple
+        content value may be a list, which can be changed in place."""
+        rv = cls.__FragmentCacheableMap.get(cls)
+        if rv is None:
+            types = [ _au.dataType() for _au in cls._AttributeMap.values() ]
+            for eu in cls._ElementMap.values():
+                if eu.elementBinding() is not None:
+                    types.append(eu.elementBinding().typeDefinition())
+            if cls._CT_SIMPLE == cls._ContentTypeTag:
+                types.append(cls._TypeDefinition)
+            rv = not (cls._HasWildcardElement or [ _t for _t in types if cls.__MayBeList(_t) ])
+            cls.__FragmentCacheableMap[cls] = rv
+        return rv
+
+    # Map from complexTypeDefinition subclasses to the result of
+    # _FragmentCacheable
+    __FragmentCacheableMap = { }
+
+    @classmethod
+    def __MayBeList (cls, type_definition):
+        if issubclass(type_definition, STD_list):
+            return True
+        if issubclass(type_definition, STD_union):
+            return 0 < len([ _mt for _mt in (type_definition._MemberTypes or ()) if cls.__MayBeList(_mt) ])
+        return False
 
     def _symbolSet (self):
         """Return a map from L{content.ElementUse} instances to a list of
@@ -1768,7 +2299,7 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
         """
         rv = { }
         for eu in self._ElementMap.values():
-            value = eu.value(self)
+            value = eu._storedValue(self)
             if value is None:
                 continue
             res = None
@@ -1788,6 +2319,39 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
             au.validate(self)
 
     def _validateBinding_vx (self):
+        # Values not converted when the document was parsed are converted
+        # now, so that they are checked.
+        self.__materializeDeferredValues()
+        return self.__validateBinding(True)
+
+    def _validateParsedBinding (self):
+        """Check the binding as L{validateBinding} does, except that values
+        held as L{_DeferredValue} instances are not converted or checked.
+
+        This is used by the SAX parser when conversion is deferred (see
+        L{pyxb.DeferConversionWhenParsing}).  The values are checked when
+        they are first used, or when L{validateBinding} is invoked."""
+        if self._PerformValidation():
+            self.__validateBinding(False)
+        return True
+
+    def __validateBinding (self, materialize):
+        if self.__validatedSubtree:
+            return True
+        if self.__validatedBinding and self.__validatedOrderIsCurrent():
+            # Content and attributes are unchanged; only the members that
+            # are themselves mutable need to be examined again.
+            order = self.__validatedOrder[0]
+            for (eu, value) in order:
+                if isinstance(value, complexTypeDefinition) and value.__validatedSubtree:
+                    continue
+                if isinstance(value, complexTypeDefinition) and not materialize:
+                    value._validateParsedBinding()
+                elif isinstance(value, (complexTypeDefinition, STD_list)):
+                    value.validateBinding()
+            if materialize and self._FragmentCacheable():
+                self.__validatedSubtree = self.__validatedMembers(order)
+            return True
         if self._isNil():
             if (self._IsSimpleTypeContent() and (self.__content is not None)) or self.__content:
                 raise pyxb.ContentInNilElementError(self._ExpandedName)
@@ -1801,11 +2365,22 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
         if order is None:
             raise pyxb.BindingValidationError('Unable to match content to binding model')
         for (eu, value) in order:
-            if isinstance(value, _TypeBinding_mixin):
+            if isinstance(value, complexTypeDefinition) and value.__validatedSubtree:
+                continue
+            if isinstance(value, complexTypeDefinition) and not materialize:
+                value._validateParsedBinding()
+            elif isinstance(value, _TypeBinding_mixin):
                 value.validateBinding()
+            elif isinstance(value, _DeferredValue):
+                # Only present when materialize is False; checked when the
+                # value is used
+                pass
             elif eu is not None:
                 print 'WARNING: Cannot validate value %s in field %s' % (value, eu.id())
         self._validateAttributes()
+        self.__validatedBinding = True
+        if materialize and self._FragmentCacheable():
+            self.__validatedSubtree = self.__validatedMembers(order)
         return True
 
     @classmethod
@@ -1873,7 +2448,6 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
             raise pyxb.MissingContentError(self)
         return self.value().xsdConstraintsOK()
 
-    __content = None
     def content (self):
         """Return the content of the element.
 
@@ -1884,8 +2458,49 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
         """
         if self._ContentTypeTag in (self._CT_EMPTY, self._CT_SIMPLE):
             raise pyxb.NotComplexContentError(str(self._ExpandedName))
+        self.__materializeDeferredValues()
         return self.__content
 
+    @classmethod
+    def __materializedContent (cls, content):
+        if isinstance(content, _DeferredValue):
+            return content.materialize()
+        return content
+
+    def __materializeDeferredValues (self):
+        # Replace every value held as a _DeferredValue instance with its
+        # binding instance.  A value that cannot be converted raises an
+        # exception and remains deferred.
+        if not self.__deferredUses:
+            return
+        if self._ContentTypeTag in (self._CT_MIXED, self._CT_ELEMENT_ONLY):
+            self.__content[:] = [ self.__materializedContent(_c) for _c in self.__content ]
+        for use in list(self.__deferredUses):
+            use.value(self)
+            self.__deferredUses.discard(use)
+
+    # The element and attribute uses for which this instance may hold values
+    # that have not been materialized.  See L{pyxb.DeferConversionWhenParsing}.
+
+    def _noteDeferredValue (self, element_use):
+        """Record that a value held for the element or attribute use is a
+        L{_DeferredValue} instance."""
+        if self.__deferredUses is None:
+            self.__deferredUses = set()
+        self.__deferredUses.add(element_use)
+
+    def _hasDeferredValue (self, element_use):
+        """Return C{True} iff a value held for the element use may be a
+        L{_DeferredValue} instance."""
+        return (self.__deferredUses is not None) and (element_use in self.__deferredUses)
+
+    def _clearDeferredValue (self, element_use):
+        """Record that all values held for the element use have been
+        materialized."""
+        self.__deferredUses.discard(element_use)
+        # Materialized values have not been validated
+        self._noteModified()
+
     def value (self):
         """Return the value of the element.
 
@@ -1904,7 +2519,6 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
         else:
             self.__setContent(None)
 
-    __modelState = None
     def reset (self):
         """Reset the instance.
 
@@ -1913,6 +2527,7 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
         content model.
         """
         
+        self._noteModified()
         self._resetContent()
         for au in self._AttributeMap.values():
             au.reset(self)
@@ -1948,6 +2563,12 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
 
         @return: C{( element_binding, element_use )}
         """
+        class_cache = cls.__ElementBindingUseCache.get(cls)
+        if class_cache is None:
+            class_cache = cls.__ElementBindingUseCache.setdefault(cls, { })
+        rv = class_cache.get(element_name)
+        if rv is not None:
+            return rv
         element_use = cls._ElementMap.get(element_name)
         element_binding = None
         if element_use is None:
@@ -1959,7 +2580,16 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
                 element_use = element_binding.findSubstituendUse(cls)
         else:
             element_binding = element_use.elementBinding()
-        return (element_binding, element_use)
+        rv = (element_binding, element_use)
+        # Names that are not recognized may become resolvable when additional
+        # bindings are loaded, so only cache positive results.
+        if element_binding is not None:
+            class_cache[element_name] = rv
+        return rv
+
+    # Map from complexTypeDefinition subclasses to maps from element names to
+    # the results of _ElementBindingUseForName.
+    __ElementBindingUseCache = { }
         
     def append (self, value, element_use=None, maybe_element=True, _fallback_namespace=None, require_validation=True):
         """Add the value to the instance.
@@ -1972,6 +2602,7 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
         current state of the content model.
         """
         
+        self._noteModified()
         # @todo: Allow caller to provide default element use; it's available
         # in saxer.
         element_binding = None
@@ -2079,6 +2710,29 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
         self._addContent(value, element_binding)
         return self
 
+    def _appendTrusted (self, value, element_use=None, maybe_element=True):
+        """Add content from a document that is known to be valid.
+
+        Elements are stored directly in the slot for their use, without
+        conversion or consulting the content model; unrecognized elements
+        are stored as wildcards if the type permits them.  Simple content is
+        converted without checking constraining facets.  Other content is
+        added as with L{append} without validation.
+
+        @see: L{pyxb.TrustInputWhenParsing}
+        """
+        if maybe_element:
+            if element_use is not None:
+                element_use._setOrAppendTrusted(self, value)
+                return self
+            if (self.__wildcardElements is not None) and not isinstance(value, basestring):
+                self._noteModified()
+                self.__wildcardElements.append(value)
+                return self
+        elif self._IsSimpleTypeContent() and isinstance(value, basestring) and not self._isNil():
+            value = self._TypeDefinition.Factory(value, _validate_constraints=False)
+        return self.append(value, element_use, maybe_element, require_validation=False)
+
     def _appendWildcardElement (self, value):
         wcl = self.wildcardElements()
         if wcl is None:
@@ -2091,6 +2745,7 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
         return self
 
     def __setContent (self, value):
+        self._noteModified()
         self.__content = value
 
     def _addContent (self, child, element_binding):
@@ -2134,7 +2789,7 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
             pass
         elif self._CT_SIMPLE == self._ContentTypeTag:
             assert self.value() is not None, '%s has no value' % (self,)
-            element.appendChild(dom_support.document().createTextNode(self.value().xsdLiteral()))
+            dom_support.appendTextChild(self.value().xsdLiteral(), element)
         else:
             if pyxb._GenerationRequiresValid:
                 order = self._validatedChildren()
@@ -2146,7 +2801,7 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
                 assert v != self
                 if eu is None:
                     if isinstance(v, xml.dom.Node):
-                        element.appendChild(v)
+                        dom_support.appendChild(v, element)
                     else:
                         v.toDOM(dom_support, parent)
                 else:
@@ -32,6 +32,43 @@ import basis
 
 import xml.dom
 
+ENGINE_AUTOMATON = 'automaton'
+"""Validate content by stepping a L{ContentModelAutomaton} compiled once per
+content model.  This is the default."""
+
+ENGINE_PARTICLE_STATE = 'particleState'
+"""Validate content by walking a tree of L{ParticleState} instances created
+for each binding instance.  This is the original implementation, retained for
+comparison."""
+
+ENGINES = (ENGINE_AUTOMATON, ENGINE_PARTICLE_STATE)
+DEFAULT_ENGINE = ENGINE_AUTOMATON
+CURRENT_ENGINE = None
+
+_Engine_envvar = 'PYXB_CONTENT_ENGINE'
+
+def ConfigureContentModelEngine (engine=None):
+    """Select the mechanism used to validate element content while it is
+    being added to a binding instance.
+
+    The system default of L{ENGINE_AUTOMATON} can also be overridden at
+    runtime by setting the environment variable C{PYXB_CONTENT_ENGINE} to one
+    of the values in L{ENGINES}.  The selection applies to binding instances
+    created (or L{reset<basis.complexTypeDefinition.reset>}) after the call.
+
+    @param engine: One of L{ENGINES}.  If not provided, the system default is
+    used.
+    @return: the engine now in effect
+    """
+    global CURRENT_ENGINE
+    if engine is None:
+        import os
+        engine = os.environ.get(_Engine_envvar, DEFAULT_ENGINE)
+    if not (engine in ENGINES):
+        raise pyxb.LogicError('Unrecognized content model engine %s' % (engine,))
+    CURRENT_ENGINE = engine
+    return CURRENT_ENGINE
+
 class ContentState_mixin (pyxb.cscRoot):
     """Declares methods used by classes that hold state while validating a
     content model component."""
@@ -167,12 +204,12 @@ class AttributeUse (pyxb.cscRoot):
     """A helper class that encapsulates everything we need to know
     about the way an attribute is used within a binding class.
 
-    Attributes are stored internally as pairs C{(provided, value)}, where
-    C{provided} is a boolean indicating whether a value for the attribute was
-    provided externally, and C{value} is an instance of the attribute
-    datatype.  The C{provided} flag is used to determine whether an XML
-    attribute should be added to a created DOM node when generating the XML
-    corresponding to a binding instance.
+    An attribute value that was provided externally is stored internally as
+    an instance of the attribute datatype.  If no value was provided, nothing
+    is stored, and the value of the attribute is its default.  Whether a
+    value was provided is used to determine whether an XML attribute should
+    be added to a created DOM node when generating the XML corresponding to
+    a binding instance.
     """
 
     __name = None       # ExpandedName of the attribute
@@ -198,10 +235,10 @@ class AttributeUse (pyxb.cscRoot):
         attribute's inspector method.
         @type id: C{str}
 
-        @param key: The string used to store the attribute
-        value in the dictionary of the containing
-        L{pyxb.basis.binding.complexTypeDefinition}.  This is mangled so
-        that it is unique among and is treated as a Python private member.
+        @param key: The name of the member used to store the attribute
+        value in instances of the containing
+        L{pyxb.basis.binding.complexTypeDefinition}, normally a slot.  This
+        is mangled so that it is unique among the members of the class.
         @type key: C{str}
 
         @param data_type: The class reference to the subclass of
@@ -288,7 +325,7 @@ class AttributeUse (pyxb.cscRoot):
         return self.__id
 
     def key (self):
-        """String used as key within object dictionary when storing attribute value."""
+        """Name of the instance member used to store the attribute value."""
         return self.__key
 
     def dataType (self):
@@ -304,7 +341,16 @@ class AttributeUse (pyxb.cscRoot):
         C{value} is C{None} or an instance of the attribute's datatype.
 
         """
-        return getattr(ctd_instance, self.__key, (False, None))
+        value = getattr(ctd_instance, self.__key, self.__NotProvided)
+        if value is self.__NotProvided:
+            return (False, self.__defaultValue)
+        if isinstance(value, basis._DeferredValue):
+            value = value.materialize()
+            self.__setValue(ctd_instance, value, True)
+        return (True, value)
+
+    # Marker distinguishing an absent value from a stored value
+    __NotProvided = object()
 
     def __getProvided (self, ctd_instance):
         return self.__getValue(ctd_instance)[0]
@@ -314,7 +360,14 @@ class AttributeUse (pyxb.cscRoot):
         return self.__getValue(ctd_instance)[1]
 
     def __setValue (self, ctd_instance, new_value, provided):
-        return setattr(ctd_instance, self.__key, (provided, new_value))
+        ctd_instance._noteModified()
+        if provided:
+            return setattr(ctd_instance, self.__key, new_value)
+        # Values that were not provided are not stored
+        try:
+            delattr(ctd_instance, self.__key)
+        except AttributeError:
+            pass
 
     def reset (self, ctd_instance):
         """Set the value of the attribute in the given instance to be its
@@ -330,13 +383,21 @@ class AttributeUse (pyxb.cscRoot):
         return self
 
     def validate (self, ctd_instance):
-        (provided, value) = self.__getValue(ctd_instance)
+        # A deferred value is checked when it is materialized; the binding
+        # materializes them before validating unless it is being checked
+        # while parsing.
+        value = getattr(ctd_instance, self.__key, self.__NotProvided)
+        provided = value is not self.__NotProvided
+        if not provided:
+            value = self.__defaultValue
         if value is not None:
             if self.__prohibited:
                 raise pyxb.ProhibitedAttributeError('Value given for prohibited attribute %s' % (self.__name,))
             if self.__required and not provided:
                 assert self.__fixed
                 raise pyxb.MissingAttributeError('Fixed required attribute %s was never set' % (self.__name,))
+            if isinstance(value, basis._DeferredValue):
+                return True
             if not self.__dataType._IsValidValue(value):
                 raise pyxb.BindingValidationError('Attribute %s value type %s not %s' % (self.__name, type(value), self.__dataType))
             self.__dataType.XsdConstraintsOK(value)
@@ -376,6 +437,12 @@ class AttributeUse (pyxb.cscRoot):
             assert new_value is not None
         if self.__prohibited:
             raise pyxb.ProhibitedAttributeError('Value given for prohibited attribute %s' % (self.__name,))
+        if isinstance(new_value, basis._DeferredValue):
+            if not self.__fixed:
+                self.__setValue(ctd_instance, new_value, provided)
+                ctd_instance._noteDeferredValue(self)
+                return new_value
+            new_value = new_value.materialize()
         if (new_value is not None) and (not isinstance(new_value, self.__dataType)):
             new_value = self.__dataType.Factory(new_value)
         if self.__fixed and (new_value != self.__defaultValue):
@@ -504,12 +571,42 @@ class ElementUse (ContentState_mixin, ContentModel_mixin):
         return None
 
     def value (self, ctd_instance):
-        """Return the value for this use within the given instance."""
+        """Return the value for this use within the given instance.
+
+        Values held as L{basis._DeferredValue} instances are materialized
+        and replaced."""
+        value = getattr(ctd_instance, self.__key, self.defaultValue())
+        if ctd_instance._hasDeferredValue(self):
+            if self.__isPlural:
+                value[:] = [ self.__materialize(_v) for _v in value ]
+            else:
+                value = self.__materialize(value)
+                setattr(ctd_instance, self.__key, value)
+            ctd_instance._clearDeferredValue(self)
+        return value
+
+    def _storedValue (self, ctd_instance):
+        """Return the value for this use within the given instance, without
+        materializing any L{basis._DeferredValue} instances."""
         return getattr(ctd_instance, self.__key, self.defaultValue())
 
+    @classmethod
+    def __materialize (cls, value):
+        if isinstance(value, basis._DeferredValue):
+            return value.materialize()
+        return value
+
+    def __storableValue (self, ctd_instance, value):
+        # Plural values are held in a list that reports in-place changes to
+        # the instance.
+        if self.__isPlural:
+            return basis._PluralValues(ctd_instance, value)
+        return value
+
     def reset (self, ctd_instance):
         """Set the value for this use in the given element to its default."""
-        setattr(ctd_instance, self.__key, self.defaultValue())
+        ctd_instance._noteModified()
+        setattr(ctd_instance, self.__key, self.__storableValue(ctd_instance, self.defaultValue()))
         return self
 
     def set (self, ctd_instance, value):
@@ -519,7 +616,10 @@ class ElementUse (ContentState_mixin, ContentModel_mixin):
         assert self.__elementBinding is not None
         if basis._TypeBinding_mixin._PerformValidation:
             value = self.__elementBinding.compatibleValue(value, is_plural=self.isPlural())
-        setattr(ctd_instance, self.__key, value)
+        ctd_instance._noteModified()
+        setattr(ctd_instance, self.__key, self.__storableValue(ctd_instance, value))
+        if isinstance(value, basis._DeferredValue):
+            ctd_instance._noteDeferredValue(self)
         ctd_instance._addContent(value, self.__elementBinding)
         return self
 
@@ -530,16 +630,34 @@ class ElementUse (ContentState_mixin, ContentModel_mixin):
             return self.append(ctd_instance, value)
         return self.set(ctd_instance, value)
 
+    def _setOrAppendTrusted (self, ctd_instance, value):
+        """Store the value in the instance without conversion or validation.
+
+        This is used when parsing documents that are known to be valid; see
+        L{pyxb.TrustInputWhenParsing}."""
+        ctd_instance._noteModified()
+        if self.__isPlural:
+            self._storedValue(ctd_instance).append(value)
+        else:
+            setattr(ctd_instance, self.__key, value)
+        if isinstance(value, basis._DeferredValue):
+            ctd_instance._noteDeferredValue(self)
+        ctd_instance._addContent(value, self.__elementBinding)
+        return self
+
     def append (self, ctd_instance, value):
         """Add the given value as another instance of this element within the binding instance.
         @raise pyxb.StructuralBadDocumentError: invoked on an element use that is not plural
         """
         if not self.isPlural():
             raise pyxb.StructuralBadDocumentError('Cannot append to element with non-plural multiplicity')
-        values = self.value(ctd_instance)
+        values = self._storedValue(ctd_instance)
         if basis._TypeBinding_mixin._PerformValidation:
             value = self.__elementBinding.compatibleValue(value)
+        ctd_instance._noteModified()
         values.append(value)
+        if isinstance(value, basis._DeferredValue):
+            ctd_instance._noteDeferredValue(self)
         ctd_instance._addContent(value, self.__elementBinding)
         return values
 
@@ -554,6 +672,8 @@ class ElementUse (ContentState_mixin, ContentModel_mixin):
         element allows mixed content), or an instance of
         L{basis._TypeBinding_mixin}.
         """
+        if isinstance(value, basis._DeferredValue):
+            value = value.materialize()
         if isinstance(value, basis._TypeBinding_mixin):
             element_binding = self.__elementBinding
             if value._substitutesFor(element_binding):
@@ -561,7 +681,6 @@ class ElementUse (ContentState_mixin, ContentModel_mixin):
             assert element_binding is not None
             if element_binding.abstract():
                 raise pyxb.DOMGenerationError('Element %s is abstract but content %s not associated with substitution group member' % (self.name(), value))
-            element = dom_support.createChildElement(element_binding.name(), parent)
             elt_type = element_binding.typeDefinition()
             val_type = type(value)
             if isinstance(value, basis.complexTypeDefinition):
@@ -569,7 +688,12 @@ class ElementUse (ContentState_mixin, ContentModel_mixin):
             else:
                 if isinstance(value, basis.STD_union) and isinstance(value, elt_type._MemberTypes):
                     val_type = elt_type
-            if dom_support.requireXSIType() or elt_type._RequireXSIType(val_type):
+            need_xsi_type = dom_support.requireXSIType() or elt_type._RequireXSIType(val_type)
+            element = dom_support.createBindingElement(element_binding.name(), value, parent, need_xsi_type)
+            if element is None:
+                # A recorded serialization of the value was used
+                return
+            if need_xsi_type:
                 val_type_qname = value._ExpandedName.localName()
                 tns_prefix = dom_support.namespacePrefix(value._ExpandedName.namespace())
                 if tns_prefix is not None:
@@ -578,7 +702,7 @@ class ElementUse (ContentState_mixin, ContentModel_mixin):
             value._toDOM_csc(dom_support, element)
         elif isinstance(value, (str, unicode)):
             element = dom_support.createChildElement(self.name(), parent)
-            element.appendChild(dom_support.document().createTextNode(value))
+            dom_support.appendTextChild(value, element)
         else:
             raise pyxb.LogicError('toDOM with unrecognized value type %s: %s' % (type(value), value))
 
@@ -723,6 +847,12 @@ class Wildcard (ContentState_mixin, ContentModel_mixin):
         return self
 
     def accepts (self, particle_state, instance, value, element_use):
+        rv = self._accepts(instance, value, element_use)
+        if rv:
+            particle_state.incrementCount()
+        return rv
+
+    def _accepts (self, instance, value, element_use):
         if isinstance(value, xml.dom.Node):
             value_desc = 'value in %s' % (value.nodeName,)
         else:
@@ -733,7 +863,6 @@ class Wildcard (ContentState_mixin, ContentModel_mixin):
             print 'NOTE: Created unbound wildcard element from %s' % (value_desc,)
         assert isinstance(instance.wildcardElements(), list), 'Uninitialized wildcard list in %s' % (instance._ExpandedName,)
         instance._appendWildcardElement(value)
-        particle_state.incrementCount()
         return True
 
     def _validate (self, symbol_set, output_sequence):
@@ -993,6 +1122,340 @@ class ParticleState (pyxb.cscRoot):
         particle = self.__particle
         return 'ParticleState(%d:%d,%s:%s)@%x' % (self.__count, particle.minOccurs(), particle.maxOccurs(), particle.term(), id(self))
 
+class ContentModelAutomaton (pyxb.cscRoot):
+    """A deterministic finite automaton with counters that recognizes the
+    language described by a L{ParticleModel}.
+
+    The automaton is built using a Glushkov (position) construction.  Each
+    occurrence of an L{ElementUse} or L{Wildcard} term within the model is a
+    position; position zero is the initial state.  Repetition bounds are
+    enforced by counters associated with particles that have non-trivial
+    occurrence limits, rather than by unrolling the particle.  Transitions are
+    tuples C{( term, target, guards, updates )}:
+
+     - C{term} is the L{ElementUse} or L{Wildcard} at the target position
+     - C{target} is the index of the target position
+     - C{guards} is a tuple of C{( counter, lower, upper )} each of which
+       requires that C{lower <= counter < upper} (C{upper} may be C{None})
+     - C{updates} is a tuple of C{( counter, value )} applied in order when
+       the transition is taken; a C{value} of C{None} increments the counter
+
+    Because XML Schema requires that content models satisfy U{Unique Particle
+    Attribution<http://www.w3.org/TR/xmlschema-1/#cos-nonambig>}, at most one
+    transition can match a given element in a given configuration, so no
+    backtracking is necessary.
+    """
+
+    # The ElementUse or Wildcard instance for each position
+    __terms = None
+
+    # For each position, a map from ElementUse instances to the transitions
+    # that might accept values for that use
+    __useTransitions = None
+
+    # For each position, the transitions that might accept a value for an
+    # element use that does not appear in __useTransitions
+    __otherTransitions = None
+
+    # For each position, all transitions in model order
+    __allTransitions = None
+
+    # For each position, all transitions in model order, with the term
+    # replaced by the key used for its values in a symbol set
+    __symbolTransitions = None
+
+    # For each position, a list of alternative guard tuples any one of which
+    # allows the content to be complete at that position
+    __finalGuards = None
+
+    __counterCount = None
+
+    def counterCount (self):
+        """The number of counters required by a configuration of this automaton."""
+        return self.__counterCount
+
+    def __init__ (self, particle_model):
+        self.__terms = [ None ]
+        self.__counterCount = 0
+        follow = { }
+        (first, last, nullable) = self.__compileParticle(particle_model, follow)
+        follow[0] = [ (self.__terms[_p], _p, (), _u) for (_p, _u) in first ]
+        self.__finalGuards = [ [] for _p in self.__terms ]
+        if nullable:
+            self.__finalGuards[0].append(())
+        for (pos, guards) in last:
+            self.__finalGuards[pos].append(guards)
+        self.__useTransitions = []
+        self.__otherTransitions = []
+        self.__allTransitions = []
+        self.__symbolTransitions = []
+        for pos in xrange(len(self.__terms)):
+            transitions = tuple(follow.get(pos, ()))
+            wildcards = tuple([ _t for _t in transitions if isinstance(_t[0], Wildcard) ])
+            by_use = { }
+            for t in transitions:
+                if isinstance(t[0], ElementUse):
+                    by_use.setdefault(t[0], []).append(t)
+            for (eu, eu_transitions) in by_use.items():
+                by_use[eu] = tuple(eu_transitions) + wildcards
+            self.__useTransitions.append(by_use)
+            self.__otherTransitions.append(wildcards)
+            self.__allTransitions.append(transitions)
+            symbol_transitions = []
+            for (term, target, guards, updates) in transitions:
+                if isinstance(term, Wildcard):
+                    term = None
+                symbol_transitions.append( (term, target, guards, updates) )
+            self.__symbolTransitions.append(tuple(symbol_transitions))
+
+    def __newCounter (self):
+        self.__counterCount += 1
+        return self.__counterCount - 1
+
+    def __addFollow (self, follow, last, first):
+        for (lp, guards) in last:
+            transitions = follow.setdefault(lp, [])
+            for (fp, updates) in first:
+                transitions.append( (self.__terms[fp], fp, guards, updates) )
+
+    def __compileParticle (self, particle, follow, counter=None):
+        """Compile a particle.
+
+        @return: C{( first, last, nullable )} where C{first} is a list of
+        pairs C{( position, updates )} identifying positions that can begin
+        the particle along with the counter updates required to enter it;
+        C{last} is a list of pairs C{( position, guards )} identifying
+        positions that can end the particle along with the counter conditions
+        required to leave it; and C{nullable} is C{True} iff the particle can
+        be satisfied by empty content.
+
+        @param counter: The counter to be associated with the particle, if
+        one was allocated by the containing group.  Otherwise one is allocated
+        if the occurrence constraints require it."""
+        min_occurs = particle.minOccurs()
+        max_occurs = particle.maxOccurs()
+        if 0 == max_occurs:
+            return ([], [], True)
+        (first, last, nullable) = self.__compileTerm(particle.term(), follow)
+        repeats = (max_occurs is None) or (1 < max_occurs)
+        if (counter is None) and ((1 < min_occurs) or ((max_occurs is not None) and (1 < max_occurs))):
+            counter = self.__newCounter()
+        if repeats:
+            loop_guards = ()
+            loop_updates = ()
+            if counter is not None:
+                loop_updates = ( (counter, None), )
+                if max_occurs is not None:
+                    loop_guards = ( (counter, 0, max_occurs), )
+            loop_first = [ (_p, loop_updates + _u) for (_p, _u) in first ]
+            loop_last = [ (_p, _g + loop_guards) for (_p, _g) in last ]
+            self.__addFollow(follow, loop_last, loop_first)
+        if counter is not None:
+            first = [ (_p, ( (counter, 1), ) + _u) for (_p, _u) in first ]
+            if (1 < min_occurs) and not nullable:
+                last = [ (_p, _g + ( (counter, min_occurs, None), )) for (_p, _g) in last ]
+        return (first, last, nullable or (0 == min_occurs))
+
+    def __compileTerm (self, term, follow):
+        if isinstance(term, (ElementUse, Wildcard)):
+            self.__terms.append(term)
+            pos = len(self.__terms) - 1
+            return ([ (pos, ()) ], [ (pos, ()) ], False)
+        assert isinstance(term, _Group)
+        if isinstance(term, GroupAll):
+            return self.__compileAll(term, follow)
+        particles = [ self.__compileParticle(_p, follow) for _p in term.particles() ]
+        if isinstance(term, GroupChoice):
+            first = []
+            last = []
+            nullable = (0 == len(particles))
+            for (p_first, p_last, p_nullable) in particles:
+                first.extend(p_first)
+                last.extend(p_last)
+                nullable = nullable or p_nullable
+            return (first, last, nullable)
+        assert isinstance(term, GroupSequence)
+        first = []
+        last = []
+        nullable = True
+        # Walk the sequence, keeping track of the positions that can end the
+        # prefix processed so far.
+        for (p_first, p_last, p_nullable) in particles:
+            self.__addFollow(follow, last, p_first)
+            if nullable:
+                first.extend(p_first)
+            if p_nullable:
+                last = last + p_last
+            else:
+                last = p_last
+            nullable = nullable and p_nullable
+        return (first, last, nullable)
+
+    def __compileAll (self, group, follow):
+        # Each particle in an all group gets a counter, which is set to one
+        # on entry to the particle and cleared on entry to the group.  A
+        # particle may be entered from any other particle provided its counter
+        # shows it has not yet been seen, and the group may be left once every
+        # required particle has been seen.
+        counters = []
+        particles = []
+        for p in group.particles():
+            counter = self.__newCounter()
+            counters.append(counter)
+            particles.append(self.__compileParticle(p, follow, counter))
+        required = []
+        for i in xrange(len(particles)):
+            if not particles[i][2]:
+                required.append( (counters[i], 1, None) )
+        resets = tuple([ (_c, 0) for _c in counters ])
+        first = []
+        last = []
+        for i in xrange(len(particles)):
+            (p_first, p_last, p_nullable) = particles[i]
+            first.extend([ (_p, resets + _u) for (_p, _u) in p_first ])
+            others = tuple([ _g for _g in required if _g[0] != counters[i] ])
+            last.extend([ (_p, _g + others) for (_p, _g) in p_last ])
+            for j in xrange(len(particles)):
+                if i == j:
+                    continue
+                unseen = ( (counters[j], 0, 1), )
+                self.__addFollow(follow, [ (_p, _g + unseen) for (_p, _g) in p_last ], particles[j][0])
+        return (first, last, 0 == len(required))
+
+    def transitions (self, position, element_use):
+        """Return the transitions from the given position that might accept
+        a value for the given element use.
+
+        @param element_use: An L{ElementUse}, or C{None} if the use of the
+        value has not been determined.
+        """
+        if element_use is None:
+            return self.__allTransitions[position]
+        return self.__useTransitions[position].get(element_use, self.__otherTransitions[position])
+
+    def isFinal (self, position, counters):
+        """Return C{True} iff the content model is satisfied when the
+        automaton is in the given configuration."""
+        for guards in self.__finalGuards[position]:
+            if self._GuardsSatisfied(guards, counters):
+                return True
+        return False
+
+    def orderSymbols (self, symbol_set):
+        """Determine an order for the symbols that is consistent with the
+        content model.
+
+        This implements L{ParticleModel.validate} in a single pass over the
+        symbols: from each configuration the first transition in model order
+        for which a value remains is taken, so the cost is proportional to the
+        number of symbols.  Repetitions are extended greedily and no
+        backtracking is performed, so this may fail to find an order where
+        one exists; L{ParticleModel.validate} falls back to the backtracking
+        search in that case.
+
+        @param symbol_set: As with L{ParticleModel.validate}.  The lists of
+        values are not modified; keys are removed from the map, or their lists
+        replaced by the unused suffix, once the order has been determined.
+
+        @return: As with L{ParticleModel.validate}.  If C{None} is returned,
+        C{symbol_set} is unchanged.
+        """
+        counters = [ 0 ] * self.__counterCount
+        guards_satisfied = self._GuardsSatisfied
+        symbol_transitions = self.__symbolTransitions
+        used = dict.fromkeys(symbol_set.iterkeys(), 0)
+        output_sequence = []
+        position = 0
+        while True:
+            for (key, target, guards, updates) in symbol_transitions[position]:
+                values = symbol_set.get(key)
+                if values is None:
+                    continue
+                index = used[key]
+                if index >= len(values):
+                    continue
+                if guards and not guards_satisfied(guards, counters):
+                    continue
+                for (counter, new_value) in updates:
+                    if new_value is None:
+                        counters[counter] += 1
+                    else:
+                        counters[counter] = new_value
+                used[key] = index + 1
+                output_sequence.append( (key, values[index]) )
+                position = target
+                break
+            else:
+                break
+        if not self.isFinal(position, counters):
+            return None
+        for (key, index) in used.iteritems():
+            values = symbol_set[key]
+            if index >= len(values):
+                del symbol_set[key]
+            elif 0 < index:
+                symbol_set[key] = values[index:]
+        return (symbol_set, output_sequence)
+
+    @classmethod
+    def _GuardsSatisfied (cls, guards, counters):
+        for (counter, lower, upper) in guards:
+            value = counters[counter]
+            if value < lower:
+                return False
+            if (upper is not None) and (value >= upper):
+                return False
+        return True
+
+class AutomatonState (pyxb.cscRoot):
+    """The configuration of a L{ContentModelAutomaton} while validating the
+    content of a specific binding instance.
+
+    This provides the same L{step} and L{verifyComplete} interface as
+    L{ParticleState}."""
+
+    def __init__ (self, automaton):
+        self.__automaton = automaton
+        self.__position = 0
+        self.__counters = [ 0 ] * automaton.counterCount()
+
+    def step (self, instance, value, element_use):
+        """Attempt to apply the value as the next transition of the automaton.
+
+        See L{ParticleState.step} for parameter descriptions.
+
+        @return: C{( consumed, underflow_exc )}.  C{underflow_exc} is always
+        C{None}.
+
+        @raise pyxb.UnrecognizedContentError: the value cannot be accepted,
+        and the content accumulated so far does not satisfy the content model.
+        """
+        counters = self.__counters
+        guards_satisfied = ContentModelAutomaton._GuardsSatisfied
+        for (term, target, guards, updates) in self.__automaton.transitions(self.__position, element_use):
+            if guards and not guards_satisfied(guards, counters):
+                continue
+            if not term._accepts(instance, value, element_use):
+                continue
+            for (counter, new_value) in updates:
+                if new_value is None:
+                    counters[counter] += 1
+                else:
+                    counters[counter] = new_value
+            self.__position = target
+            return (True, None)
+        if not self.__automaton.isFinal(self.__position, counters):
+            raise pyxb.UnrecognizedContentError(value, element_use=element_use)
+        return (False, None)
+
+    def verifyComplete (self):
+        """Verify that the content accepted so far satisfies the content model.
+
+        @raise pyxb.MissingContentError: additional content is required
+        """
+        if not self.__automaton.isFinal(self.__position, self.__counters):
+            raise pyxb.MissingContentError('incomplete')
+
 class ParticleModel (ContentModel_mixin):
     """Content model dealing with particles: terms with occurrence restrictions"""
 
@@ -1020,8 +1483,21 @@ class ParticleModel (ContentModel_mixin):
         self.__minOccurs = min_occurs
         self.__maxOccurs = max_occurs
 
+    def automaton (self):
+        """Return the L{ContentModelAutomaton} that recognizes this particle.
+
+        The automaton is compiled on first use and cached."""
+        if self.__automaton is None:
+            self.__automaton = ContentModelAutomaton(self)
+        return self.__automaton
+    __automaton = None
+
     def newState (self):
-        return ParticleState(self)
+        """Return the state used to validate content as it is added to a
+        binding instance, as determined by L{CURRENT_ENGINE}."""
+        if ENGINE_PARTICLE_STATE == CURRENT_ENGINE:
+            return ParticleState(self)
+        return AutomatonState(self.automaton())
 
     def validate (self, symbol_set):
         """Determine whether the particle requirements are satisfiable by the
@@ -1046,7 +1522,14 @@ class ParticleModel (ContentModel_mixin):
         C{eu} is an L{ElementUse} from the set of symbol keys, and C{val} is a
         value from the corresponding list.
         """
-        
+
+        if ENGINE_PARTICLE_STATE != CURRENT_ENGINE:
+            # The automaton finds the order in a single greedy pass, which
+            # succeeds for most content.  When it fails, fall back to the
+            # search below, which backtracks.
+            result = self.automaton().orderSymbols(symbol_set)
+            if result is not None:
+                return result
         output_sequence = []
         #print 'Start: %d %s %s : %s' % (self.__minOccurs, self.__maxOccurs, self.__term, symbol_set)
         result = self._validate(symbol_set, output_sequence)
@@ -1129,7 +1612,9 @@ class GroupAll (_Group):
 
 class GroupSequence (_Group):
     _StateClass = SequenceState
-        
+
+ConfigureContentModelEngine()
+
 ## Local Variables:
 ## fill-column:78
 ## End:
@@ -1070,6 +1070,7 @@ class anyType (basis.complexTypeDefinition):
     _Abstract = False
     _HasWildcardElement = True
     _AttributeWildcard = content.Wildcard(namespace_constraint=content.Wildcard.NC_any, process_contents=content.Wildcard.PC_lax)
+    __slots__ = ()
 
     # Generate from tests/schemas/anyType.xsd
     __Wildcard = content.Wildcard(process_contents=content.Wildcard.PC_lax, namespace_constraint=content.Wildcard.NC_any)
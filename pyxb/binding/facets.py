@@ -193,6 +193,19 @@ class ConstrainingFacet (Facet):
         The actual test is delegated to the subclasses."""
         return self._validateConstraint_vx(value)
 
+    def _validatorFor (self, value_type):
+        """Return a function equivalent to L{validateConstraint} for
+        values of the given type.
+
+        Subclasses override this to return a function specialized to the
+        facet value, or C{None} if no value of the type can violate the
+        constraint.  The facet value should not change after this is
+        invoked.
+
+        @param value_type: The class to which the facet applies
+        @type value_type: subclass of L{pyxb.binding.basis.simpleTypeDefinition}"""
+        return self._validateConstraint_vx
+
     def __setFromKeywords(self, **kw):
         kwv = kw.get('value', None)
         if kwv is not None:
@@ -338,6 +351,15 @@ class CF_length (ConstrainingFacet, _Fixed_mixin):
         value_length = value.xsdValueLength()
         return (value_length is None) or (self.value() is None) or (value_length == self.value())
 
+    def _validatorFor (self, value_type):
+        length = self.value()
+        if length is None:
+            return None
+        def validator (value):
+            value_length = value.xsdValueLength()
+            return (value_length is None) or (value_length == length)
+        return validator
+
 class CF_minLength (ConstrainingFacet, _Fixed_mixin):
     """A facet that constrains the length of the lexical representation of a value.
     
@@ -350,6 +372,15 @@ class CF_minLength (ConstrainingFacet, _Fixed_mixin):
         value_length = value.xsdValueLength()
         return (value_length is None) or (self.value() is None) or (value_length >= self.value())
 
+    def _validatorFor (self, value_type):
+        min_length = self.value()
+        if not min_length:
+            return None
+        def validator (value):
+            value_length = value.xsdValueLength()
+            return (value_length is None) or (value_length >= min_length)
+        return validator
+
 class CF_maxLength (ConstrainingFacet, _Fixed_mixin):
     """A facet that constrains the length of the lexical representation of a value.
     
@@ -362,6 +393,15 @@ class CF_maxLength (ConstrainingFacet, _Fixed_mixin):
         value_length = value.xsdValueLength()
         return (value_length is None) or (self.value() is None) or (value_length <= self.value())
 
+    def _validatorFor (self, value_type):
+        max_length = self.value()
+        if max_length is None:
+            return None
+        def validator (value):
+            value_length = value.xsdValueLength()
+            return (value_length is None) or (value_length <= max_length)
+        return validator
+
 import pyxb.utils.xmlre
 
 class _PatternElement (utility.PrivateTransient_mixin):
@@ -396,12 +436,42 @@ class _PatternElement (utility.PrivateTransient_mixin):
 
     def __str__ (self): return self.pattern
 
+    def pythonExpression (self):
+        """The Python regular expression equivalent to the pattern, as
+        produced by L{pyxb.utils.xmlre.XMLToPython}."""
+        return self.__pythonExpression
+
+    def _anchoredBody (self):
+        """The Python expression for the pattern as a group that can be
+        combined with others.
+
+        The anchors added by L{pyxb.utils.xmlre.XMLToPython} are removed,
+        since C{$} also matches before a trailing newline."""
+        assert self.__pythonExpression.startswith('^') and self.__pythonExpression.endswith('$')
+        return '(?:%s)' % (self.__pythonExpression[1:-1],)
+
+    # Map from Python regular expressions to their compiled form, shared by
+    # all pattern facets
+    __CompiledExpressions = { }
+
+    @classmethod
+    def _CompiledExpression (cls, anchored_bodies):
+        """Return a compiled regular expression that matches a complete
+        string that matches any of the given expressions.
+
+        @param anchored_bodies: a sequence of values from L{_anchoredBody}"""
+        expression = '^(?:%s)\Z' % ('|'.join(anchored_bodies),)
+        rv = cls.__CompiledExpressions.get(expression)
+        if rv is None:
+            rv = cls.__CompiledExpressions[expression] = re.compile(expression)
+        return rv
+
     def matches (self, text):
         if self.__compiledExpression is None:
-            self.__compiledExpression = re.compile(self.__pythonExpression)
+            self.__compiledExpression = self._CompiledExpression([ self._anchoredBody() ])
         return self.__compiledExpression.match(text)
 
-class CF_pattern (ConstrainingFacet, _CollectionFacet_mixin):
+class CF_pattern (ConstrainingFacet, _CollectionFacet_mixin, utility.PrivateTransient_mixin):
     """A facet that constrains the lexical representation of a value
     to match one of a set of patterns.
 
@@ -421,9 +491,17 @@ class CF_pattern (ConstrainingFacet, _CollectionFacet_mixin):
     _CollectionFacet_itemType = _PatternElement
     _ValueDatatype = datatypes.string
 
+    # The compiled expression is transient for the same reason as that of
+    # _PatternElement.
+    __PrivateTransient = set()
+
     __patternElements = None
     def patternElements (self): return self.__patternElements
 
+    # The match method of an expression that matches any of the patterns
+    __match = None
+    __PrivateTransient.add('match')
+
     def __init__ (self, **kw):
         super(CF_pattern, self).__init__(**kw)
         self.__patternElements = []
@@ -431,8 +509,28 @@ class CF_pattern (ConstrainingFacet, _CollectionFacet_mixin):
     def addPattern (self, **kw):
         pattern = self._CollectionFacet_itemType(**kw)
         self.__patternElements.append(pattern)
+        self.__match = None
         return pattern
 
+    def __matcher (self):
+        # Return a function that returns a true value iff a string matches
+        # one of the patterns.  All patterns are normally combined into a
+        # single expression.
+        if self.__match is None:
+            try:
+                self.__match = _PatternElement._CompiledExpression([ _pe._anchoredBody() for _pe in self.__patternElements ]).match
+            except (re.error, AssertionError):
+                # Python limits the number of groups in an expression; if
+                # the combination exceeds that, match each pattern in turn.
+                pattern_elements = self.__patternElements
+                def match (value):
+                    for pe in pattern_elements:
+                        if pe.matches(value):
+                            return True
+                    return False
+                self.__match = match
+        return self.__match
+
     def _validateConstraint_vx (self, value):
         # If validation is inhibited, or if the facet hasn't had any
         # restrictions applied yet, return True.
@@ -440,10 +538,18 @@ class CF_pattern (ConstrainingFacet, _CollectionFacet_mixin):
             return True
         if not isinstance(value, basestring):
             return True
-        for pe in self.__patternElements:
-            if pe.matches(value):
-                return True
-        return False
+        return bool(self.__matcher()(value))
+
+    def _validatorFor (self, value_type):
+        if 0 == len(self.__patternElements):
+            return None
+        if issubclass(value_type, basestring):
+            # The match object, or None, serves as the result
+            return self.__matcher()
+        # The value of a union may be a string even though the union is not
+        if issubclass(value_type, basis.STD_union):
+            return self._validateConstraint_vx
+        return None
 
 class _EnumerationElement (object):
     """This class represents individual values that appear within a
@@ -567,20 +673,27 @@ class CF_enumeration (ConstrainingFacet, _CollectionFacet_mixin, _LateDatatype_m
             raise pyxb.IncompleteImplementationError('Duplicate enumeration tags')
         self.__tagToElement[ee.tag()] = ee
         self.__unicodeToElement[ee.unicodeValue()] = ee
-        value = ee.value()
-        # Not just issubclass(self.valueDatatype(), basis.STD_list);
-        # this may be a union with one of those as a member type.
-        if isinstance(value, list):
-            value = ' '.join([ _v.xsdLiteral() for _v in value ])
+        value = self.__ValueKey(ee.value())
         self.__valueToElement[value] = ee
+        self.__keyTypeSet = None
         self.__elements.append(ee)
         return value
 
+    @classmethod
+    def __ValueKey (cls, value):
+        # Return the key used for the value in __valueToElement.  List
+        # values are not hashable, so their literal representation is used.
+        # Not just issubclass(self.valueDatatype(), basis.STD_list); this
+        # may be a union with one of those as a member type.
+        if isinstance(value, list):
+            return ' '.join([ _v.xsdLiteral() for _v in value ])
+        return value
+
     def elementForValue (self, value):
         """Return the L{_EnumerationElement} instance that has the given value.
 
         @raise KeyError: the value is not valid for the enumeration."""
-        return self.__valueToElement[value]
+        return self.__valueToElement[self.__ValueKey(value)]
 
     def valueForUnicode (self, ustr):
         """Return the enumeration value corresponding to the given unicode string.
@@ -596,11 +709,35 @@ class CF_enumeration (ConstrainingFacet, _CollectionFacet_mixin, _LateDatatype_m
         # restrictions applied yet, return True.
         if 0 == len(self.__elements):
             return True
+        try:
+            if self.__ValueKey(value) in self.__valueToElement:
+                return True
+            # A value of a different type may be equal to an enumeration
+            # value without having the same hash; otherwise, the value is
+            # not in the enumeration.
+            if isinstance(value, list) or isinstance(value, self.__keyTypes()):
+                return False
+        except (TypeError, AttributeError):
+            # Unhashable, or a list with members that are not bindings
+            pass
         for ee in self.__elements:
             if ee.value() == value:
                 return True
         return False
 
+    def __keyTypes (self):
+        # The types of the keys in __valueToElement.  A value of one of these
+        # types is equal to a key only if it has the same hash.
+        if self.__keyTypeSet is None:
+            self.__keyTypeSet = tuple(set([ type(_k) for _k in self.__valueToElement.keys() ]))
+        return self.__keyTypeSet
+    __keyTypeSet = None
+
+    def _validatorFor (self, value_type):
+        if 0 == len(self.__elements):
+            return None
+        return self._validateConstraint_vx
+
 class _Enumeration_mixin (pyxb.cscRoot):
     """Marker class to indicate that the generated binding has enumeration members."""
     @classmethod
@@ -645,6 +782,9 @@ class CF_whiteSpace (ConstrainingFacet, _Fixed_mixin):
         """No validation rules for whitespace facet."""
         return True
 
+    def _validatorFor (self, value_type):
+        return None
+
 class CF_minInclusive (ConstrainingFacet, _Fixed_mixin, _LateDatatype_mixin):
     """Specify the minimum legal value for the constrained type.
 
@@ -656,6 +796,12 @@ class CF_minInclusive (ConstrainingFacet, _Fixed_mixin, _LateDatatype_mixin):
     def _validateConstraint_vx (self, value):
         return (self.value() is None) or (self.value() <= value)
 
+    def _validatorFor (self, value_type):
+        bound = self.value()
+        if bound is None:
+            return None
+        return lambda _value: bound <= _value
+
 
 class CF_maxInclusive (ConstrainingFacet, _Fixed_mixin, _LateDatatype_mixin):
     """Specify the maximum legal value for the constrained type.
@@ -668,6 +814,12 @@ class CF_maxInclusive (ConstrainingFacet, _Fixed_mixin, _LateDatatype_mixin):
     def _validateConstraint_vx (self, value):
         return (self.value() is None) or (self.value() >= value)
 
+    def _validatorFor (self, value_type):
+        bound = self.value()
+        if bound is None:
+            return None
+        return lambda _value: bound >= _value
+
 class CF_minExclusive (ConstrainingFacet, _Fixed_mixin, _LateDatatype_mixin):
     """Specify the exclusive lower bound of legal values for the constrained type.
 
@@ -679,6 +831,12 @@ class CF_minExclusive (ConstrainingFacet, _Fixed_mixin, _LateDatatype_mixin):
     def _validateConstraint_vx (self, value):
         return (self.value() is None) or (self.value() < value)
 
+    def _validatorFor (self, value_type):
+        bound = self.value()
+        if bound is None:
+            return None
+        return lambda _value: bound < _value
+
 class CF_maxExclusive (ConstrainingFacet, _Fixed_mixin, _LateDatatype_mixin):
     """Specify the exclusive upper bound of legal values for the constrained type.
 
@@ -690,6 +848,12 @@ class CF_maxExclusive (ConstrainingFacet, _Fixed_mixin, _LateDatatype_mixin):
     def _validateConstraint_vx (self, value):
         return (self.value() is None) or (self.value() > value)
 
+    def _validatorFor (self, value_type):
+        bound = self.value()
+        if bound is None:
+            return None
+        return lambda _value: bound > _value
+
 class CF_totalDigits (ConstrainingFacet, _Fixed_mixin):
     """Specify the number of digits in the *value* space of the type.
 
@@ -717,6 +881,11 @@ class CF_totalDigits (ConstrainingFacet, _Fixed_mixin):
             scale *= 10
         return match and (v is not None) and (abs(v) < scale)
 
+    def _validatorFor (self, value_type):
+        if self.value() is None:
+            return None
+        return self._validateConstraint_vx
+
 class CF_fractionDigits (ConstrainingFacet, _Fixed_mixin):
     """Specify the number of sub-unit digits in the *value* space of the type.
 
@@ -737,6 +906,11 @@ class CF_fractionDigits (ConstrainingFacet, _Fixed_mixin):
             scale *= 10
         return False
 
+    def _validatorFor (self, value_type):
+        if self.value() is None:
+            return None
+        return self._validateConstraint_vx
+
 class FundamentalFacet (Facet):
     """A fundamental facet provides information on the value space of the associated type."""
     
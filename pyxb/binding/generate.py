@@ -37,10 +37,17 @@ import traceback
 import xml.dom
 import os.path
 import StringIO
+import cPickle as pickle
+
+try:
+    import multiprocessing
+except ImportError:
+    # Python before 2.6; binding modules are always rendered serially
+    multiprocessing = None
 
 # Initialize UniqueInBinding with the public identifiers we generate,
 # import, or otherwise can't have mucked about with.
-UniqueInBinding = set([ 'pyxb', 'sys', 'Namespace', 'ModuleRecord', 'CreateFromDocument', 'CreateFromDOM' ])
+UniqueInBinding = set([ 'pyxb', 'sys', 'Namespace', 'ModuleRecord', 'CreateFromDocument', 'CreateFromDOM', 'IterCreateFromStream', 'CreateFeedParser' ])
 
 def PrefixModule (value, text=None):
     if text is None:
@@ -571,6 +578,7 @@ class %{ctd} (%{superclass}):
     _ContentTypeTag = pyxb.binding.basis.complexTypeDefinition._CT_%{contentTypeTag}
     _Abstract = %{is_abstract}
     _ExpandedName = %{expanded_name}
+    __slots__ = %{slots}
 '''
 
     # Complex types that inherit from non-ur-type complex types should
@@ -596,6 +604,10 @@ class %{ctd} (%{superclass}):
     element_name_map = { }
     element_uses = []
 
+    # Instance members holding the values of elements and attributes
+    # declared in this type
+    slots = []
+
     definitions = []
 
     definitions.append('# Base type is %{base_type}')
@@ -616,6 +628,7 @@ class %{ctd} (%{superclass}):
                 aux_init = []
                 ef_map['is_plural'] = repr(is_plural)
                 element_uses.append(templates.replaceInText('%{use}.name() : %{use}', **ef_map))
+                slots.append(ef_map['key'])
                 if 0 == len(aux_init):
                     ef_map['aux_init'] = ''
                 else:
@@ -703,6 +716,8 @@ class %{ctd} (%{superclass}):
             au_map = aur.attributeDeclaration()._templateMap().copy()
             definitions.append(templates.replaceInText('''
     # Attribute %{id} is restricted from parent''', **au_map))
+        else:
+            slots.append(au_map['key'])
 
         assert ad.typeDefinition() is not None
         au_map['attr_type'] = binding_module.literal(ad.typeDefinition(), **kw)
@@ -773,6 +788,7 @@ class %{ctd} (%{superclass}):
         definitions.append('_AttributeWildcard = %s' % (binding_module.literal(ctd.attributeWildcard(), **kw),))
     if ctd.hasWildcardElement():
         definitions.append('_HasWildcardElement = True')
+    template_map['slots'] = repr(tuple(slots))
     template_map['attribute_uses'] = ",\n        ".join(attribute_uses)
     template_map['element_uses'] = ",\n        ".join(element_uses)
     if inherits_from_base:
@@ -878,7 +894,7 @@ def _SetNameWithAccessors (component, container, is_plural, binding_module, nsm,
     assert component.nameInBinding() is None, 'Use %s but binding name %s for %s' % (use_map['use'], component.nameInBinding(), component.expandedName())
     component.setNameInBinding(use_map['use'])
     key_name = '%s_%s_%s' % (str(nsm.namespace()), container.nameInBinding(), component.expandedName())
-    use_map['key'] = utility.PrepareIdentifier(key_name, class_unique, private=True)
+    use_map['key'] = utility.PrepareIdentifier(key_name, class_unique, protected=True)
     use_map['name'] = unicode(component.expandedName())
     if isinstance(component, xs.structures.ElementDeclaration) and is_plural:
         use_map['appender'] = utility.PrepareIdentifier('add' + unique_name[0].upper() + unique_name[1:], class_unique)
@@ -1008,6 +1024,8 @@ class _ModuleNaming_mixin (object):
         return str(id(self))
 
     def moduleContents (self):
+        if self.__moduleContents is not None:
+            return self.__moduleContents
         template_map = {}
         aux_imports = []
         for ns in self.__importedModules:
@@ -1023,6 +1041,12 @@ class _ModuleNaming_mixin (object):
         self._finalizeModuleContents_vx(template_map)
         return self.__bindingIO.contents()
 
+    def _setModuleContents (self, module_contents):
+        """Record the contents of the module, as rendered by another
+        process.  L{moduleContents} will return this text."""
+        self.__moduleContents = module_contents
+    __moduleContents = None
+
     def modulePath (self):
         return self.__modulePath
     def _setModulePath (self, path_data):
@@ -1041,6 +1065,9 @@ class _ModuleNaming_mixin (object):
     def bindingFile (self):
         return self.__bindingFile
     __bindingFile = None
+
+    def bindingFilePath (self):
+        return self.__bindingFilePath
     __bindingFilePath = None
 
     def _initializeUniqueInModule (self, unique_in_module):
@@ -1219,7 +1246,7 @@ class NamespaceModule (_ModuleNaming_mixin):
     __namespaceGroupModule = None
 
     _UniqueInModule = _ModuleNaming_mixin._UniqueInModule.copy()
-    _UniqueInModule.update([ 'Namespace', 'CreateFromDOM', 'CreateFromDocument' ])
+    _UniqueInModule.update([ 'Namespace', 'CreateFromDOM', 'CreateFromDocument', 'IterCreateFromStream', 'CreateFeedParser' ])
 
     def namespaceGroupHead (self):
         return self.__namespaceGroupHead
@@ -1294,7 +1321,7 @@ ModuleRecord._setModule(sys.modules[__name__])
 
 def CreateFromDocument (xml_text, default_namespace=None, location_base=None):
     """Parse the given XML and use the document element to create a Python instance."""
-    if pyxb.XMLStyle_saxer != pyxb._XMLStyle:
+    if not (pyxb._XMLStyle in (pyxb.XMLStyle_saxer, pyxb.XMLStyle_expat)):
         dom = pyxb.utils.domutils.StringToDOM(xml_text)
         return CreateFromDOM(dom.documentElement)
     saxer = pyxb.binding.saxer.make_parser(fallback_namespace=Namespace.fallbackNamespace(), location_base=location_base)
@@ -1303,6 +1330,20 @@ def CreateFromDocument (xml_text, default_namespace=None, location_base=None):
     instance = handler.rootObject()
     return instance
 
+def IterCreateFromStream (stream, path, default_namespace=None, location_base=None):
+    """Parse the XML read from the stream, yielding a Python instance for
+    each element matching the path as soon as that element is complete.
+
+    Yielded instances are detached from their parents; see
+    L{pyxb.binding.saxer.IterParse} for details and the path syntax."""
+    return pyxb.binding.saxer.IterParse(stream, path, fallback_namespace=Namespace.fallbackNamespace(), location_base=location_base)
+
+def CreateFeedParser (location_base=None):
+    """Return a L{pyxb.binding.saxer.FeedParser} that accepts the document
+    in pieces, and creates a Python instance from its document element when
+    closed."""
+    return pyxb.binding.saxer.FeedParser(fallback_namespace=Namespace.fallbackNamespace(), location_base=location_base)
+
 def CreateFromDOM (node, default_namespace=None):
     """Create a Python instance from the given DOM node.
     The node tag must correspond to an element declaration in this module.
@@ -1400,6 +1441,28 @@ _GenerationUID = %{generation_uid_expr}
         return 'NGM:%s' % (self.modulePath(),)
 
 
+# The generator and the units of work for a concurrent module rendering, made
+# available to forked worker processes.
+_ConcurrentRenderState = None
+
+def _RenderModuleUnit (unit_index):
+    """Process one unit of a concurrent module rendering.
+
+    @return: A pair C{(module_contents, template_maps)} where
+    C{module_contents} is the source for each module in the unit, and
+    C{template_maps} has, for each complex type definition generated, the
+    template maps of its local scoped declarations."""
+    (generator, units) = _ConcurrentRenderState
+    (unit_steps, unit_modules) = units[unit_index]
+    template_maps = []
+    for (generate_fn, component) in unit_steps:
+        generate_fn(component, generator)
+        if GenerateCTD == generate_fn:
+            template_maps.append([ _d._templateMap() for _d in component.localScopedDeclarations() ])
+    module_contents = [ _m.moduleContents() for _m in unit_modules ]
+    sys.stdout.flush()
+    return (module_contents, template_maps)
+
 def GeneratePython (schema_location=None,
                     schema_text=None,
                     namespace=None,
@@ -1890,6 +1953,105 @@ class Generator (object):
         self.__uriContentArchiveDirectory = ucad
     __uriContentArchiveDirectory = None
 
+    def uriContentCacheDirectory (self):
+        """The directory path of a persistent cache of content retrieved by URI.
+
+        Schema documents retrieved from a URI that has a scheme (e.g.,
+        C{http:}) are stored here, keyed by their normalized location,
+        and subsequent runs read them from the cache rather than
+        retrieving them again.  The C{pyxbfetch} command populates the
+        cache in advance.
+        @rtype: C{str}"""
+        return self.__uriContentCacheDirectory
+    def setUriContentCacheDirectory (self, uri_content_cache_directory):
+        self.__uriContentCacheDirectory = uri_content_cache_directory
+        self.__uriContentCache = None
+        return self
+    __uriContentCacheDirectory = None
+
+    def offline (self):
+        """Indicates whether schema documents identified by URI are read only from the cache.
+
+        If enabled, a document that is not present in the
+        L{uriContentCacheDirectory} cannot be read, and no network
+        access is attempted."""
+        return self.__offline
+    def setOffline (self, offline):
+        self.__offline = offline
+        self.__uriContentCache = None
+        return self
+    __offline = None
+
+    def uriContentCache (self):
+        """The L{pyxb.utils.utility.URIContentCache} through which schema
+        documents are retrieved, or C{None} if no cache directory has been
+        configured."""
+        if self.__uriContentCache is None:
+            if self.uriContentCacheDirectory() is not None:
+                self.__uriContentCache = pyxb.utils.utility.URIContentCache(self.uriContentCacheDirectory(), offline=self.offline())
+            elif self.offline():
+                raise pyxb.UsageError('Offline operation requires a URI content cache directory')
+        return self.__uriContentCache
+    __uriContentCache = None
+
+    def fetchThreads (self):
+        """The number of threads used to retrieve schema documents.
+
+        If greater than one, the documents reachable from the entrypoint
+        schemas through include and import are retrieved concurrently
+        before any schema is processed.
+        @rtype: C{int}"""
+        return self.__fetchThreads
+    def setFetchThreads (self, fetch_threads):
+        self.__fetchThreads = fetch_threads
+        return self
+    __fetchThreads = 1
+
+    def jobs (self):
+        """The number of processes used to render binding modules.
+
+        If greater than one, the Python source for modules that do not
+        depend on each other is rendered concurrently in a pool of forked
+        processes.  The generated source is identical to that produced by
+        serial rendering.  This requires the C{multiprocessing} module and
+        C{os.fork}; where those are unavailable modules are rendered
+        serially.
+        @rtype: C{int}"""
+        return self.__jobs
+    def setJobs (self, jobs):
+        self.__jobs = jobs
+        return self
+    __jobs = 1
+
+    def incremental (self):
+        """Indicates whether generation is skipped when no input has changed.
+
+        If enabled, the signatures of every schema document that
+        contributed to the bindings, including those reached through
+        include and import, are recorded in the L{signatureFile} along
+        with the signatures of the generated modules and archive.  A
+        subsequent run with the same configuration for which none of
+        these has changed does not parse, resolve, or write anything.
+        See L{isUpToDate} and L{writeSignatures}."""
+        return self.__incremental
+    def setIncremental (self, incremental):
+        self.__incremental = incremental
+        return self
+    __incremental = None
+
+    _DEFAULT_signatureFile = 'pyxbgen.sig'
+    def signatureFile (self):
+        """The file in which signatures for incremental generation are stored.
+
+        The file may be shared among several generation actions that
+        use different configurations.  If not absolute, the path is
+        interpreted relative to the L{bindingRoot}."""
+        return self.__signatureFile
+    def setSignatureFile (self, signature_file):
+        self.__signatureFile = signature_file
+        return self
+    __signatureFile = None
+
     def __init__ (self, *args, **kw):
         """Create a configuration to be used for generating bindings.
 
@@ -1920,6 +2082,12 @@ class Generator (object):
         @keyword allow_absent_module: Invokes L{setAllowAbsentModule}
         @keyword generate_to_files: Sets L{generateToFiles}
         @keyword uri_content_archive_directory: Invokes L{setUriContentArchiveDirectory}
+        @keyword uri_content_cache_directory: Invokes L{setUriContentCacheDirectory}
+        @keyword offline: Invokes L{setOffline}
+        @keyword fetch_threads: Invokes L{setFetchThreads}
+        @keyword jobs: Invokes L{setJobs}
+        @keyword incremental: Invokes L{setIncremental}
+        @keyword signature_file: Invokes L{setSignatureFile}
         """
         argv = kw.get('argv', None)
         if argv is not None:
@@ -1949,6 +2117,12 @@ class Generator (object):
         self.__allowAbsentModule = kw.get('allow_absent_module', False)
         self.__generateToFiles = kw.get('generate_to_files', True)
         self.__uriContentArchiveDirectory = kw.get('uri_content_archive_directory')
+        self.__uriContentCacheDirectory = kw.get('uri_content_cache_directory')
+        self.__offline = kw.get('offline', False)
+        self.__fetchThreads = kw.get('fetch_threads', 1)
+        self.__jobs = kw.get('jobs', 1)
+        self.__incremental = kw.get('incremental', False)
+        self.__signatureFile = kw.get('signature_file', self._DEFAULT_signatureFile)
         
         if argv is not None:
             self.applyOptionValues(*self.optionParser().parse_args(argv))
@@ -1980,7 +2154,13 @@ class Generator (object):
         ('write_for_customization', setWriteForCustomization),
         ('allow_builtin_generation', setAllowBuiltinGeneration),
         ('allow_absent_module', setAllowAbsentModule),
-        ('uri_content_archive_directory', setUriContentArchiveDirectory)
+        ('uri_content_archive_directory', setUriContentArchiveDirectory),
+        ('uri_content_cache_directory', setUriContentCacheDirectory),
+        ('offline', setOffline),
+        ('fetch_threads', setFetchThreads),
+        ('jobs', setJobs),
+        ('incremental', setIncremental),
+        ('signature_file', setSignatureFile)
         )
     def applyOptionValues (self, options, args=None):
         for (tag, method) in self.__OptionSetters:
@@ -2030,6 +2210,16 @@ class Generator (object):
                              help=self.__stripSpaces(self.argAddLocationPrefixRewrite.__doc__))
             group.add_option('--uri-content-archive-directory', metavar="DIRECTORY",
                              help=self.__stripSpaces(self.uriContentArchiveDirectory.__doc__))
+            group.add_option('--uri-content-cache-directory', metavar="DIRECTORY",
+                             help=self.__stripSpaces(self.uriContentCacheDirectory.__doc__))
+            group.add_option('--offline',
+                             action='store_true', dest='offline',
+                             help=self.__stripSpaces(self.offline.__doc__ + ' This option turns on the feature.'))
+            group.add_option('--no-offline',
+                             action='store_false', dest='offline',
+                             help=self.__stripSpaces(self.offline.__doc__ + ' This option turns off the feature (I{default}).'))
+            group.add_option('--fetch-threads', metavar="N", type='int',
+                             help=self.__stripSpaces(self.fetchThreads.__doc__))
             parser.add_option_group(group)
 
             group = optparse.OptionGroup(parser, 'Configuring Bindings', 'Specify where generated bindings should be written, and how they will be accessed from Python.')
@@ -2046,6 +2236,16 @@ class Generator (object):
             group.add_option('--no-write-for-customization',
                              action='store_false', dest='write_for_customization',
                              help=self.__stripSpaces(self.writeForCustomization.__doc__ + ' This option turns off the feature (I{default}).'))
+            group.add_option('--jobs', '-j', metavar="N", type='int',
+                             help=self.__stripSpaces(self.jobs.__doc__))
+            group.add_option('--incremental',
+                             action='store_true', dest='incremental',
+                             help=self.__stripSpaces(self.incremental.__doc__ + ' This option turns on the feature.'))
+            group.add_option('--no-incremental',
+                             action='store_false', dest='incremental',
+                             help=self.__stripSpaces(self.incremental.__doc__ + ' This option turns off the feature (I{default}).'))
+            group.add_option('--signature-file', metavar="FILE",
+                             help=self.__stripSpaces(self.signatureFile.__doc__))
             parser.add_option_group(group)
 
             group = optparse.OptionGroup(parser, 'Reading Namespace Archives', 'Locating and loading (or inhibiting load of) namespace archives.')
@@ -2161,6 +2361,17 @@ class Generator (object):
                 opts.append('--no-' + opt)
         if self.uriContentArchiveDirectory() is not None:
             opts.append('--uri-content-archive-directory=%s' + self.uriContentArchiveDirectory())
+        if self.uriContentCacheDirectory() is not None:
+            opts.append('--uri-content-cache-directory=' + self.uriContentCacheDirectory())
+        if self.offline():
+            opts.append('--offline')
+        if 1 != self.fetchThreads():
+            opts.append('--fetch-threads=%d' % (self.fetchThreads(),))
+        if 1 != self.jobs():
+            opts.append('--jobs=%d' % (self.jobs(),))
+        if self.incremental():
+            opts.append('--incremental')
+            opts.append('--signature-file=' + self.signatureFile())
         return opts
 
     def normalizeSchemaLocation (self, sl):
@@ -2189,12 +2400,29 @@ class Generator (object):
         if self.__didResolveExternalSchema and (not reset):
             raise pyxb.PyXBException('Cannot resolve external schema multiple times')
 
+        if self.incremental():
+            # Capture the configuration before the location and module
+            # lists are consumed.
+            self.__signatureKey()
         required_archives = pyxb.namespace.archive.NamespaceArchive.PreLoadArchives(self.archivePath(), self.preLoadArchives())
         for nsa in required_archives:
             nsa.readNamespaces()
         for ns in self.noLoadNamespaces():
             assert isinstance(ns, pyxb.namespace.Namespace)
             ns.markNotLoadable()
+        schema_document_map = None
+        if 1 < self.fetchThreads():
+            schema_document_map = { }
+            locations = []
+            for sl in self.__schemaLocationList:
+                if isinstance(sl, tuple):
+                    (sl, converter) = sl
+                    if converter is not None:
+                        continue
+                locations.append(self.normalizeSchemaLocation(sl))
+            xs.schema.PrefetchDocuments(locations, threads=self.fetchThreads(), document_map=schema_document_map,
+                                        uri_content_cache=self.uriContentCache(),
+                                        uri_content_archive_directory=self.uriContentArchiveDirectory())
         while self.__schemaLocationList:
             sl = self.__schemaLocationList.pop(0)
             if isinstance(sl, tuple):
@@ -2205,7 +2433,9 @@ class Generator (object):
                 if converter is None:
                     schema = xs.schema.CreateFromLocation(absolute_schema_location=self.normalizeSchemaLocation(sl),
                                                           generation_uid=self.generationUID(),
-                                                          uri_content_archive_directory=self.uriContentArchiveDirectory())
+                                                          uri_content_archive_directory=self.uriContentArchiveDirectory(),
+                                                          uri_content_cache=self.uriContentCache(),
+                                                          schema_document_map=schema_document_map)
                 else:
                     schema = converter(self, sl)
                 self.addSchema(schema)
@@ -2392,14 +2622,69 @@ class Generator (object):
                 for m in ngm.namespaceModules():
                     m.addImportsFrom(ngm)
     
-        for std in simple_type_definitions:
-            GenerateSTD(std, self)
-        for ctd in complex_type_definitions:
-            GenerateCTD(ctd, self)
-        for ed in element_declarations:
-            GenerateED(ed, self)
+        generation_steps = [ (GenerateSTD, _std) for _std in simple_type_definitions ]
+        generation_steps.extend([ (GenerateCTD, _ctd) for _ctd in complex_type_definitions ])
+        generation_steps.extend([ (GenerateED, _ed) for _ed in element_declarations ])
+        if not self.__renderModulesConcurrently(generation_steps):
+            for (generate_fn, component) in generation_steps:
+                generate_fn(component, self)
     
         return modules
+
+    def __renderModulesConcurrently (self, generation_steps):
+        """Generate the binding source in a pool of processes.
+
+        The steps are partitioned into units by the module that holds the
+        component binding.  Each unit is processed by a worker that runs its
+        steps in their original order and returns the contents of its modules.
+        Generating a component only updates the module that holds it, except
+        that a namespace group module may reuse a namespace declaration made
+        by another group module it imports, so all group modules form a single
+        unit.  Workers also return the template maps of the local declarations
+        of each complex type, so that the namespace archive records the same
+        information as a serial run.
+
+        @return: C{True} if the modules were rendered, C{False} if the caller
+        must run the generation steps itself."""
+        global _ConcurrentRenderState
+        if (1 >= self.jobs()) or (multiprocessing is None) or not hasattr(os, 'fork'):
+            return False
+        unit_map = { }
+        units = []
+        for (generate_fn, component) in generation_steps:
+            module = self.moduleForComponent(component)
+            unit_key = module
+            if isinstance(module, NamespaceGroupModule):
+                unit_key = NamespaceGroupModule
+            unit = unit_map.get(unit_key)
+            if unit is None:
+                unit = unit_map[unit_key] = ( [], [] )
+                units.append(unit)
+            (unit_steps, unit_modules) = unit
+            unit_steps.append( (generate_fn, component) )
+            if not (module in unit_modules):
+                unit_modules.append(module)
+        if 2 > len(units):
+            return False
+
+        # Workers inherit the generation state by forking; don't let them
+        # also inherit unwritten output.
+        sys.stdout.flush()
+        _ConcurrentRenderState = (self, units)
+        pool = multiprocessing.Pool(min(self.jobs(), len(units)))
+        try:
+            results = pool.map(_RenderModuleUnit, range(len(units)))
+        finally:
+            pool.close()
+            pool.join()
+            _ConcurrentRenderState = None
+
+        for ((unit_steps, unit_modules), (module_contents, template_maps)) in zip(units, results):
+            [ _m._setModuleContents(_mc) for (_m, _mc) in zip(unit_modules, module_contents) ]
+            ctds = [ _c for (_fn, _c) in unit_steps if GenerateCTD == _fn ]
+            for (ctd, ctd_maps) in zip(ctds, template_maps):
+                [ _d._templateMap().update(_tm) for (_d, _tm) in zip(ctd.localScopedDeclarations(), ctd_maps) ]
+        return True
     
     __bindingModules = None
     def bindingModules (self, reset=False):
@@ -2426,5 +2711,133 @@ class Generator (object):
                 if isinstance(e, (AssertionError, AttributeError, TypeError)):
                     raise
 
+    __signatureKeyValue = None
+    def __signatureKey (self):
+        """Return a string identifying this configuration within the
+        signature file, or C{None} if the inputs of the configuration
+        cannot be re-examined by a later run."""
+        if self.__signatureKeyValue is None:
+            self.__signatureKeyValue = ''
+            schema_locations = []
+            for sl in self.schemaLocationList():
+                if isinstance(sl, tuple):
+                    (sl, converter) = sl
+                    if converter is not None:
+                        return None
+                schema_locations.append(self.normalizeSchemaLocation(sl))
+            schema_signatures = []
+            for schema in self.schemas():
+                if not isinstance(schema, basestring):
+                    return None
+                schema_signatures.append(pyxb.utils.utility.HashForText(schema))
+            visibilities = [ (pyxb.namespace.NamespaceInstance(_ns).uri(), _v) for (_ns, _v) in self.namespaceVisibilityMap().items() ]
+            configuration = ( pyxb.__version__, schema_locations, schema_signatures,
+                              self.moduleList(), self.modulePrefix(), sorted(self.namespaceModuleMap().items()),
+                              os.path.abspath(self.bindingRoot()), self.archiveToFile(), self.schemaStrippedPrefix(),
+                              sorted(self.locationPrefixRewriteMap().items()), sorted(self.preLoadArchives()),
+                              sorted([ _ns.uri() for _ns in self.noLoadNamespaces() ]), sorted(visibilities),
+                              self.defaultNamespacePublic(), self.validateChanges(), self.writeForCustomization(),
+                              self.allowAbsentModule(), self.allowBuiltinGeneration() )
+            self.__signatureKeyValue = repr(configuration)
+        return self.__signatureKeyValue or None
+
+    def __signatureFilePath (self):
+        return os.path.join(self.bindingRoot(), self.signatureFile())
+
+    def __readSignatures (self):
+        try:
+            return pickle.load(file(self.__signatureFilePath(), 'rb'))
+        except Exception, e:
+            # Absent or unreadable: everything will be regenerated.
+            return { }
+
+    @classmethod
+    def __FileSignature (cls, file_path):
+        try:
+            return pyxb.utils.utility.HashForText(file(file_path, 'rb').read())
+        except IOError, e:
+            return None
+
+    def isUpToDate (self):
+        """Determine whether the output of a previous generation with the
+        same configuration is still current.
+
+        This should be invoked before L{resolveExternalSchema}; if it
+        returns C{True}, there is no need to parse schema or write
+        bindings.
+
+        @return: C{True} iff L{incremental} is enabled, the
+        L{signatureFile} holds a record for this configuration, and
+        every schema document, namespace archive, and generated file
+        named in that record still has its recorded signature.
+        @rtype: C{bool}"""
+        if not self.incremental():
+            return False
+        key = self.__signatureKey()
+        if key is None:
+            return False
+        record = self.__readSignatures().get(key)
+        if record is None:
+            return False
+        (documents, files) = record
+        for (location, signature) in documents:
+            try:
+                text = pyxb.utils.utility.TextFromURI(location, cache=self.uriContentCache())
+            except Exception, e:
+                return False
+            if pyxb.utils.utility.HashForText(text) != signature:
+                return False
+        for (file_path, signature) in files:
+            if self.__FileSignature(file_path) != signature:
+                return False
+        return True
+
+    def writeSignatures (self):
+        """Record in the L{signatureFile} the signatures of the inputs
+        and outputs of this generation, for use by L{isUpToDate}.
+
+        The inputs are every schema document that contributed to a
+        module generated by this configuration, whether named directly
+        or reached by include or import, and the namespace archives from
+        which other namespaces were loaded.  The outputs are the binding
+        modules and the archive.  This should be invoked after both
+        have been written.  It has no effect unless L{incremental} is
+        enabled."""
+        if not self.incremental():
+            return self
+        key = self.__signatureKey()
+        if key is None:
+            print 'WARNING: Changes to schema from converters or instances cannot be detected; signatures not saved'
+            return self
+        documents = set()
+        file_paths = set()
+        for ns in pyxb.namespace.AvailableNamespaces():
+            for module_record in ns.moduleRecords():
+                if self.generationUID() == module_record.generationUID():
+                    for origin in module_record.origins():
+                        if isinstance(origin, pyxb.namespace.archive._SchemaOrigin) and (origin.location() is not None):
+                            documents.add( (origin.location(), origin.signature()) )
+                elif (module_record.archive() is not None) and module_record.isIncorporated():
+                    file_paths.add(module_record.archive().archivePath())
+        for module in self.bindingModules():
+            if module.bindingFile() is not None:
+                file_paths.add(module.bindingFilePath())
+        if self.archiveToFile() is not None:
+            file_paths.add(self.archiveToFile())
+        files = [ (_fp, self.__FileSignature(_fp)) for _fp in sorted(file_paths) ]
+
+        signatures = self.__readSignatures()
+        signatures[key] = (sorted(documents), files)
+        # Replace the file in one step, since other generations may be
+        # sharing it.
+        signature_file = self.__signatureFilePath()
+        temp_file = '%s.%d' % (signature_file, os.getpid())
+        output = pyxb.utils.utility.OpenOrCreate(temp_file)
+        pickle.dump(signatures, output, -1)
+        output.close()
+        os.rename(temp_file, signature_file)
+        print 'Saved signatures for %d schema documents to %s' % (len(documents), signature_file)
+        return self
+
     def moduleForComponent (self, component):
         return _ModuleNaming_mixin.ComponentBindingModule(component)
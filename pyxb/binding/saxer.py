@@ -88,23 +88,35 @@ class _SAXElementState (pyxb.utils.saxutils.SAXElementState):
         """
         self.__enclosingCTD = enclosing_ctd
 
+    # True iff the document is known to be valid, so content is stored
+    # without validation.
+    __trustInput = False
+
+    # True iff conversion of simple values is deferred until they are used.
+    __deferConversion = False
+
     # Create the binding instance for this element.
-    def __constructElement (self, new_object_factory, attrs, content=None):
+    def __constructElement (self, new_object_factory, attrs, content=None, defer=False):
         kw = {}
 
         # Note whether the node is marked nil
         if attrs.has_key(self.__XSINilTuple):
             kw['_nil'] = pyxb.binding.datatypes.boolean(attrs.getValue(self.__XSINilTuple))
+        if self.__trustInput:
+            kw['_validate_constraints'] = False
 
         if content is None:
             content = []
+        if defer and not kw.has_key('_nil'):
+            self.__bindingObject = pyxb.binding.basis._DeferredValue(new_object_factory, content, kw, location=self.packedLocation(), namespace_context=self.namespaceContext())
+            return self.__bindingObject
         self.__bindingObject = new_object_factory(*content, **kw)
         if isinstance(self.__bindingObject, pyxb.utils.utility.Locatable_mixin):
-            self.__bindingObject._setLocation(self.location())
+            self.__bindingObject._setLocation(self.packedLocation())
 
         # Record the namespace context so users of the binding can
         # interpret QNames within the attributes and content.
-        self.__bindingObject._setNamespaceContext(self.__namespaceContext)
+        self.__bindingObject._setNamespaceContext(self.namespaceContext())
 
         # Set the attributes.
         if isinstance(self.__bindingObject, pyxb.binding.basis.complexTypeDefinition):
@@ -112,11 +124,23 @@ class _SAXElementState (pyxb.utils.saxutils.SAXElementState):
             # that names are pairs of (namespaceURI, localName), just like we
             # want them to be.
             for attr_name in self.__attributes.getNames():
-                attr_en = pyxb.namespace.ExpandedName(attr_name)
+                attr_en = pyxb.utils.saxutils.InternedExpandedName(attr_name)
                 # Ignore xmlns and xsi attributes; we've already handled those
                 if attr_en.namespace() in ( pyxb.namespace.XMLNamespaces, XSI ):
                     continue
-                au = self.__bindingObject._setAttribute(attr_en, attrs.getValue(attr_name))
+                value = attrs.getValue(attr_name)
+                if self.__trustInput or self.__deferConversion:
+                    au = self.__bindingObject._AttributeMap.get(attr_en)
+                    if au is None:
+                        pass
+                    elif self.__deferConversion:
+                        attr_kw = {}
+                        if self.__trustInput:
+                            attr_kw['_validate_constraints'] = False
+                        value = pyxb.binding.basis._DeferredValue(au.dataType().Factory, [ value ], attr_kw)
+                    else:
+                        value = au.dataType().Factory(value, _validate_constraints=False)
+                au = self.__bindingObject._setAttribute(attr_en, value)
 
         return self.__bindingObject
 
@@ -140,13 +164,13 @@ class _SAXElementState (pyxb.utils.saxutils.SAXElementState):
         self.__attributes = pyxb.utils.saxdom.NamedNodeMap()
         ns_ctx = self.namespaceContext()
         for name in attrs.getNames():
-            attr_en = pyxb.namespace.ExpandedName(name)
-            self.__attributes._addItem(pyxb.utils.saxdom.Attr(expanded_name=attr_en, namespace_context=ns_ctx, value=attrs.getValue(name), location=self.location()))
+            attr_en = pyxb.utils.saxutils.InternedExpandedName(name)
+            self.__attributes._addItem(pyxb.utils.saxdom.Attr(expanded_name=attr_en, namespace_context=ns_ctx, value=attrs.getValue(name), location=self.packedLocation()))
 
     def endDOMElement (self):
         """Actions upon leaving an element that is part of a DOM subtree."""
         ns_ctx = self.namespaceContext()
-        element = pyxb.utils.saxdom.Element(namespace_context=ns_ctx, expanded_name=self.expandedName(), attributes=self.__attributes, location=self.location())
+        element = pyxb.utils.saxdom.Element(namespace_context=ns_ctx, expanded_name=self.expandedName(), attributes=self.__attributes, location=self.packedLocation())
         for ( content, element_use, maybe_element ) in self.content():
             if isinstance(content, xml.dom.Node):
                 element.appendChild(content)
@@ -163,7 +187,7 @@ class _SAXElementState (pyxb.utils.saxutils.SAXElementState):
         parent_state.addElementContent(element, None)
         return element
 
-    def startBindingElement (self, type_class, new_object_factory, element_use, attrs):
+    def startBindingElement (self, type_class, new_object_factory, element_use, attrs, trust_input=False, defer_conversion=False):
         """Actions upon entering an element that will produce a binding instance.
 
         The element use is recorded.  If the type is a subclass of
@@ -180,8 +204,17 @@ class _SAXElementState (pyxb.utils.saxutils.SAXElementState):
         @type element_use: L{basis.element}
         @param attrs: The XML attributes associated with the element
         @type attrs: C{xml.sax.xmlreader.Attributes}
+        @param trust_input: If C{True}, the element is known to be valid, and
+        the binding instance and its content are created without validation.
+        See L{pyxb.TrustInputWhenParsing}.
+        @param defer_conversion: If C{True}, simple values within the element
+        are converted when first used.  See
+        L{pyxb.DeferConversionWhenParsing}.
         @return: The generated binding instance, or C{None} if creation is delayed
         """
+        self.__trustInput = trust_input
+        self.__deferConversion = defer_conversion
+        self.__typeClass = type_class
         self.__delayedConstructor = None
         self.__elementUse = element_use
         self.__attributes = attrs
@@ -192,10 +225,37 @@ class _SAXElementState (pyxb.utils.saxutils.SAXElementState):
             self.__constructElement(new_object_factory, attrs)
         return self.__bindingObject
 
-    def endBindingElement (self):
+    # True iff the binding for some element within this one was detached
+    # rather than being added to its parent.
+    __contentDetached = False
+
+    def __noteDetachedContent (self):
+        """Record that content within this element was withheld.
+
+        The flag propagates to all enclosing elements, since the content of
+        each of them is now incomplete."""
+        state = self
+        while isinstance(state, _SAXElementState) and not state.__contentDetached:
+            state.__contentDetached = True
+            state = state.parentState()
+
+    # The Python type of the binding instance
+    __typeClass = None
+
+    def endBindingElement (self, detach=False):
         """Perform any end-of-element processing.
 
-        For simple type instances, this creates the binding instance.
+        For simple type instances, this creates the binding instance.  If
+        conversion is deferred, the instance for a non-root element with a
+        simple type is instead represented by a
+        L{pyxb.binding.basis._DeferredValue} holding its text.
+
+        Elements that enclose detached content cannot be validated against
+        their content models, so content is stored without validation and
+        the completed instance is not validated.
+
+        @param detach: If C{True}, the binding instance is not added to the
+        content of the enclosing element.
         @return: The generated binding instance
         """
         if self.__delayedConstructor is not None:
@@ -206,17 +266,31 @@ class _SAXElementState (pyxb.utils.saxutils.SAXElementState):
                 assert isinstance(content, basestring)
                 args.append(content)
             assert 1 >= len(args), 'Unexpected STD content %s' % (args,)
-            self.__constructElement(self.__delayedConstructor, self.__attributes, args)
+            defer = self.__deferConversion and (not detach) and (self.__elementUse is not None) and issubclass(self.__typeClass, pyxb.binding.basis.simpleTypeDefinition)
+            self.__constructElement(self.__delayedConstructor, self.__attributes, args, defer=defer)
+        elif self.__trustInput:
+            for (content, element_use, maybe_element) in self.__content:
+                self.__bindingObject._appendTrusted(content, element_use, maybe_element)
         else:
             #print 'Extending %s by content %s' % (self.__bindingObject, self.__content,)
+            require_validation = pyxb._ParsingRequiresValid and not self.__contentDetached
             for (content, element_use, maybe_element) in self.__content:
-                self.__bindingObject.append(content, element_use, maybe_element, require_validation=pyxb._ParsingRequiresValid)
+                self.__bindingObject.append(content, element_use, maybe_element, require_validation=require_validation)
         parent_state = self.parentState()
         if parent_state is not None:
-            parent_state.addElementContent(self.__bindingObject, self.__elementUse)
-        # As CreateFromDOM does, validate the resulting element
-        if pyxb._ParsingRequiresValid:
-            self.__bindingObject.validateBinding()
+            if detach:
+                parent_state.__noteDetachedContent()
+            else:
+                parent_state.addElementContent(self.__bindingObject, self.__elementUse)
+        # As CreateFromDOM does, validate the resulting element.  Deferred
+        # values are validated when materialized.
+        if isinstance(self.__bindingObject, pyxb.binding.basis._DeferredValue):
+            pass
+        elif pyxb._ParsingRequiresValid and not (self.__contentDetached or self.__trustInput):
+            if self.__deferConversion and isinstance(self.__bindingObject, pyxb.binding.basis.complexTypeDefinition):
+                self.__bindingObject._validateParsedBinding()
+            else:
+                self.__bindingObject.validateBinding()
         return self.__bindingObject
 
 class PyXBSAXHandler (pyxb.utils.saxutils.BaseSAXHandler):
@@ -267,17 +341,110 @@ class PyXBSAXHandler (pyxb.utils.saxutils.BaseSAXHandler):
         """
         super(PyXBSAXHandler, self).reset()
         self.__rootObject = None
+        self.__streamedObjects = []
         return self
 
+    def trustInput (self):
+        """C{True} iff documents are known to be valid, so bindings are
+        created without validation.  See L{pyxb.TrustInputWhenParsing}."""
+        return self.__trustInput
+    __trustInput = False
+
+    def deferConversion (self):
+        """C{True} iff simple values are converted when first used rather
+        than when parsed.  See L{pyxb.DeferConversionWhenParsing}."""
+        return self.__deferConversion
+    __deferConversion = False
+
+    def streamPath (self):
+        """The path selecting elements that are detached from their parents
+        as they complete; see L{IterParse}.
+
+        @return: C{None}, or the path as provided to the constructor"""
+        return self.__streamPath
+    __streamPath = None
+
+    # None, or a tuple of (namespace URI, local name) pairs with the last
+    # step first, where a URI of _AnyNamespace matches any namespace.
+    __streamSteps = None
+
+    # True iff the first step of the stream path must match the document
+    # element.
+    __streamAnchored = False
+
+    # Bindings for elements that matched the stream path and have not yet
+    # been retrieved through streamedObjects.
+    __streamedObjects = None
+
+    _AnyNamespace = object()
+
+    @classmethod
+    def _CompileStreamPath (cls, path):
+        """Convert a stream path into the sequence of steps used for matching.
+
+        @return: C{( anchored, steps )}"""
+        anchored = path.startswith('/')
+        steps = []
+        for step in path.strip('/').split('/'):
+            uri = cls._AnyNamespace
+            if step.startswith('{'):
+                (uri, step) = step[1:].split('}', 1)
+                if 0 == len(uri):
+                    uri = None
+            if 0 == len(step):
+                raise pyxb.UsageError('Invalid stream path %s' % (path,))
+            steps.append( (uri, step) )
+        steps.reverse()
+        return (anchored, tuple(steps))
+
+    def __matchesStreamPath (self, element_state):
+        for (uri, local_name) in self.__streamSteps:
+            element_name = element_state.expandedName()
+            if element_name is None:
+                return False
+            if local_name != element_name.localName():
+                return False
+            if (uri is not self._AnyNamespace) and (uri != element_name.namespaceURI()):
+                return False
+            element_state = element_state.parentState()
+        return (not self.__streamAnchored) or (element_state.expandedName() is None)
+
+    def streamedObjects (self):
+        """Return the bindings for elements that have matched the stream path
+        since the last call to this method.
+
+        @return: A list of L{basis._TypeBinding_mixin} instances in document
+        order"""
+        rv = self.__streamedObjects
+        self.__streamedObjects = []
+        return rv
+
     def __init__ (self, **kw):
         """Create a parser instance for converting XML to bindings.
 
         @keyword element_state_constructor: Overridden with the value
         L{_SAXElementState} before invoking the L{superclass
         constructor<pyxb.utils.saxutils.BaseSAXHandler.__init__>}.
+
+        @keyword stream_path: Optional path selecting elements whose bindings
+        are detached from their parents and made available through
+        L{streamedObjects}.  See L{IterParse} for the path syntax.
+
+        @keyword trust_input: If C{True}, the document is known to be valid
+        and bindings are created without validation.  The default is the
+        value of L{pyxb.TrustInputWhenParsing}.
+
+        @keyword defer_conversion: If C{True}, simple values are held as text
+        and converted when first used.  The default is the value of
+        L{pyxb.DeferConversionWhenParsing}.
         """
 
         kw.setdefault('element_state_constructor', _SAXElementState)
+        self.__trustInput = kw.pop('trust_input', pyxb._ParsingTrustsInput)
+        self.__deferConversion = kw.pop('defer_conversion', pyxb._ParsingDefersConversion)
+        self.__streamPath = kw.pop('stream_path', None)
+        if self.__streamPath is not None:
+            (self.__streamAnchored, self.__streamSteps) = self._CompileStreamPath(self.__streamPath)
         super(PyXBSAXHandler, self).__init__(**kw)
         self.reset()
 
@@ -339,7 +506,7 @@ class PyXBSAXHandler (pyxb.utils.saxutils.BaseSAXHandler):
 
         # Process the element start.  This may or may not return a
         # binding object.
-        binding_object = this_state.startBindingElement(type_class, new_object_factory, element_use, attrs)
+        binding_object = this_state.startBindingElement(type_class, new_object_factory, element_use, attrs, trust_input=self.__trustInput, defer_conversion=self.__deferConversion)
 
         # If the top-level element has complex content, this sets the
         # root object.  If it has simple content, see endElementNS.
@@ -356,8 +523,12 @@ class PyXBSAXHandler (pyxb.utils.saxutils.BaseSAXHandler):
         else:
             # Process the element end.  This will return a binding object,
             # either the one created at the start or the one created at
-            # the end.
-            binding_object = this_state.endBindingElement()
+            # the end.  Elements selected by the stream path are withheld
+            # from their parents.
+            detach = (self.__streamSteps is not None) and self.__matchesStreamPath(this_state)
+            binding_object = this_state.endBindingElement(detach=detach)
+            if detach:
+                self.__streamedObjects.append(binding_object)
         assert binding_object is not None
 
         # If we don't have a root object, save it.  No, there is not a
@@ -376,6 +547,114 @@ def make_parser (*args, **kw):
     kw.setdefault('content_handler_constructor', PyXBSAXHandler)
     return pyxb.utils.saxutils.make_parser(*args, **kw)
 
+class FeedParser (object):
+    """A parser that accepts the document in pieces as they become
+    available, such as when reading from a socket or pipe.
+
+    Parsing of each piece happens when it is provided, so the cost of
+    building the bindings overlaps with receipt of the remainder of the
+    document.  An example of use is::
+
+      import pyxb.binding.saxer
+
+      parser = pyxb.binding.saxer.FeedParser()
+      while True:
+          data = sock.recv(4096)
+          if not data:
+              break
+          parser.feed(data)
+      instance = parser.close()
+
+    After L{close} the parser may be used for another document.
+    """
+
+    def handler (self):
+        """The L{PyXBSAXHandler} instance receiving events from the parser."""
+        return self.__handler
+    __handler = None
+
+    # The underlying SAX parser, which must support the
+    # xml.sax.xmlreader.IncrementalParser interface.
+    __saxer = None
+
+    def __init__ (self, **kw):
+        """Create a parser.
+
+        All keywords are passed to L{make_parser}.
+        """
+        self.__saxer = make_parser(**kw)
+        self.__handler = self.__saxer.getContentHandler()
+
+    def feed (self, data):
+        """Parse the next piece of the document.
+
+        @param data: The bytes of the document that follow those previously
+        provided.
+        @return: C{self}
+        """
+        self.__saxer.feed(data)
+        return self
+
+    def streamedObjects (self):
+        """Return the bindings for elements that matched the stream path
+        since the last call.  See L{PyXBSAXHandler.streamedObjects}."""
+        return self.__handler.streamedObjects()
+
+    def close (self):
+        """Complete the parse of the document.
+
+        @return: The binding instance for the document element; see
+        L{PyXBSAXHandler.rootObject}.
+        """
+        self.__saxer.close()
+        return self.__handler.rootObject()
+
+# The number of bytes read from the stream between checks for completed
+# elements in IterParse.
+_IterParseChunkSize = 64 * 1024
+
+def IterParse (stream, path, **kw):
+    """Parse the document read from the stream, yielding a binding instance
+    for each element that matches the path as soon as the element ends.
+
+    Each yielded instance is detached from the enclosing element, so the
+    memory needed to process the document depends on the size of a single
+    matching element rather than the whole document.  The instances
+    enclosing detached elements are incomplete, and are neither validated
+    nor retained.
+
+    An example of processing each C{schedule} element in a TMS listing::
+
+      for schedule in IterParse(open('listing.xml'), 'schedules/schedule'):
+          print schedule.program
+
+    @param stream: An object with a C{read(size)} method returning bytes of
+    the XML document.
+
+    @param path: A sequence of element names separated by C{/}.  An element
+    matches if the names of its trailing ancestors, ending with the element
+    itself, match the steps of the path.  A leading C{/} requires the first
+    step to match the document element.  A step that is a local name matches
+    an element with that name in any namespace; a namespace may be required
+    by using the form C{{uri}local}.
+
+    @keyword chunk_size: The number of bytes to read from the stream at a
+    time.
+
+    All other keywords are passed to L{FeedParser}.
+    """
+    chunk_size = kw.pop('chunk_size', _IterParseChunkSize)
+    parser = FeedParser(stream_path=path, **kw)
+    while True:
+        data = stream.read(chunk_size)
+        if not data:
+            break
+        for instance in parser.feed(data).streamedObjects():
+            yield instance
+    parser.close()
+    for instance in parser.streamedObjects():
+        yield instance
+
 ## Local Variables:
 ## fill-column:78
 ## End:
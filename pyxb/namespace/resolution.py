@@ -56,7 +56,8 @@ class _Resolvable_mixin (pyxb.cscRoot):
         Override this in the child class.  In the prefix, if L{isResolved} is
         true, return right away.  If something prevents you from completing
         resolution, invoke L{self._queueForResolution()} (so it is retried
-        later) and immediately return self.  Prior to leaving after successful
+        later, passing the blocking component if there is one) and
+        immediately return self.  Prior to leaving after successful
         resolution discard any cached dom node by setting C{self.__domNode=None}.
 
         @return: C{self}, whether or not resolution succeeds.
@@ -64,12 +65,16 @@ class _Resolvable_mixin (pyxb.cscRoot):
         """
         raise pyxb.LogicError('Resolution not implemented in %s' % (self.__class__,))
 
-    def _queueForResolution (self, why=None):
+    def _queueForResolution (self, why=None, depends_on=None):
         """Short-hand to requeue an object if the class implements _namespaceContext().
+
+        @keyword depends_on: The unresolved L{_Resolvable_mixin} instance
+        that prevented resolution, if known.  This object will not be
+        retried until that one has been resolved.
         """
         if (why is not None) and self._TraceResolution:
             print 'Resolution delayed for %s: %s' % (self, why)
-        self._namespaceContext().queueForResolution(self)
+        self._namespaceContext().queueForResolution(self, depends_on)
 
 class _NamespaceResolution_mixin (pyxb.cscRoot):
     """Mix-in that aggregates those aspects of XMLNamespaces relevant to
@@ -85,15 +90,31 @@ class _NamespaceResolution_mixin (pyxb.cscRoot):
     __referencedNamespaces = None
 
     # A list of Namespace._Resolvable_mixin instances that have yet to be
-    # resolved.
+    # resolved, and are not waiting on some other component.
     __unresolvedComponents = None
 
+    # A map from an unresolved _Resolvable_mixin instance to a list of
+    # (sequence, resolvable) pairs for the resolvables that cannot proceed
+    # until it has been resolved.  The sequence number preserves queuing
+    # order when dependents of several components are retried together.
+    __dependentComponents = None
+    __queueSequence = 0
+
+    # The resolvable most recently queued, used to verify that a
+    # resolvable that fails to resolve has requeued itself.
+    __lastQueued = None
+
+    # The number of _resolve invocations made by resolveDefinitions.
+    __resolveCallCount = 0
+
     def _reset (self):
         """CSC extension to reset fields of a Namespace.
 
         This one handles component-resolution--related data."""
         getattr(super(_NamespaceResolution_mixin, self), '_reset', lambda *args, **kw: None)()
         self.__unresolvedComponents = []
+        self.__dependentComponents = { }
+        self.__resolveCallCount = 0
         self.__importedNamespaces = set()
         self.__referencedNamespaces = set()
 
@@ -138,7 +159,7 @@ class _NamespaceResolution_mixin (pyxb.cscRoot):
                 rn.update(mr.referencedNamespaces())
         return rn
 
-    def queueForResolution (self, resolvable):
+    def queueForResolution (self, resolvable, depends_on=None):
         """Invoked to note that a component may have references that will need
         to be resolved.
 
@@ -148,12 +169,54 @@ class _NamespaceResolution_mixin (pyxb.cscRoot):
 
         The provided object must be an instance of _Resolvable_mixin.  This
         method returns the resolvable object.
+
+        @keyword depends_on: An unresolved L{_Resolvable_mixin} instance that
+        must be resolved before resolution of C{resolvable} can proceed.  If
+        provided, C{resolvable} is retried only after C{depends_on} has been
+        resolved.
         """
         assert isinstance(resolvable, _Resolvable_mixin)
         if not resolvable.isResolved():
-            self.__unresolvedComponents.append(resolvable)
+            if (depends_on is None) or depends_on.isResolved():
+                self.__unresolvedComponents.append(resolvable)
+            else:
+                self.__queueSequence += 1
+                self.__dependentComponents.setdefault(depends_on, []).append( (self.__queueSequence, resolvable) )
+            self.__lastQueued = resolvable
         return resolvable
 
+    def __wakeDependents (self, blockers):
+        """Move the resolvables waiting on any of the given components to
+        the list of those to be retried, in the order they were queued."""
+        woken = []
+        for blocker in blockers:
+            woken.extend(self.__dependentComponents.pop(blocker, []))
+        woken.sort()
+        self.__unresolvedComponents.extend([ _r for (_s, _r) in woken ])
+
+    def __isPending (self, resolvable):
+        if resolvable in self.__unresolvedComponents:
+            return True
+        for dependents in self.__dependentComponents.itervalues():
+            if resolvable in [ _r for (_s, _r) in dependents ]:
+                return True
+        return False
+
+    def __pendingCount (self):
+        count = len(self.__unresolvedComponents)
+        for dependents in self.__dependentComponents.itervalues():
+            count += len(dependents)
+        return count
+
+    def resolveCallCount (self):
+        """The number of times L{resolveDefinitions} has invoked
+        C{_resolve} on a component of this namespace.
+
+        This measures the cost of resolution.  Ideally each component is
+        invoked once, plus once more for each time it was found to depend on
+        an unresolved component."""
+        return self.__resolveCallCount
+
     def needsResolution (self):
         """Return C{True} iff this namespace has not been resolved."""
         return self.__unresolvedComponents is not None
@@ -161,6 +224,13 @@ class _NamespaceResolution_mixin (pyxb.cscRoot):
     def _replaceComponent_csc (self, existing_def, replacement_def):
         """Replace a component definition if present in the list of unresolved components.
         """
+        if self.__dependentComponents:
+            # Anything waiting on the replaced component gets retried, and
+            # the replaced component is retried directly.
+            self.__wakeDependents([ existing_def ])
+            for (blocker, dependents) in self.__dependentComponents.items():
+                if existing_def in [ _r for (_s, _r) in dependents ]:
+                    self.__wakeDependents([ blocker ])
         try:
             index = self.__unresolvedComponents.index(existing_def)
             print 'Replacing unresolved %s' % (existing_def,)
@@ -179,9 +249,14 @@ class _NamespaceResolution_mixin (pyxb.cscRoot):
 
         This method iterates through all components on the unresolved list,
         invoking the _resolve method of each.  If the component could not be
-        resolved in this pass, it iis placed back on the list for the next
-        iteration.  If an iteration completes without resolving any of the
-        unresolved components, a pyxb.NotInNamespaceError exception is raised.
+        resolved in this pass, it is placed back on the list for the next
+        iteration.  A component that was requeued because it depends on some
+        other unresolved component is not retried until that component has
+        been resolved, so each pass processes only components that can make
+        progress.  If blocked components remain and there is nothing else to
+        do, all of them are retried; if that pass completes without resolving
+        any of the unresolved components, a pyxb.NotInNamespaceError
+        exception is raised.
 
         @note: Do not invoke this until all top-level definitions for the
         namespace have been provided.  The resolution routines are entitled to
@@ -192,22 +267,41 @@ class _NamespaceResolution_mixin (pyxb.cscRoot):
         if not self.needsResolution():
             return True
         
-        while 0 < len(self.__unresolvedComponents):
+        stalled = False
+        while (0 < len(self.__unresolvedComponents)) or self.__dependentComponents:
+            if not self.__unresolvedComponents:
+                # Blocking components may have been resolved elsewhere,
+                # e.g. by resolution of a sibling namespace.
+                self.__wakeDependents([ _b for _b in self.__dependentComponents.keys() if _b.isResolved() ])
+            full_pass = False
+            if stalled or not self.__unresolvedComponents:
+                # Either nothing can make progress, or we don't know what the
+                # remaining components are waiting for.  Try everything.
+                self.__wakeDependents(self.__dependentComponents.keys())
+                full_pass = True
+
             # Save the list of unresolved objects, reset the list to capture
             # any new objects defined during resolution, and attempt the
             # resolution for everything that isn't resolved.
+            num_pending = self.__pendingCount()
             unresolved = self.__unresolvedComponents
             #print 'Looping for %d unresolved definitions: %s' % (len(unresolved), ' '.join([ str(_r) for _r in unresolved]))
             num_loops += 1
-            #assert num_loops < 18
             
             self.__unresolvedComponents = []
+            progressed = False
             for resolvable in unresolved:
                 # Attempt the resolution.
+                self.__resolveCallCount += 1
                 resolvable._resolve()
 
                 # Either we resolved it, or we queued it to try again later
-                assert resolvable.isResolved() or (resolvable in self.__unresolvedComponents), 'Lost resolvable %s' % (resolvable,)
+                assert resolvable.isResolved() or (resolvable is self.__lastQueued) or self.__isPending(resolvable), 'Lost resolvable %s' % (resolvable,)
+
+                if resolvable.isResolved():
+                    progressed = True
+                    if resolvable in self.__dependentComponents:
+                        self.__wakeDependents([ resolvable ])
 
                 # We only clone things that have scope None.  We never
                 # resolve things that have scope None.  Therefore, we
@@ -215,7 +309,8 @@ class _NamespaceResolution_mixin (pyxb.cscRoot):
                 # clones.
                 if (resolvable.isResolved() and (resolvable._clones() is not None)):
                     assert False
-            if self.__unresolvedComponents == unresolved:
+            stalled = (not progressed) and (self.__pendingCount() == num_pending)
+            if stalled and full_pass:
                 if allow_unresolved:
                     return False
                 # This only happens if we didn't code things right, or the
@@ -223,6 +318,7 @@ class _NamespaceResolution_mixin (pyxb.cscRoot):
                 # (i.e., the schema designer didn't do things right).
                 failed_components = []
                 import pyxb.xmlschema.structures
+                self.__wakeDependents(self.__dependentComponents.keys())
                 for d in self.__unresolvedComponents:
                     if isinstance(d, pyxb.xmlschema.structures._NamedComponent_mixin):
                         failed_components.append('%s named %s' % (d.__class__.__name__, d.name()))
@@ -232,9 +328,13 @@ class _NamespaceResolution_mixin (pyxb.cscRoot):
                         failed_components.append('Anonymous %s' % (d.__class__.__name__,))
                 raise pyxb.NotInNamespaceError('Infinite loop in resolution:\n  %s' % ("\n  ".join(failed_components),))
 
+        if _Resolvable_mixin._TraceResolution:
+            print 'Resolved %s in %d passes with %d resolution attempts' % (self, num_loops, self.__resolveCallCount)
+
         # Replace the list of unresolved components with None, so that
         # attempts to subsequently add another component fail.
         self.__unresolvedComponents = None
+        self.__dependentComponents = None
 
         # NOTE: Dependencies may require that we keep these around for a while
         # longer.
@@ -551,10 +651,10 @@ class NamespaceContext (object):
             namespace.validateComponentModel()
         return pyxb.namespace.ExpandedName(namespace, local_name)
 
-    def queueForResolution (self, component):
+    def queueForResolution (self, component, depends_on=None):
         """Forwards to L{queueForResolution()<Namespace.queueForResolution>} in L{targetNamespace()}."""
         assert isinstance(component, _Resolvable_mixin)
-        return self.targetNamespace().queueForResolution(component)
+        return self.targetNamespace().queueForResolution(component, depends_on)
 
 ## Local Variables:
 ## fill-column:78
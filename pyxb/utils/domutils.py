@@ -442,6 +442,13 @@ class BindingDOMSupport (object):
     __namespaceSupport = None
     __NamespaceSupport = _BDSNamespaceSupport()
 
+    def _namespaceSupport (self):
+        """The object that records the namespaces used in the document and
+        their prefixes.
+
+        @rtype: L{_BDSNamespaceSupport}"""
+        return self.__namespaceSupport
+
     # Namespace declarations required on the top element
     def defaultNamespace (self):
         """The default namespace for this instance"""
@@ -545,6 +552,377 @@ class BindingDOMSupport (object):
         element = self.__document.createElementNS(ns_uri, name)
         return parent.appendChild(element)
 
+    def createBindingElement (self, expanded_name, binding, parent, variant=None):
+        """Create the element that will hold the content of a binding
+        instance.
+
+        In this class, this is equivalent to L{createChildElement}.
+        Subclasses may instead emit a previously recorded serialization of
+        the binding, in which case C{None} is returned and no content should
+        be generated for the binding.
+
+        @param binding: The binding instance whose content the element holds
+        @param variant: Any other value that affects the serialization of
+        the element, such as whether an C{xsi:type} attribute is added
+        """
+        return self.createChildElement(expanded_name, parent)
+
+    def appendTextChild (self, text, parent):
+        """Add the text as the content of the parent node.
+
+        @param text: The text to be added
+        @type text: C{unicode}
+        @param parent: The element to which the text should be added
+        @type parent: C{xml.dom.Element}
+        """
+        return parent.appendChild(self.document().createTextNode(text))
+
+    def appendChild (self, child, parent):
+        """Add the DOM node as a child of the parent node.
+
+        @param child: A node from some DOM document, such as the value of a
+        wildcard element
+        @type child: C{xml.dom.Node}
+        @param parent: The element to which the node should be added
+        @type parent: C{xml.dom.Element}
+        """
+        return parent.appendChild(child)
+
+class _XMLWriterElement (object):
+    """An element for which L{BindingXMLWriter} has not yet written the
+    end tag."""
+
+    def __init__ (self, name, depth):
+        self.name = name
+        self.depth = depth
+        # List of (qualified name, value) pairs
+        self.attributes = []
+        # Text content not yet written
+        self.text = []
+        # Namespaces referenced in the start tag
+        self.namespaces = set()
+        # Namespaces declared in the start tag
+        self.declared = []
+        # True once the start tag has been written
+        self.started = False
+        # The _XMLFragment recording the serialization of the element
+        self.fragment = None
+
+class _XMLFragment (object):
+    """The serialization of the element holding a binding instance, as
+    recorded by L{BindingXMLWriter} for reuse in later documents."""
+
+    def __init__ (self, binding, key, namespace_count):
+        self.binding = binding
+        # The element name, variant, namespace prefix map, and namespaces in
+        # scope under which the fragment was produced
+        self.key = key
+        # Number of namespaces known to the writer when the fragment began
+        self.namespaceCount = namespace_count
+        # Text, and the _XMLFragment instances of child bindings
+        self.parts = []
+        self.__text = None
+
+    def text (self):
+        """Return the complete text of the fragment."""
+        if self.__text is None:
+            text = []
+            self.__flatten(text)
+            self.__text = ''.join(text)
+        return self.__text
+
+    def __flatten (self, text):
+        for p in self.parts:
+            if isinstance(p, _XMLFragment):
+                p.__flatten(text)
+            else:
+                text.append(p)
+
+class BindingXMLWriter (BindingDOMSupport):
+    """Support for writing the XML for a binding instance directly to a
+    file-like object, without creating a DOM document.
+
+    This can be used in place of a L{BindingDOMSupport} instance when
+    invoking L{toDOM<pyxb.binding.basis._TypeBinding_mixin.toDOM>}, which
+    returns C{None}; normally L{writexml
+    <pyxb.binding.basis._TypeBinding_mixin.writexml>} is used instead.
+
+    The start tag of an element is held until the first child element is
+    created or the element is complete, so attributes may be added after the
+    element is created.  Namespace prefixes are assigned as with
+    L{BindingDOMSupport}.  Namespaces known when the document element is
+    written (such as the default namespace and any that were
+    L{declared<declareNamespace>}) are declared on the document element;
+    others are declared on each element that requires them and is not
+    already within the scope of a declaration.  Attributes are written in
+    sorted order, so that for documents in which all namespaces are
+    declared on the document element, the output is the same as that of
+    C{toxml} on the corresponding DOM document.
+
+    If C{cache_fragments} is enabled, the text produced for the element
+    holding each complex type instance is recorded on that instance.  When
+    the instance is written again by any writer under the same element name
+    and namespace declarations, and neither it nor any of its descendants
+    has been modified, the recorded text is written without traversing the
+    instance."""
+
+    # Number of text fragments accumulated before writing to the output
+    _BufferedFragments = 512
+
+    def __init__ (self, output, encoding=None, xml_declaration=True, cache_fragments=False, **kw):
+        """Create a writer for a single document.
+
+        @param output: The object to which the document is written
+        @type output: An object with a C{write} method
+
+        @keyword encoding: If C{None} (default), C{unicode} text is written.
+        Otherwise, text is written encoded with the given encoding, which is
+        also named in the XML declaration.
+
+        @keyword xml_declaration: If C{True} (default), the document begins
+        with an XML declaration.
+
+        @keyword cache_fragments: If C{True}, record the serialization of
+        complex type instances, and reuse any that are still current.  The
+        default is C{False}.
+
+        Other keywords are passed to the L{BindingDOMSupport} constructor.
+        """
+        self.__output = output
+        self.__encoding = encoding
+        self.__xmlDeclaration = xml_declaration
+        self.__cacheFragments = cache_fragments
+        super(BindingXMLWriter, self).__init__(**kw)
+
+    def reset (self, **kw):
+        """Reset this instance to write a new document."""
+        super(BindingXMLWriter, self).reset(**kw)
+        self.__openElements = []
+        self.__inScope = set()
+        self.__buffer = []
+        # Fragments being recorded for open elements, innermost last
+        self.__captures = []
+        # Map from fragments to whether they may be reused
+        self.__fragmentCurrent = { }
+        if self.__xmlDeclaration:
+            if self.__encoding is None:
+                self.__buffer.append('<?xml version="1.0" ?>')
+            else:
+                self.__buffer.append('<?xml version="1.0" encoding="%s"?>' % (self.__encoding,))
+
+    def document (self):
+        """No document is created by this class."""
+        return None
+
+    @classmethod
+    def _Escape (cls, text):
+        """Escape text for use as character data or an attribute value,
+        in the same way as C{xml.dom.minidom}."""
+        return text.replace('&', '&amp;').replace('<', '&lt;').replace('"', '&quot;').replace('>', '&gt;')
+
+    def __write (self, text, fragment=None):
+        self.__buffer.append(text)
+        if self.__captures:
+            self.__captures[-1].parts.append(fragment or text)
+        if self._BufferedFragments <= len(self.__buffer):
+            self.__flush()
+
+    def __flush (self):
+        text = ''.join(self.__buffer)
+        self.__buffer = []
+        if self.__encoding is not None:
+            text = text.encode(self.__encoding)
+        if text:
+            self.__output.write(text)
+
+    def __qualifiedName (self, element, expanded_name):
+        if isinstance(expanded_name, (str, unicode)):
+            return expanded_name
+        namespace = expanded_name.namespace()
+        prefix = self.namespacePrefix(namespace)
+        if (namespace is not None) and not namespace.isAbsentNamespace():
+            element.namespaces.add(namespace)
+        if prefix is None:
+            return expanded_name.localName()
+        return '%s:%s' % (prefix, expanded_name.localName())
+
+    def namespacePrefix (self, namespace):
+        """Obtain the prefix for the given namespace.
+
+        The namespace is declared on the element whose start tag is being
+        constructed, if it is not already in scope."""
+        prefix = super(BindingXMLWriter, self).namespacePrefix(namespace)
+        if (prefix is not None) and self.__openElements:
+            element = self.__openElements[-1]
+            if not element.started:
+                element.namespaces.add(pyxb.namespace.NamespaceInstance(namespace))
+        return prefix
+
+    def __startElement (self, element):
+        # Write the start tag for the element, adding declarations for the
+        # namespaces it needs.
+        namespace_map = self._namespaceSupport().namespaces()
+        if 0 == element.depth:
+            declare = set(namespace_map.keys())
+            declare.update(element.namespaces)
+        else:
+            declare = element.namespaces.difference(self.__inScope)
+        attributes = element.attributes[:]
+        for ns in declare:
+            if ns in self.__inScope:
+                continue
+            prefix = namespace_map.get(ns)
+            if prefix is None:
+                attributes.append(('xmlns', ns.uri()))
+            else:
+                attributes.append(('xmlns:%s' % (prefix,), ns.uri()))
+            self.__inScope.add(ns)
+            element.declared.append(ns)
+        attributes.sort()
+        text = [ '<', element.name ]
+        for (name, value) in attributes:
+            text.append(' %s="%s"' % (name, self._Escape(value)))
+        self.__write(''.join(text))
+        element.started = True
+
+    def __endElement (self, element):
+        if not element.started:
+            self.__startElement(element)
+            if not element.text:
+                self.__write('/>')
+                self.__closed(element)
+                return
+            self.__write('>')
+        if element.text:
+            self.__write(self._Escape(''.join(element.text)))
+        self.__write('</%s>' % (element.name,))
+        self.__closed(element)
+
+    def __closed (self, element):
+        self.__inScope.difference_update(element.declared)
+        fragment = element.fragment
+        if fragment is not None:
+            assert fragment is self.__captures[-1]
+            self.__captures.pop()
+            if self.__captures:
+                self.__captures[-1].parts.append(fragment)
+            # A fragment that caused new namespace prefixes to be assigned
+            # cannot be reused, since doing so would not assign them.
+            if fragment.namespaceCount == len(self._namespaceSupport().namespaces()):
+                fragment.binding._setXMLFragment(fragment)
+                self.__fragmentCurrent[fragment] = True
+
+    def __isCurrent (self, fragment):
+        # True iff the fragment is still recorded on its binding, as are
+        # those of all its descendants.
+        rv = self.__fragmentCurrent.get(fragment)
+        if rv is None:
+            rv = True
+            for p in fragment.parts:
+                if isinstance(p, _XMLFragment) and not ((p.binding._xmlFragment() is p) and self.__isCurrent(p)):
+                    rv = False
+                    break
+            self.__fragmentCurrent[fragment] = rv
+        return rv
+
+    def __closeTo (self, depth):
+        # Write the end tags of all open elements deeper than depth
+        while depth < len(self.__openElements):
+            self.__endElement(self.__openElements.pop())
+
+    def __openParent (self, parent):
+        # Complete the children of the parent, then ensure its start tag is
+        # written so content may follow.
+        if parent is None:
+            self.__closeTo(0)
+            return 0
+        self.__closeTo(parent.depth + 1)
+        if not parent.started:
+            self.__startElement(parent)
+            self.__write('>')
+        if parent.text:
+            self.__write(self._Escape(''.join(parent.text)))
+            parent.text = []
+        return parent.depth + 1
+
+    def createChildElement (self, expanded_name, parent=None):
+        """Start a new element.
+
+        @param expanded_name: The name of the element.  A plain string
+        indicates a name in no namespace.
+        @type expanded_name: L{pyxb.namespace.ExpandedName} or C{str} or C{unicode}
+
+        @keyword parent: The element that will serve as the child's parent.
+        If C{None}, the element is the document element.
+
+        @return: An object representing the element, for use as the parent
+        of subsequent calls.
+        """
+        if isinstance(expanded_name, (str, unicode)):
+            expanded_name = pyxb.namespace.ExpandedName(None, expanded_name)
+        if not isinstance(expanded_name, pyxb.namespace.ExpandedName):
+            raise pyxb.LogicError('Invalid type %s for expanded name' % (type(expanded_name),))
+        depth = self.__openParent(parent)
+        element = _XMLWriterElement(None, depth)
+        element.name = self.__qualifiedName(element, expanded_name)
+        self.__openElements.append(element)
+        return element
+
+    def createBindingElement (self, expanded_name, binding, parent, variant=None):
+        """Start a new element holding the content of the binding.
+
+        If fragment caching is enabled and the binding holds a reusable
+        fragment, the fragment is written and C{None} is returned.
+        Otherwise, this is equivalent to L{createChildElement}."""
+        if not self.__cacheFragments:
+            return self.createChildElement(expanded_name, parent)
+        get_fragment = getattr(binding, '_xmlFragment', None)
+        if get_fragment is None:
+            return self.createChildElement(expanded_name, parent)
+        # Writing the start tag of the parent may add declarations, so do
+        # that before determining the context of this element.
+        self.__openParent(parent)
+        namespace_map = self._namespaceSupport().namespaces()
+        key = (expanded_name, variant, frozenset(namespace_map.items()), frozenset(self.__inScope))
+        namespace_count = len(namespace_map)
+        fragment = get_fragment()
+        if (fragment is not None) and (fragment.key == key) and self.__isCurrent(fragment):
+            self.__write(fragment.text(), fragment)
+            return None
+        element = self.createChildElement(expanded_name, parent)
+        element.fragment = _XMLFragment(binding, key, namespace_count)
+        self.__captures.append(element.fragment)
+        return element
+
+    def addAttribute (self, element, expanded_name, value):
+        """Add an attribute to the given element.
+
+        @raise pyxb.LogicError: the start tag of the element has already been
+        written
+        """
+        if element.started:
+            raise pyxb.LogicError('Cannot add attribute %s after content of element %s' % (expanded_name, element.name))
+        element.attributes.append( (self.__qualifiedName(element, expanded_name), value) )
+
+    def appendTextChild (self, text, parent):
+        """Add the text as the content of the parent element."""
+        self.__closeTo(parent.depth + 1)
+        parent.text.append(text)
+
+    def appendChild (self, child, parent):
+        """Write the DOM node as a child of the parent element."""
+        self.__openParent(parent)
+        self.__write(child.toxml())
+
+    def finalize (self):
+        """Write the end tags for all open elements, and any buffered text
+        to the output.
+
+        @return: C{None}"""
+        self.__closeTo(0)
+        self.__flush()
+        return None
+
 
 ## Local Variables:
 ## fill-column:78
@@ -74,14 +74,14 @@ class _DOMSAXHandler (saxutils.BaseSAXHandler):
         (this_state, parent_state, ns_ctx, name_en) = super(_DOMSAXHandler, self).startElementNS(name, qname, attrs)
         this_state.__attributes = NamedNodeMap()
         for name in attrs.getNames():
-            attr_en = pyxb.namespace.ExpandedName(name)
+            attr_en = saxutils.InternedExpandedName(name)
             value = attrs.getValue(name)
-            this_state.__attributes._addItem(Attr(expanded_name=attr_en, namespace_context=ns_ctx, value=value, location=this_state.location()))
+            this_state.__attributes._addItem(Attr(expanded_name=attr_en, namespace_context=ns_ctx, value=value, location=this_state.packedLocation()))
 
     def endElementNS (self, name, qname):
         this_state = super(_DOMSAXHandler, self).endElementNS(name, qname)
         ns_ctx = this_state.namespaceContext()
-        element = Element(namespace_context=ns_ctx, expanded_name=this_state.expandedName(), attributes=this_state.__attributes, location=this_state.location())
+        element = Element(namespace_context=ns_ctx, expanded_name=this_state.expandedName(), attributes=this_state.__attributes, location=this_state.packedLocation())
         for ( content, element_use, maybe_element ) in this_state.content():
             if isinstance(content, Node):
                 element.appendChild(content)
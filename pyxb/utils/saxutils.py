@@ -23,6 +23,8 @@ element in the stream.  These classes are extended for specific parsing needs
 
 import xml.sax
 import xml.sax.handler
+import xml.sax.saxutils
+import xml.parsers.expat
 import pyxb.namespace
 
 class TracingSAXHandler (xml.sax.handler.ContentHandler):
@@ -92,6 +94,37 @@ class _NoopSAXHandler (xml.sax.handler.ContentHandler):
         pass
 
 
+# Shared ExpandedName instances for names delivered by the parser.  The outer
+# map is keyed by the fallback namespace, the inner one by the (uri, local)
+# pair.
+_ExpandedNames = { }
+
+# The maximum number of names retained for each fallback namespace, so
+# documents with unbounded vocabularies cannot grow the cache indefinitely.
+_ExpandedNamesLimit = 8192
+
+def InternedExpandedName (name, fallback_namespace=None):
+    """Return the L{pyxb.namespace.ExpandedName} for a name as provided by a
+    namespace-aware SAX parser.
+
+    Instances are shared, so repeated names in a document cost a dictionary
+    lookup rather than construction of a new instance.
+
+    @param name: A C{(namespaceURI, localName)} pair
+    @param fallback_namespace: As with L{pyxb.namespace.ExpandedName}
+    @rtype: L{pyxb.namespace.ExpandedName}
+    """
+    names = _ExpandedNames.get(fallback_namespace)
+    if names is None:
+        names = _ExpandedNames.setdefault(fallback_namespace, { })
+    expanded_name = names.get(name)
+    if expanded_name is None:
+        if len(names) >= _ExpandedNamesLimit:
+            names.clear()
+        expanded_name = pyxb.namespace.ExpandedName(name, fallback_namespace=fallback_namespace)
+        names[name] = expanded_name
+    return expanded_name
+
 class SAXElementState (object):
     """State corresponding to processing a given element with the SAX
     model."""
@@ -116,7 +149,17 @@ class SAXElementState (object):
 
     def location (self):
         """The L{location<pyxb.utils.utility.Location>} corresponding to the
-        element event."""
+        element event, or C{None} if locations are not being tracked."""
+        location = self.__location
+        if isinstance(location, (int, long)):
+            location = pyxb.utils.utility.Location.Unpack(location)
+        return location
+
+    def packedLocation (self):
+        """The location of the element event in the compact form produced by
+        L{pyxb.utils.utility.Location.packedLocation}, or C{None} if
+        locations are not being tracked.  This is the value that should be
+        recorded in L{pyxb.utils.utility.Locatable_mixin} instances."""
         return self.__location
     __location = None
 
@@ -167,7 +210,8 @@ class BaseSAXHandler (xml.sax.handler.ContentHandler, object):
     """
 
     # An instance of L{pyxb.utils.utility.Location} that will be used to
-    # construct the locations of events as they are received.
+    # construct the locations of events as they are received, or None if
+    # locations are not tracked.
     __locationTemplate = None
 
     # The callable that creates an instance of (a subclass of)
@@ -179,11 +223,10 @@ class BaseSAXHandler (xml.sax.handler.ContentHandler, object):
     # namespace.
     __fallbackNamespace = None
 
-    # The namespace context that will be in effect at the start of the
-    # next element.  One of these is allocated at the start of each
-    # element; it moves to become the current namespace upon receipt
-    # of either the next element start or a namespace directive that
-    # will apply at that element start.
+    # The namespace context that will be in effect at the start of the next
+    # element, if that differs from the current one.  Contexts are only
+    # allocated when a namespace directive changes the scope; otherwise an
+    # element shares the context of its parent.
     __nextNamespaceContext = None
 
     # The namespace context that is in effect for this element.
@@ -232,7 +275,9 @@ class BaseSAXHandler (xml.sax.handler.ContentHandler, object):
                                                                              target_namespace=self.__targetNamespace,
                                                                              including_context=self.__includingContext,
                                                                              finalize_target_namespace=False)
-        self.__nextNamespaceContext = None
+        # The document-level context belongs to the document element, so
+        # namespace directives on that element update it directly.
+        self.__nextNamespaceContext = self.__namespaceContext
         self.__elementState = self.__elementStateConstructor(namespace_context=self.__namespaceContext)
         self.__elementStateStack = []
         self.__rootObject = None
@@ -259,20 +304,25 @@ class BaseSAXHandler (xml.sax.handler.ContentHandler, object):
         @keyword location_base: An object to be recorded as the base of all
         L{pyxb.utils.utility.Location} instances associated with events and
         objects handled by the parser.
+
+        @keyword track_locations: If C{False}, no locations are recorded for
+        events and objects handled by the parser.  The default is the value
+        of L{pyxb.TrackLocationsWhenParsing}.
         """
         self.__includingContext = kw.pop('including_context', None)
         self.__fallbackNamespace = kw.pop('fallback_namespace', None)
         self.__elementStateConstructor = kw.pop('element_state_constructor', SAXElementState)
         self.__targetNamespace = kw.pop('target_namespace', None)
-        self.__locationTemplate = pyxb.utils.utility.Location(kw.pop('location_base', None))
-
-    # If there's a new namespace waiting to be used, make it the
-    # current namespace.  Return the current namespace.
-    def __updateNamespaceContext (self):
-        if self.__nextNamespaceContext is not None:
-            self.__namespaceContext = self.__nextNamespaceContext
-            self.__nextNamespaceContext = None
-        return self.__namespaceContext
+        location_base = kw.pop('location_base', None)
+        if kw.pop('track_locations', pyxb._ParsingTracksLocations):
+            self.__locationTemplate = pyxb.utils.utility.Location(location_base)
+
+    # Return the context for the next element, creating one that inherits
+    # from the current context if the next element would otherwise share it.
+    def __newNamespaceContext (self):
+        if self.__nextNamespaceContext is None:
+            self.__nextNamespaceContext = pyxb.namespace.resolution.NamespaceContext(parent_context=self.__namespaceContext)
+        return self.__nextNamespaceContext
 
     def setDocumentLocator (self, locator):
         """Save the locator object."""
@@ -291,7 +341,7 @@ class BaseSAXHandler (xml.sax.handler.ContentHandler, object):
 
         @note: For this to be invoked, the C{feature_namespaces} feature must
         be enabled in the SAX parser."""
-        self.__updateNamespaceContext().processXMLNS(prefix, uri)
+        self.__newNamespaceContext().processXMLNS(prefix, uri)
         #print '%s PM %s %s' % (self.__namespaceContext, prefix, uri)
 
     # The NamespaceContext management does not require any action upon
@@ -303,29 +353,36 @@ class BaseSAXHandler (xml.sax.handler.ContentHandler, object):
         """Process the start of an element."""
         self.__flushPendingText()
 
-        # Get the context to be used for this element, and create a
-        # new context for the next contained element to be found.
-        ns_ctx = self.__updateNamespaceContext()
-
         # Get the element name, which is already a tuple with the namespace assigned.
-        expanded_name = pyxb.namespace.ExpandedName(name, fallback_namespace=self.__fallbackNamespace)
+        expanded_name = InternedExpandedName(name, self.__fallbackNamespace)
 
+        # Get the context to be used for this element.  Unless it must
+        # differ from that of the enclosing element, it is shared.
         tns_attr = pyxb.namespace.resolution.NamespaceContext._TargetNamespaceAttribute(expanded_name)
         if tns_attr is not None:
+            ns_ctx = self.__newNamespaceContext()
             # Not true for wsdl
             #assert ns_ctx.targetNamespace() is None
             ns_ctx.finalizeTargetNamespace(attrs.get(tns_attr.uriTuple()), including_context=self.__includingContext)
             assert ns_ctx.targetNamespace() is not None
-        self.__nextNamespaceContext = pyxb.namespace.resolution.NamespaceContext(parent_context=ns_ctx)
+        else:
+            ns_ctx = self.__nextNamespaceContext
+            if ns_ctx is None:
+                ns_ctx = self.__namespaceContext
+        self.__namespaceContext = ns_ctx
+        self.__nextNamespaceContext = None
 
         # Save the state of the enclosing element, and create a new
         # state for this element.
+        location = None
+        if self.__locationTemplate is not None:
+            location = self.__locationTemplate.packedLocation(self.__locator)
         parent_state = self.__elementState
         self.__elementStateStack.append(self.__elementState)
         self.__elementState = this_state = self.__elementStateConstructor(expanded_name=expanded_name,
                                                                           namespace_context=ns_ctx,
                                                                           parent_state=parent_state,
-                                                                          location=self.__locationTemplate.newLocation(self.__locator))
+                                                                          location=location)
         return (this_state, parent_state, ns_ctx, expanded_name)
 
     def endElementNS (self, name, qname):
@@ -363,6 +420,162 @@ class BaseSAXHandler (xml.sax.handler.ContentHandler, object):
     def processingInstruction (self, target, data):
         self.__flushPendingText()
 
+class _ExpatAttributes (dict):
+    """A map from C{(namespaceURI, localName)} pairs to attribute values
+    that provides the subset of the C{xml.sax.xmlreader.AttributesNS}
+    interface used by the PyXB handlers."""
+    getNames = dict.keys
+    getValue = dict.__getitem__
+
+class _ExpatLocator (object):
+    """Provide the C{xml.sax.xmlreader.Locator} interface for a
+    L{DirectExpatParser}."""
+    def __init__ (self, reader):
+        self.__reader = reader
+
+    def getColumnNumber (self):
+        return self.__reader._expatParser().CurrentColumnNumber
+
+    def getLineNumber (self):
+        return self.__reader._expatParser().CurrentLineNumber
+
+    def getPublicId (self):
+        return None
+
+    def getSystemId (self):
+        return self.__reader._systemId()
+
+class DirectExpatParser (object):
+    """A parser that delivers events from C{xml.parsers.expat} directly to a
+    SAX content handler.
+
+    This provides the subset of the C{xml.sax.xmlreader.IncrementalParser}
+    interface that PyXB uses, with the namespace features configured as
+    L{make_parser} requires.  Compared with the C{xml.sax} expat reader, it
+    avoids a layer of Python calls per event: names are split into C{(uri,
+    local)} pairs through a cache, attributes are delivered in a plain
+    dictionary, text is buffered by expat, and namespace declarations,
+    character data, and processing instructions are dispatched straight to
+    the handler methods.
+    """
+
+    # The separator expat places between the namespace URI and the local
+    # name.  Space cannot appear in either.
+    __NamespaceSeparator = ' '
+
+    # The size of the blocks read when parsing a stream
+    __ReadSize = 64 * 1024
+
+    # Attributes of elements that have none.  Handlers do not modify the
+    # attributes they are given.
+    __NoAttributes = _ExpatAttributes()
+
+    def __init__ (self):
+        self.__contentHandler = None
+        self.__expatParser = None
+        self.__systemId = None
+        self.__locator = _ExpatLocator(self)
+        # Map from names as expat presents them to (uri, local) pairs
+        self.__names = {}
+
+    def getContentHandler (self):
+        return self.__contentHandler
+
+    def setContentHandler (self, handler):
+        self.__contentHandler = handler
+
+    def setEntityResolver (self, resolver):
+        """External entities are never read, so the resolver is not used."""
+        pass
+
+    def _expatParser (self):
+        return self.__expatParser
+
+    def _systemId (self):
+        return self.__systemId
+
+    def __splitName (self, name):
+        rv = self.__names.get(name)
+        if rv is None:
+            parts = name.split(self.__NamespaceSeparator, 1)
+            if 1 == len(parts):
+                rv = (None, name)
+            else:
+                rv = tuple(parts)
+            self.__names[name] = rv
+        return rv
+
+    def __startElement (self, name, attrs):
+        if attrs:
+            split_name = self.__splitName
+            attributes = _ExpatAttributes()
+            for (attr_name, value) in attrs.iteritems():
+                attributes[split_name(attr_name)] = value
+        else:
+            attributes = self.__NoAttributes
+        self.__contentHandler.startElementNS(self.__splitName(name), None, attributes)
+
+    def __endElement (self, name):
+        self.__contentHandler.endElementNS(self.__splitName(name), None)
+
+    def __startDocument (self):
+        handler = self.__contentHandler
+        parser = xml.parsers.expat.ParserCreate(namespace_separator=self.__NamespaceSeparator)
+        parser.buffer_text = True
+        parser.StartElementHandler = self.__startElement
+        parser.EndElementHandler = self.__endElement
+        parser.StartNamespaceDeclHandler = handler.startPrefixMapping
+        parser.CharacterDataHandler = handler.characters
+        parser.ProcessingInstructionHandler = handler.processingInstruction
+        if self.__systemId is not None:
+            parser.SetBase(self.__systemId)
+        self.__expatParser = parser
+        handler.setDocumentLocator(self.__locator)
+        handler.startDocument()
+
+    def __parse (self, data, is_final=False):
+        try:
+            self.__expatParser.Parse(data, is_final)
+        except xml.parsers.expat.ExpatError, e:
+            exc = xml.sax.SAXParseException(xml.parsers.expat.ErrorString(e.code), e, self.__locator)
+            # Expat cannot continue after an error; start over on the next
+            # feed.
+            self.__expatParser = None
+            raise exc
+
+    def feed (self, data):
+        """Parse the next block of the document."""
+        if self.__expatParser is None:
+            self.__startDocument()
+        self.__parse(data)
+
+    def close (self):
+        """Complete the document.  The parser may then be used for a new
+        document."""
+        if self.__expatParser is None:
+            self.__startDocument()
+        self.__parse('', True)
+        self.__contentHandler.endDocument()
+        self.__expatParser = None
+        self.__systemId = None
+
+    def parse (self, source):
+        """Parse a complete document.
+
+        @param source: A file-like object, a system identifier, or an
+        C{xml.sax.xmlreader.InputSource}.
+        """
+        source = xml.sax.saxutils.prepare_input_source(source)
+        self.__systemId = source.getSystemId()
+        stream = source.getByteStream()
+        self.__expatParser = None
+        while True:
+            data = stream.read(self.__ReadSize)
+            if not data:
+                break
+            self.feed(data)
+        self.close()
+
 import StringIO
 class _EntityResolver (object):
     """Dummy used to prevent the SAX parser from crashing when it sees
@@ -399,14 +612,20 @@ def make_parser (*args, **kw):
     L{pyxb.namespace.ExpandedName}.  This keyword is not used by this
     function, but is passed to the C{content_handler_constructor}.
     @type fallback_namespace: L{pyxb.namespace.Namespace}
+
+    If no arguments are provided and the XML style is
+    L{pyxb.XMLStyle_expat}, the parser is a L{DirectExpatParser}.
     """
     content_handler_constructor = kw.pop('content_handler_constructor', BaseSAXHandler)
     content_handler = kw.pop('content_handler', None)
     if content_handler is None:
         content_handler = content_handler_constructor(**kw)
-    parser = xml.sax.make_parser(*args)
-    parser.setFeature(xml.sax.handler.feature_namespaces, True)
-    parser.setFeature(xml.sax.handler.feature_namespace_prefixes, False)
+    if (0 == len(args)) and (pyxb.XMLStyle_expat == pyxb._XMLStyle):
+        parser = DirectExpatParser()
+    else:
+        parser = xml.sax.make_parser(*args)
+        parser.setFeature(xml.sax.handler.feature_namespaces, True)
+        parser.setFeature(xml.sax.handler.feature_namespace_prefixes, False)
     parser.setContentHandler(content_handler)
     parser.setEntityResolver(_EntityResolver())
     return parser
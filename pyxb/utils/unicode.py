@@ -41,6 +41,7 @@ except:
     pass
 
 import bisect
+import UserDict
         
 class CodePointSetError (LookupError):
     """Raised when some abuse of a L{CodePointSet} is detected."""
@@ -159,7 +160,7 @@ class CodePointSet (object):
 
         @return: C{self}"""
         if isinstance(values, CodePointSet):
-            self.extend(values.asTuples())
+            [ self.__mutate(_v, True) for _v in values.__ranges() ]
         else:
             [ self.__mutate(_v, True) for _v in values ]
         return self
@@ -173,7 +174,7 @@ class CodePointSet (object):
 
         @return: C{self}"""
         if isinstance(value, CodePointSet):
-            [ self.subtract(_v) for _v in value.asTuples() ]
+            [ self.__mutate(_v, False) for _v in value.__ranges() ]
             return self
         return self.__mutate(value, False)
 
@@ -208,24 +209,22 @@ class CodePointSet (object):
             rva.append(u']')
         return u''.join(rva)
 
+    # Generate the (inclusive) ranges in the set without building an
+    # intermediate list
+    def __ranges (self):
+        cps = self.__codepoints
+        for ri in xrange(0, len(cps) - 1, 2):
+            yield (cps[ri], cps[ri+1]-1)
+        if len(cps) & 1:
+            yield (cps[-1], self.MaxCodePoint)
+
     def asTuples (self):
         """Return the codepoints as tuples denoting the ranges that are in
         the set.
 
         Each tuple C{(s, e)} indicates that the code points from C{s}
         (inclusive) to C{e}) (inclusive) are in the set."""
-        
-        rv = []
-        start = None
-        for ri in xrange(len(self.__codepoints)):
-            if start is not None:
-                rv.append( (start, self.__codepoints[ri]-1) )
-                start = None
-            else:
-                start = self.__codepoints[ri]
-        if start is not None:
-            rv.append( (start, self.MaxCodePoint) )
-        return rv
+        return list(self.__ranges())
 
     def negate (self):
         """Return an instance that represents the inverse of this set."""
@@ -244,7 +243,59 @@ class CodePointSet (object):
             raise CodePointSetError('CodePointSet does not represent single character')
         return unichr(self.__codepoints[0])
 
-from unicode_data import *
+class _CodePointSetMap (UserDict.DictMixin):
+    """A read-only map from names to L{CodePointSet} instances.
+
+    The set for a name is not built until it is first looked up; it is
+    retained for subsequent lookups.  The source of the sets is a
+    callable, invoked on first use, that returns a map from each name
+    to either a sequence of code point ranges suitable for
+    L{CodePointSet.extend}, or a callable that returns the set."""
+
+    def __init__ (self, source):
+        self.__source = source
+        self.__sourceMap = None
+        self.__cache = { }
+
+    def __sources (self):
+        if self.__sourceMap is None:
+            self.__sourceMap = self.__source()
+        return self.__sourceMap
+
+    def __getitem__ (self, key):
+        cps = self.__cache.get(key)
+        if cps is None:
+            source = self.__sources()[key]
+            if callable(source):
+                cps = source()
+            else:
+                cps = CodePointSet().extend(source)
+            self.__cache[key] = cps
+        return cps
+
+    def __contains__ (self, key):
+        return key in self.__sources()
+
+    def __iter__ (self):
+        return iter(self.__sources())
+
+    def __len__ (self):
+        return len(self.__sources())
+
+    def keys (self):
+        return self.__sources().keys()
+
+def _UnicodeData (name):
+    import unicode_data
+    return getattr(unicode_data, name)
+
+BlockMap = _CodePointSetMap(lambda: _UnicodeData('BlockRanges'))
+"""Map from Unicode block names (without the C{Is} prefix) to the
+corresponding L{CodePointSet}."""
+
+PropertyMap = _CodePointSetMap(lambda: _UnicodeData('PropertyRanges'))
+"""Map from Unicode general category names to the corresponding
+L{CodePointSet}."""
 
 # Some of the MultiCharEsc classes refer to the U{NameChar
 # <http://www.w3.org/TR/REC-xml/#NT-NameChar>} production for base
@@ -287,14 +338,14 @@ for c in r'\|.-^?*+{}()[]':
 
 # Production 37 : Multi-Character Escapes
 WildcardEsc = CodePointSet(ord('\n'), ord('\r')).negate()
-MultiCharEsc = { }
-MultiCharEsc['s'] = CodePointSet(0x20, ord('\t'), ord('\n'), ord('\r'))
-MultiCharEsc['S'] = MultiCharEsc['s'].negate()
-MultiCharEsc['i'] = _NameStartChar
-MultiCharEsc['I'] = MultiCharEsc['i'].negate()
-MultiCharEsc['c'] = _NameChar
-MultiCharEsc['C'] = MultiCharEsc['c'].negate()
-MultiCharEsc['d'] = PropertyMap['Nd']
-MultiCharEsc['D'] = MultiCharEsc['d'].negate()
-MultiCharEsc['W'] = CodePointSet(PropertyMap['P']).extend(PropertyMap['Z']).extend(PropertyMap['C'])
-MultiCharEsc['w'] = MultiCharEsc['W'].negate()
+MultiCharEsc = _CodePointSetMap(lambda: {
+    's' : lambda: CodePointSet(0x20, ord('\t'), ord('\n'), ord('\r')),
+    'S' : lambda: MultiCharEsc['s'].negate(),
+    'i' : lambda: _NameStartChar,
+    'I' : lambda: MultiCharEsc['i'].negate(),
+    'c' : lambda: _NameChar,
+    'C' : lambda: MultiCharEsc['c'].negate(),
+    'd' : lambda: PropertyMap['Nd'],
+    'D' : lambda: MultiCharEsc['d'].negate(),
+    'W' : lambda: CodePointSet(PropertyMap['P']).extend(PropertyMap['Z']).extend(PropertyMap['C']),
+    'w' : lambda: MultiCharEsc['W'].negate() })
@@ -1,330 +1,329 @@
-# Unicode property and category maps.
-
-from unicode import CodePointSet
+# Unicode property and category code point ranges.  This module is
+# loaded on demand by pyxb.utils.unicode; do not import it directly.
 
 # Unicode code blocks: 96 blocks
-BlockMap = {
-  'AlphabeticPresentationForms' : CodePointSet(
+BlockRanges = {
+  'AlphabeticPresentationForms' : (
      (0x00fb00, 0x00fb4f),
   ),
-  'Arabic' : CodePointSet(
+  'Arabic' : (
      (0x000600, 0x0006ff),
   ),
-  'ArabicPresentationForms-A' : CodePointSet(
+  'ArabicPresentationForms-A' : (
      (0x00fb50, 0x00fdff),
   ),
-  'ArabicPresentationForms-B' : CodePointSet(
+  'ArabicPresentationForms-B' : (
      (0x00fe70, 0x00fefe),
   ),
-  'Armenian' : CodePointSet(
+  'Armenian' : (
      (0x000530, 0x00058f),
   ),
-  'Arrows' : CodePointSet(
+  'Arrows' : (
      (0x002190, 0x0021ff),
   ),
-  'BasicLatin' : CodePointSet(
+  'BasicLatin' : (
      (0x000000, 0x00007f),
   ),
-  'Bengali' : CodePointSet(
+  'Bengali' : (
      (0x000980, 0x0009ff),
   ),
-  'BlockElements' : CodePointSet(
+  'BlockElements' : (
      (0x002580, 0x00259f),
   ),
-  'Bopomofo' : CodePointSet(
+  'Bopomofo' : (
      (0x003100, 0x00312f),
   ),
-  'BopomofoExtended' : CodePointSet(
+  'BopomofoExtended' : (
      (0x0031a0, 0x0031bf),
   ),
-  'BoxDrawing' : CodePointSet(
+  'BoxDrawing' : (
      (0x002500, 0x00257f),
   ),
-  'BraillePatterns' : CodePointSet(
+  'BraillePatterns' : (
      (0x002800, 0x0028ff),
   ),
-  'ByzantineMusicalSymbols' : CodePointSet(
+  'ByzantineMusicalSymbols' : (
      (0x01d000, 0x01d0ff),
   ),
-  'CJKCompatibility' : CodePointSet(
+  'CJKCompatibility' : (
      (0x003300, 0x0033ff),
   ),
-  'CJKCompatibilityForms' : CodePointSet(
+  'CJKCompatibilityForms' : (
      (0x00fe30, 0x00fe4f),
   ),
-  'CJKCompatibilityIdeographs' : CodePointSet(
+  'CJKCompatibilityIdeographs' : (
      (0x00f900, 0x00faff),
   ),
-  'CJKCompatibilityIdeographsSupplement' : CodePointSet(
+  'CJKCompatibilityIdeographsSupplement' : (
      (0x02f800, 0x02fa1f),
   ),
-  'CJKRadicalsSupplement' : CodePointSet(
+  'CJKRadicalsSupplement' : (
      (0x002e80, 0x002eff),
   ),
-  'CJKSymbolsandPunctuation' : CodePointSet(
+  'CJKSymbolsandPunctuation' : (
      (0x003000, 0x00303f),
   ),
-  'CJKUnifiedIdeographs' : CodePointSet(
+  'CJKUnifiedIdeographs' : (
      (0x004e00, 0x009fff),
   ),
-  'CJKUnifiedIdeographsExtensionA' : CodePointSet(
+  'CJKUnifiedIdeographsExtensionA' : (
      (0x003400, 0x004db5),
   ),
-  'CJKUnifiedIdeographsExtensionB' : CodePointSet(
+  'CJKUnifiedIdeographsExtensionB' : (
      (0x020000, 0x02a6d6),
   ),
-  'Cherokee' : CodePointSet(
+  'Cherokee' : (
      (0x0013a0, 0x0013ff),
   ),
-  'CombiningDiacriticalMarks' : CodePointSet(
+  'CombiningDiacriticalMarks' : (
      (0x000300, 0x00036f),
   ),
-  'CombiningHalfMarks' : CodePointSet(
+  'CombiningHalfMarks' : (
      (0x00fe20, 0x00fe2f),
   ),
-  'CombiningMarksforSymbols' : CodePointSet(
+  'CombiningMarksforSymbols' : (
      (0x0020d0, 0x0020ff),
   ),
-  'ControlPictures' : CodePointSet(
+  'ControlPictures' : (
      (0x002400, 0x00243f),
   ),
-  'CurrencySymbols' : CodePointSet(
+  'CurrencySymbols' : (
      (0x0020a0, 0x0020cf),
   ),
-  'Cyrillic' : CodePointSet(
+  'Cyrillic' : (
      (0x000400, 0x0004ff),
   ),
-  'Deseret' : CodePointSet(
+  'Deseret' : (
      (0x010400, 0x01044f),
   ),
-  'Devanagari' : CodePointSet(
+  'Devanagari' : (
      (0x000900, 0x00097f),
   ),
-  'Dingbats' : CodePointSet(
+  'Dingbats' : (
      (0x002700, 0x0027bf),
   ),
-  'EnclosedAlphanumerics' : CodePointSet(
+  'EnclosedAlphanumerics' : (
      (0x002460, 0x0024ff),
   ),
-  'EnclosedCJKLettersandMonths' : CodePointSet(
+  'EnclosedCJKLettersandMonths' : (
      (0x003200, 0x0032ff),
   ),
-  'Ethiopic' : CodePointSet(
+  'Ethiopic' : (
      (0x001200, 0x00137f),
   ),
-  'GeneralPunctuation' : CodePointSet(
+  'GeneralPunctuation' : (
      (0x002000, 0x00206f),
   ),
-  'GeometricShapes' : CodePointSet(
+  'GeometricShapes' : (
      (0x0025a0, 0x0025ff),
   ),
-  'Georgian' : CodePointSet(
+  'Georgian' : (
      (0x0010a0, 0x0010ff),
   ),
-  'Gothic' : CodePointSet(
+  'Gothic' : (
      (0x010330, 0x01034f),
   ),
-  'Greek' : CodePointSet(
+  'Greek' : (
      (0x000370, 0x0003ff),
   ),
-  'GreekExtended' : CodePointSet(
+  'GreekExtended' : (
      (0x001f00, 0x001fff),
   ),
-  'Gujarati' : CodePointSet(
+  'Gujarati' : (
      (0x000a80, 0x000aff),
   ),
-  'Gurmukhi' : CodePointSet(
+  'Gurmukhi' : (
      (0x000a00, 0x000a7f),
   ),
-  'HalfwidthandFullwidthForms' : CodePointSet(
+  'HalfwidthandFullwidthForms' : (
      (0x00ff00, 0x00ffef),
   ),
-  'HangulCompatibilityJamo' : CodePointSet(
+  'HangulCompatibilityJamo' : (
      (0x003130, 0x00318f),
   ),
-  'HangulJamo' : CodePointSet(
+  'HangulJamo' : (
      (0x001100, 0x0011ff),
   ),
-  'HangulSyllables' : CodePointSet(
+  'HangulSyllables' : (
      (0x00ac00, 0x00d7a3),
   ),
-  'Hebrew' : CodePointSet(
+  'Hebrew' : (
      (0x000590, 0x0005ff),
   ),
-  'HighPrivateUseSurrogates' : CodePointSet(
+  'HighPrivateUseSurrogates' : (
      (0x00db80, 0x00dbff),
   ),
-  'HighSurrogates' : CodePointSet(
+  'HighSurrogates' : (
      (0x00d800, 0x00db7f),
   ),
-  'Hiragana' : CodePointSet(
+  'Hiragana' : (
      (0x003040, 0x00309f),
   ),
-  'IPAExtensions' : CodePointSet(
+  'IPAExtensions' : (
      (0x000250, 0x0002af),
   ),
-  'IdeographicDescriptionCharacters' : CodePointSet(
+  'IdeographicDescriptionCharacters' : (
      (0x002ff0, 0x002fff),
   ),
-  'Kanbun' : CodePointSet(
+  'Kanbun' : (
      (0x003190, 0x00319f),
   ),
-  'KangxiRadicals' : CodePointSet(
+  'KangxiRadicals' : (
      (0x002f00, 0x002fdf),
   ),
-  'Kannada' : CodePointSet(
+  'Kannada' : (
      (0x000c80, 0x000cff),
   ),
-  'Katakana' : CodePointSet(
+  'Katakana' : (
      (0x0030a0, 0x0030ff),
   ),
-  'Khmer' : CodePointSet(
+  'Khmer' : (
      (0x001780, 0x0017ff),
   ),
-  'Lao' : CodePointSet(
+  'Lao' : (
      (0x000e80, 0x000eff),
   ),
-  'Latin-1Supplement' : CodePointSet(
+  'Latin-1Supplement' : (
      (0x000080, 0x0000ff),
   ),
-  'LatinExtended-A' : CodePointSet(
+  'LatinExtended-A' : (
      (0x000100, 0x00017f),
   ),
-  'LatinExtended-B' : CodePointSet(
+  'LatinExtended-B' : (
      (0x000180, 0x00024f),
   ),
-  'LatinExtendedAdditional' : CodePointSet(
+  'LatinExtendedAdditional' : (
      (0x001e00, 0x001eff),
   ),
-  'LetterlikeSymbols' : CodePointSet(
+  'LetterlikeSymbols' : (
      (0x002100, 0x00214f),
   ),
-  'LowSurrogates' : CodePointSet(
+  'LowSurrogates' : (
      (0x00dc00, 0x00dfff),
   ),
-  'Malayalam' : CodePointSet(
+  'Malayalam' : (
      (0x000d00, 0x000d7f),
   ),
-  'MathematicalAlphanumericSymbols' : CodePointSet(
+  'MathematicalAlphanumericSymbols' : (
      (0x01d400, 0x01d7ff),
   ),
-  'MathematicalOperators' : CodePointSet(
+  'MathematicalOperators' : (
      (0x002200, 0x0022ff),
   ),
-  'MiscellaneousSymbols' : CodePointSet(
+  'MiscellaneousSymbols' : (
      (0x002600, 0x0026ff),
   ),
-  'MiscellaneousTechnical' : CodePointSet(
+  'MiscellaneousTechnical' : (
      (0x002300, 0x0023ff),
   ),
-  'Mongolian' : CodePointSet(
+  'Mongolian' : (
      (0x001800, 0x0018af),
   ),
-  'MusicalSymbols' : CodePointSet(
+  'MusicalSymbols' : (
      (0x01d100, 0x01d1ff),
   ),
-  'Myanmar' : CodePointSet(
+  'Myanmar' : (
      (0x001000, 0x00109f),
   ),
-  'NumberForms' : CodePointSet(
+  'NumberForms' : (
      (0x002150, 0x00218f),
   ),
-  'Ogham' : CodePointSet(
+  'Ogham' : (
      (0x001680, 0x00169f),
   ),
-  'OldItalic' : CodePointSet(
+  'OldItalic' : (
      (0x010300, 0x01032f),
   ),
-  'OpticalCharacterRecognition' : CodePointSet(
+  'OpticalCharacterRecognition' : (
      (0x002440, 0x00245f),
   ),
-  'Oriya' : CodePointSet(
+  'Oriya' : (
      (0x000b00, 0x000b7f),
   ),
-  'PrivateUse' : CodePointSet(
+  'PrivateUse' : (
      (0x00e000, 0x00f8ff), (0x0f0000, 0x0ffffd), (0x100000, 0x10fffd),
   ),
-  'Runic' : CodePointSet(
+  'Runic' : (
      (0x0016a0, 0x0016ff),
   ),
-  'Sinhala' : CodePointSet(
+  'Sinhala' : (
      (0x000d80, 0x000dff),
   ),
-  'SmallFormVariants' : CodePointSet(
+  'SmallFormVariants' : (
      (0x00fe50, 0x00fe6f),
   ),
-  'SpacingModifierLetters' : CodePointSet(
+  'SpacingModifierLetters' : (
      (0x0002b0, 0x0002ff),
   ),
-  'Specials' : CodePointSet(
+  'Specials' : (
      (0x00feff, 0x00feff), (0x00fff0, 0x00fffd),
   ),
-  'SuperscriptsandSubscripts' : CodePointSet(
+  'SuperscriptsandSubscripts' : (
      (0x002070, 0x00209f),
   ),
-  'Syriac' : CodePointSet(
+  'Syriac' : (
      (0x000700, 0x00074f),
   ),
-  'Tags' : CodePointSet(
+  'Tags' : (
      (0x0e0000, 0x0e007f),
   ),
-  'Tamil' : CodePointSet(
+  'Tamil' : (
      (0x000b80, 0x000bff),
   ),
-  'Telugu' : CodePointSet(
+  'Telugu' : (
      (0x000c00, 0x000c7f),
   ),
-  'Thaana' : CodePointSet(
+  'Thaana' : (
      (0x000780, 0x0007bf),
   ),
-  'Thai' : CodePointSet(
+  'Thai' : (
      (0x000e00, 0x000e7f),
   ),
-  'Tibetan' : CodePointSet(
+  'Tibetan' : (
      (0x000f00, 0x000fff),
   ),
-  'UnifiedCanadianAboriginalSyllabics' : CodePointSet(
+  'UnifiedCanadianAboriginalSyllabics' : (
      (0x001400, 0x00167f),
   ),
-  'YiRadicals' : CodePointSet(
+  'YiRadicals' : (
      (0x00a490, 0x00a4cf),
   ),
-  'YiSyllables' : CodePointSet(
+  'YiSyllables' : (
      (0x00a000, 0x00a48f),
   ),
   }
 # Unicode general category properties: 36 properties
-PropertyMap = {
+PropertyRanges = {
   # C: 200 codepoint markers (*not* codepoints)
-  'C'  : CodePointSet([
+  'C'  : (
            (0x000000, 0x00001f), (0x00007f, 0x00009f), (0x00070f, 0x00070f),
            (0x00180b, 0x00180e), (0x00200c, 0x00200f), (0x00202a, 0x00202e),
            (0x00206a, 0x00206f), (0x00d800, 0x00db7f), (0x00db80, 0x00dbff),
            (0x00dc00, 0x00dfff), (0x00e000, 0x00f8ff), (0x00feff, 0x00feff),
            (0x00fff9, 0x00fffb), (0x01d173, 0x01d17a), (0x0e0001, 0x0e0001),
            (0x0e0020, 0x0e007f), (0x0f0000, 0x0ffffd), (0x100000, 0x10fffd),
-         ]),
+         ),
   # Cc: 65 codepoint markers (*not* codepoints)
-  'Cc' : CodePointSet([
+  'Cc' : (
            (0x000000, 0x00001f), (0x00007f, 0x00009f),
-         ]),
+         ),
   # Cf: 129 codepoint markers (*not* codepoints)
-  'Cf' : CodePointSet([
+  'Cf' : (
            (0x00070f, 0x00070f), (0x00180b, 0x00180e), (0x00200c, 0x00200f),
            (0x00202a, 0x00202e), (0x00206a, 0x00206f), (0x00feff, 0x00feff),
            (0x00fff9, 0x00fffb), (0x01d173, 0x01d17a), (0x0e0001, 0x0e0001),
            (0x0e0020, 0x0e007f),
-         ]),
+         ),
   # Co: 3 codepoint markers (*not* codepoints)
-  'Co' : CodePointSet([
+  'Co' : (
            (0x00e000, 0x00f8ff), (0x0f0000, 0x0ffffd), (0x100000, 0x10fffd),
-         ]),
+         ),
   # Cs: 3 codepoint markers (*not* codepoints)
-  'Cs' : CodePointSet([
+  'Cs' : (
            (0x00d800, 0x00db7f), (0x00db80, 0x00dbff), (0x00dc00, 0x00dfff),
-         ]),
+         ),
   # L: 8399 codepoint markers (*not* codepoints)
-  'L'  : CodePointSet([
+  'L'  : (
            (0x000041, 0x00005a), (0x000061, 0x00007a), (0x0000aa, 0x0000aa),
            (0x0000b5, 0x0000b5), (0x0000ba, 0x0000ba), (0x0000c0, 0x0000d6),
            (0x0000d8, 0x0000f6), (0x0000f8, 0x00021f), (0x000222, 0x000233),
@@ -423,9 +422,9 @@ PropertyMap = {
            (0x01d750, 0x01d76e), (0x01d770, 0x01d788), (0x01d78a, 0x01d7a8),
            (0x01d7aa, 0x01d7c2), (0x01d7c4, 0x01d7c9), (0x020000, 0x02a6d6),
            (0x02f800, 0x02fa1d),
-         ]),
+         ),
   # Ll: 1331 codepoint markers (*not* codepoints)
-  'Ll' : CodePointSet([
+  'Ll' : (
            (0x000061, 0x00007a), (0x0000aa, 0x0000aa), (0x0000b5, 0x0000b5),
            (0x0000ba, 0x0000ba), (0x0000df, 0x0000f6), (0x0000f8, 0x0000ff),
            (0x000101, 0x000101), (0x000103, 0x000103), (0x000105, 0x000105),
@@ -561,18 +560,18 @@ PropertyMap = {
            (0x01d6fc, 0x01d714), (0x01d716, 0x01d71b), (0x01d736, 0x01d74e),
            (0x01d750, 0x01d755), (0x01d770, 0x01d788), (0x01d78a, 0x01d78f),
            (0x01d7aa, 0x01d7c2), (0x01d7c4, 0x01d7c9),
-         ]),
+         ),
   # Lm: 46 codepoint markers (*not* codepoints)
-  'Lm' : CodePointSet([
+  'Lm' : (
            (0x0002b0, 0x0002b8), (0x0002bb, 0x0002c1), (0x0002d0, 0x0002d1),
            (0x0002e0, 0x0002e4), (0x0002ee, 0x0002ee), (0x00037a, 0x00037a),
            (0x000559, 0x000559), (0x000640, 0x000640), (0x0006e5, 0x0006e6),
            (0x000e46, 0x000e46), (0x000ec6, 0x000ec6), (0x001843, 0x001843),
            (0x003005, 0x003005), (0x003031, 0x003035), (0x00309d, 0x00309e),
            (0x0030fc, 0x0030fe), (0x00ff70, 0x00ff70), (0x00ff9e, 0x00ff9f),
-         ]),
+         ),
   # Lo: 5823 codepoint markers (*not* codepoints)
-  'Lo' : CodePointSet([
+  'Lo' : (
            (0x0001bb, 0x0001bb), (0x0001c0, 0x0001c3), (0x0005d0, 0x0005ea),
            (0x0005f0, 0x0005f2), (0x000621, 0x00063a), (0x000641, 0x00064a),
            (0x000671, 0x0006d3), (0x0006d5, 0x0006d5), (0x0006fa, 0x0006fc),
@@ -637,16 +636,16 @@ PropertyMap = {
            (0x00ffca, 0x00ffcf), (0x00ffd2, 0x00ffd7), (0x00ffda, 0x00ffdc),
            (0x010300, 0x01031e), (0x010330, 0x010349), (0x020000, 0x02a6d6),
            (0x02f800, 0x02fa1d),
-         ]),
+         ),
   # Lt: 31 codepoint markers (*not* codepoints)
-  'Lt' : CodePointSet([
+  'Lt' : (
            (0x0001c5, 0x0001c5), (0x0001c8, 0x0001c8), (0x0001cb, 0x0001cb),
            (0x0001f2, 0x0001f2), (0x001f88, 0x001f8f), (0x001f98, 0x001f9f),
            (0x001fa8, 0x001faf), (0x001fbc, 0x001fbc), (0x001fcc, 0x001fcc),
            (0x001ffc, 0x001ffc),
-         ]),
+         ),
   # Lu: 1168 codepoint markers (*not* codepoints)
-  'Lu' : CodePointSet([
+  'Lu' : (
            (0x000041, 0x00005a), (0x0000c0, 0x0000d6), (0x0000d8, 0x0000de),
            (0x000100, 0x000100), (0x000102, 0x000102), (0x000104, 0x000104),
            (0x000106, 0x000106), (0x000108, 0x000108), (0x00010a, 0x00010a),
@@ -782,9 +781,9 @@ PropertyMap = {
            (0x01d63c, 0x01d655), (0x01d670, 0x01d689), (0x01d6a8, 0x01d6c0),
            (0x01d6e2, 0x01d6fa), (0x01d71c, 0x01d734), (0x01d756, 0x01d76e),
            (0x01d790, 0x01d7a8),
-         ]),
+         ),
   # M: 605 codepoint markers (*not* codepoints)
-  'M'  : CodePointSet([
+  'M'  : (
            (0x000300, 0x00034e), (0x000360, 0x000362), (0x000483, 0x000486),
            (0x000488, 0x000489), (0x000591, 0x0005a1), (0x0005a3, 0x0005b9),
            (0x0005bb, 0x0005bd), (0x0005bf, 0x0005bf), (0x0005c1, 0x0005c2),
@@ -820,9 +819,9 @@ PropertyMap = {
            (0x00302a, 0x00302f), (0x003099, 0x00309a), (0x00fb1e, 0x00fb1e),
            (0x00fe20, 0x00fe23), (0x01d165, 0x01d169), (0x01d16d, 0x01d172),
            (0x01d17b, 0x01d182), (0x01d185, 0x01d18b), (0x01d1aa, 0x01d1ad),
-         ]),
+         ),
   # Mc: 126 codepoint markers (*not* codepoints)
-  'Mc' : CodePointSet([
+  'Mc' : (
            (0x000903, 0x000903), (0x00093e, 0x000940), (0x000949, 0x00094c),
            (0x000982, 0x000983), (0x0009be, 0x0009c0), (0x0009c7, 0x0009c8),
            (0x0009cb, 0x0009cc), (0x0009d7, 0x0009d7), (0x000a3e, 0x000a40),
@@ -841,14 +840,14 @@ PropertyMap = {
            (0x001031, 0x001031), (0x001038, 0x001038), (0x001056, 0x001057),
            (0x0017b4, 0x0017b6), (0x0017be, 0x0017c5), (0x0017c7, 0x0017c8),
            (0x01d165, 0x01d166), (0x01d16d, 0x01d172),
-         ]),
+         ),
   # Me: 10 codepoint markers (*not* codepoints)
-  'Me' : CodePointSet([
+  'Me' : (
            (0x000488, 0x000489), (0x0006dd, 0x0006de), (0x0020dd, 0x0020e0),
            (0x0020e2, 0x0020e3),
-         ]),
+         ),
   # Mn: 469 codepoint markers (*not* codepoints)
-  'Mn' : CodePointSet([
+  'Mn' : (
            (0x000300, 0x00034e), (0x000360, 0x000362), (0x000483, 0x000486),
            (0x000591, 0x0005a1), (0x0005a3, 0x0005b9), (0x0005bb, 0x0005bd),
            (0x0005bf, 0x0005bf), (0x0005c1, 0x0005c2), (0x0005c4, 0x0005c4),
@@ -882,9 +881,9 @@ PropertyMap = {
            (0x003099, 0x00309a), (0x00fb1e, 0x00fb1e), (0x00fe20, 0x00fe23),
            (0x01d167, 0x01d169), (0x01d17b, 0x01d182), (0x01d185, 0x01d18b),
            (0x01d1aa, 0x01d1ad),
-         ]),
+         ),
   # N: 486 codepoint markers (*not* codepoints)
-  'N'  : CodePointSet([
+  'N'  : (
            (0x000030, 0x000039), (0x0000b2, 0x0000b3), (0x0000b9, 0x0000b9),
            (0x0000bc, 0x0000be), (0x000660, 0x000669), (0x0006f0, 0x0006f9),
            (0x000966, 0x00096f), (0x0009e6, 0x0009ef), (0x0009f4, 0x0009f9),
@@ -899,9 +898,9 @@ PropertyMap = {
            (0x003038, 0x00303a), (0x003192, 0x003195), (0x003220, 0x003229),
            (0x003280, 0x003289), (0x00ff10, 0x00ff19), (0x010320, 0x010323),
            (0x01034a, 0x01034a), (0x01d7ce, 0x01d7ff),
-         ]),
+         ),
   # Nd: 248 codepoint markers (*not* codepoints)
-  'Nd' : CodePointSet([
+  'Nd' : (
            (0x000030, 0x000039), (0x000660, 0x000669), (0x0006f0, 0x0006f9),
            (0x000966, 0x00096f), (0x0009e6, 0x0009ef), (0x000a66, 0x000a6f),
            (0x000ae6, 0x000aef), (0x000b66, 0x000b6f), (0x000be7, 0x000bef),
@@ -909,23 +908,23 @@ PropertyMap = {
            (0x000e50, 0x000e59), (0x000ed0, 0x000ed9), (0x000f20, 0x000f29),
            (0x001040, 0x001049), (0x001369, 0x001371), (0x0017e0, 0x0017e9),
            (0x001810, 0x001819), (0x00ff10, 0x00ff19), (0x01d7ce, 0x01d7ff),
-         ]),
+         ),
   # Nl: 53 codepoint markers (*not* codepoints)
-  'Nl' : CodePointSet([
+  'Nl' : (
            (0x0016ee, 0x0016f0), (0x002160, 0x002183), (0x003007, 0x003007),
            (0x003021, 0x003029), (0x003038, 0x00303a), (0x01034a, 0x01034a),
-         ]),
+         ),
   # No: 185 codepoint markers (*not* codepoints)
-  'No' : CodePointSet([
+  'No' : (
            (0x0000b2, 0x0000b3), (0x0000b9, 0x0000b9), (0x0000bc, 0x0000be),
            (0x0009f4, 0x0009f9), (0x000bf0, 0x000bf2), (0x000f2a, 0x000f33),
            (0x001372, 0x00137c), (0x002070, 0x002070), (0x002074, 0x002079),
            (0x002080, 0x002089), (0x002153, 0x00215f), (0x002460, 0x00249b),
            (0x0024ea, 0x0024ea), (0x002776, 0x002793), (0x003192, 0x003195),
            (0x003220, 0x003229), (0x003280, 0x003289), (0x010320, 0x010323),
-         ]),
+         ),
   # P: 298 codepoint markers (*not* codepoints)
-  'P'  : CodePointSet([
+  'P'  : (
            (0x000021, 0x000023), (0x000025, 0x00002a), (0x00002c, 0x00002f),
            (0x00003a, 0x00003b), (0x00003f, 0x000040), (0x00005b, 0x00005d),
            (0x00005f, 0x00005f), (0x00007b, 0x00007b), (0x00007d, 0x00007d),
@@ -951,22 +950,22 @@ PropertyMap = {
            (0x00ff05, 0x00ff0a), (0x00ff0c, 0x00ff0f), (0x00ff1a, 0x00ff1b),
            (0x00ff1f, 0x00ff20), (0x00ff3b, 0x00ff3d), (0x00ff3f, 0x00ff3f),
            (0x00ff5b, 0x00ff5b), (0x00ff5d, 0x00ff5d), (0x00ff61, 0x00ff65),
-         ]),
+         ),
   # Pc: 11 codepoint markers (*not* codepoints)
-  'Pc' : CodePointSet([
+  'Pc' : (
            (0x00005f, 0x00005f), (0x00203f, 0x002040), (0x0030fb, 0x0030fb),
            (0x00fe33, 0x00fe34), (0x00fe4d, 0x00fe4f), (0x00ff3f, 0x00ff3f),
            (0x00ff65, 0x00ff65),
-         ]),
+         ),
   # Pd: 17 codepoint markers (*not* codepoints)
-  'Pd' : CodePointSet([
+  'Pd' : (
            (0x00002d, 0x00002d), (0x0000ad, 0x0000ad), (0x00058a, 0x00058a),
            (0x001806, 0x001806), (0x002010, 0x002015), (0x00301c, 0x00301c),
            (0x003030, 0x003030), (0x00fe31, 0x00fe32), (0x00fe58, 0x00fe58),
            (0x00fe63, 0x00fe63), (0x00ff0d, 0x00ff0d),
-         ]),
+         ),
   # Pe: 37 codepoint markers (*not* codepoints)
-  'Pe' : CodePointSet([
+  'Pe' : (
            (0x000029, 0x000029), (0x00005d, 0x00005d), (0x00007d, 0x00007d),
            (0x000f3b, 0x000f3b), (0x000f3d, 0x000f3d), (0x00169c, 0x00169c),
            (0x002046, 0x002046), (0x00207e, 0x00207e), (0x00208e, 0x00208e),
@@ -979,19 +978,19 @@ PropertyMap = {
            (0x00fe42, 0x00fe42), (0x00fe44, 0x00fe44), (0x00fe5a, 0x00fe5a),
            (0x00fe5c, 0x00fe5c), (0x00fe5e, 0x00fe5e), (0x00ff09, 0x00ff09),
            (0x00ff3d, 0x00ff3d), (0x00ff5d, 0x00ff5d), (0x00ff63, 0x00ff63),
-         ]),
+         ),
   # Pf: 4 codepoint markers (*not* codepoints)
-  'Pf' : CodePointSet([
+  'Pf' : (
            (0x0000bb, 0x0000bb), (0x002019, 0x002019), (0x00201d, 0x00201d),
            (0x00203a, 0x00203a),
-         ]),
+         ),
   # Pi: 6 codepoint markers (*not* codepoints)
-  'Pi' : CodePointSet([
+  'Pi' : (
            (0x0000ab, 0x0000ab), (0x002018, 0x002018), (0x00201b, 0x00201c),
            (0x00201f, 0x00201f), (0x002039, 0x002039),
-         ]),
+         ),
   # Po: 185 codepoint markers (*not* codepoints)
-  'Po' : CodePointSet([
+  'Po' : (
            (0x000021, 0x000023), (0x000025, 0x000027), (0x00002a, 0x00002a),
            (0x00002c, 0x00002c), (0x00002e, 0x00002f), (0x00003a, 0x00003b),
            (0x00003f, 0x000040), (0x00005c, 0x00005c), (0x0000a1, 0x0000a1),
@@ -1014,9 +1013,9 @@ PropertyMap = {
            (0x00ff0a, 0x00ff0a), (0x00ff0c, 0x00ff0c), (0x00ff0e, 0x00ff0f),
            (0x00ff1a, 0x00ff1b), (0x00ff1f, 0x00ff20), (0x00ff3c, 0x00ff3c),
            (0x00ff61, 0x00ff61), (0x00ff64, 0x00ff64),
-         ]),
+         ),
   # Ps: 38 codepoint markers (*not* codepoints)
-  'Ps' : CodePointSet([
+  'Ps' : (
            (0x000028, 0x000028), (0x00005b, 0x00005b), (0x00007b, 0x00007b),
            (0x000f3a, 0x000f3a), (0x000f3c, 0x000f3c), (0x00169b, 0x00169b),
            (0x00201a, 0x00201a), (0x00201e, 0x00201e), (0x002045, 0x002045),
@@ -1030,9 +1029,9 @@ PropertyMap = {
            (0x00fe43, 0x00fe43), (0x00fe59, 0x00fe59), (0x00fe5b, 0x00fe5b),
            (0x00fe5d, 0x00fe5d), (0x00ff08, 0x00ff08), (0x00ff3b, 0x00ff3b),
            (0x00ff5b, 0x00ff5b), (0x00ff62, 0x00ff62),
-         ]),
+         ),
   # S: 2841 codepoint markers (*not* codepoints)
-  'S'  : CodePointSet([
+  'S'  : (
            (0x000024, 0x000024), (0x00002b, 0x00002b), (0x00003c, 0x00003e),
            (0x00005e, 0x00005e), (0x000060, 0x000060), (0x00007c, 0x00007c),
            (0x00007e, 0x00007e), (0x0000a2, 0x0000a9), (0x0000ac, 0x0000ac),
@@ -1081,16 +1080,16 @@ PropertyMap = {
            (0x01d6fb, 0x01d6fb), (0x01d715, 0x01d715), (0x01d735, 0x01d735),
            (0x01d74f, 0x01d74f), (0x01d76f, 0x01d76f), (0x01d789, 0x01d789),
            (0x01d7a9, 0x01d7a9), (0x01d7c3, 0x01d7c3),
-         ]),
+         ),
   # Sc: 31 codepoint markers (*not* codepoints)
-  'Sc' : CodePointSet([
+  'Sc' : (
            (0x000024, 0x000024), (0x0000a2, 0x0000a5), (0x0009f2, 0x0009f3),
            (0x000e3f, 0x000e3f), (0x0017db, 0x0017db), (0x0020a0, 0x0020af),
            (0x00fe69, 0x00fe69), (0x00ff04, 0x00ff04), (0x00ffe0, 0x00ffe1),
            (0x00ffe5, 0x00ffe6),
-         ]),
+         ),
   # Sk: 69 codepoint markers (*not* codepoints)
-  'Sk' : CodePointSet([
+  'Sk' : (
            (0x00005e, 0x00005e), (0x000060, 0x000060), (0x0000a8, 0x0000a8),
            (0x0000af, 0x0000af), (0x0000b4, 0x0000b4), (0x0000b8, 0x0000b8),
            (0x0002b9, 0x0002ba), (0x0002c2, 0x0002cf), (0x0002d2, 0x0002df),
@@ -1099,9 +1098,9 @@ PropertyMap = {
            (0x001fdd, 0x001fdf), (0x001fed, 0x001fef), (0x001ffd, 0x001ffe),
            (0x00309b, 0x00309c), (0x00ff3e, 0x00ff3e), (0x00ff40, 0x00ff40),
            (0x00ffe3, 0x00ffe3),
-         ]),
+         ),
   # Sm: 309 codepoint markers (*not* codepoints)
-  'Sm' : CodePointSet([
+  'Sm' : (
            (0x00002b, 0x00002b), (0x00003c, 0x00003e), (0x00007c, 0x00007c),
            (0x00007e, 0x00007e), (0x0000ac, 0x0000ac), (0x0000b1, 0x0000b1),
            (0x0000d7, 0x0000d7), (0x0000f7, 0x0000f7), (0x002044, 0x002044),
@@ -1117,9 +1116,9 @@ PropertyMap = {
            (0x01d6db, 0x01d6db), (0x01d6fb, 0x01d6fb), (0x01d715, 0x01d715),
            (0x01d735, 0x01d735), (0x01d74f, 0x01d74f), (0x01d76f, 0x01d76f),
            (0x01d789, 0x01d789), (0x01d7a9, 0x01d7a9), (0x01d7c3, 0x01d7c3),
-         ]),
+         ),
   # So: 2432 codepoint markers (*not* codepoints)
-  'So' : CodePointSet([
+  'So' : (
            (0x0000a6, 0x0000a7), (0x0000a9, 0x0000a9), (0x0000ae, 0x0000ae),
            (0x0000b0, 0x0000b0), (0x0000b6, 0x0000b6), (0x000482, 0x000482),
            (0x0006e9, 0x0006e9), (0x0006fd, 0x0006fe), (0x0009fa, 0x0009fa),
@@ -1155,24 +1154,24 @@ PropertyMap = {
            (0x00ffed, 0x00ffee), (0x00fffc, 0x00fffd), (0x01d000, 0x01d0f5),
            (0x01d100, 0x01d126), (0x01d12a, 0x01d164), (0x01d16a, 0x01d16c),
            (0x01d183, 0x01d184), (0x01d18c, 0x01d1a9), (0x01d1ae, 0x01d1dd),
-         ]),
+         ),
   # Z: 19 codepoint markers (*not* codepoints)
-  'Z'  : CodePointSet([
+  'Z'  : (
            (0x000020, 0x000020), (0x0000a0, 0x0000a0), (0x001680, 0x001680),
            (0x002000, 0x00200b), (0x002028, 0x002029), (0x00202f, 0x00202f),
            (0x003000, 0x003000),
-         ]),
+         ),
   # Zl: 1 codepoint markers (*not* codepoints)
-  'Zl' : CodePointSet([
+  'Zl' : (
            (0x002028, 0x002028),
-         ]),
+         ),
   # Zp: 1 codepoint markers (*not* codepoints)
-  'Zp' : CodePointSet([
+  'Zp' : (
            (0x002029, 0x002029),
-         ]),
+         ),
   # Zs: 17 codepoint markers (*not* codepoints)
-  'Zs' : CodePointSet([
+  'Zs' : (
            (0x000020, 0x000020), (0x0000a0, 0x0000a0), (0x001680, 0x001680),
            (0x002000, 0x00200b), (0x00202f, 0x00202f), (0x003000, 0x003000),
-         ]),
+         ),
   }
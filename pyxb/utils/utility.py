@@ -172,6 +172,8 @@ class _DeconflictSymbols_mixin (object):
     the binding generator.)
     """
 
+    __slots__ = ()
+
     _ReservedSymbols = set()
     """There are no reserved symbols in the base class."""
 
@@ -540,19 +542,133 @@ def NormalizeLocation (uri, parent_uri=None, prefix_map=None):
 
 import urlparse
 
-def TextFromURI (uri, archive_directory=None):
+class URIContentCache (object):
+    """A persistent, content-addressed store of documents retrieved by URI.
+
+    Each distinct document is stored once in the cache directory, in a
+    file named by the L{hash<HashForText>} of its content.  For each
+    URI a small index file, named by the hash of the URI, records the
+    hash of the content most recently retrieved from it.  Content is
+    verified against its hash when read, so a damaged entry is treated
+    as absent.  Files are replaced atomically, so a directory may be
+    shared by concurrent processes.
+
+    URIs are used as given: they should already have been normalized
+    with L{NormalizeLocation}, so entries are keyed by the location
+    after any prefix rewriting.
+    """
+
+    def directory (self):
+        """The directory in which cached content is stored."""
+        return self.__directory
+    __directory = None
+
+    def isOffline (self):
+        """If C{True}, content is served only from the cache: a URI that
+        has not been cached cannot be retrieved."""
+        return self.__offline
+    __offline = None
+
+    def isRefresh (self):
+        """If C{True}, content is always retrieved from the URI and the
+        cache updated with the result."""
+        return self.__refresh
+    __refresh = None
+
+    def __init__ (self, directory, offline=False, refresh=False):
+        if offline and refresh:
+            raise pyxb.UsageError('URI content cache cannot both be offline and refresh content')
+        self.__directory = directory
+        self.__offline = offline
+        self.__refresh = refresh
+        try:
+            os.makedirs(directory)
+        except OSError, e:
+            if errno.EEXIST != e.errno:
+                raise
+
+    def __indexPath (self, uri):
+        if isinstance(uri, unicode):
+            uri = uri.encode('utf-8')
+        return (os.path.join(self.__directory, '%s.uri' % (HashForText(uri),)), uri)
+
+    def __contentPath (self, signature):
+        return os.path.join(self.__directory, signature)
+
+    def __writeFile (self, path, text):
+        import tempfile
+        (fd, temp_path) = tempfile.mkstemp(dir=self.__directory)
+        output = os.fdopen(fd, 'wb')
+        try:
+            output.write(text)
+        finally:
+            output.close()
+        os.rename(temp_path, path)
+
+    def lookup (self, uri):
+        """Return the cached content for the given URI, or C{None} if
+        there is no valid entry for it."""
+        (index_path, uri) = self.__indexPath(uri)
+        try:
+            (signature, cached_uri) = file(index_path, 'rb').read().split(' ', 1)
+            if cached_uri.rstrip('\n') != uri:
+                return None
+            text = file(self.__contentPath(signature), 'rb').read()
+        except (IOError, ValueError), e:
+            return None
+        if HashForText(text) != signature:
+            return None
+        return text
+
+    def store (self, uri, text):
+        """Record the given text as the content retrieved from the URI.
+
+        @return: the hash of the text"""
+        (index_path, uri) = self.__indexPath(uri)
+        signature = HashForText(text)
+        content_path = self.__contentPath(signature)
+        if not os.path.exists(content_path):
+            self.__writeFile(content_path, text)
+        self.__writeFile(index_path, '%s %s\n' % (signature, uri))
+        return signature
+
+    def retrieve (self, uri):
+        """Return the content for the given URI, from the cache if
+        possible and otherwise by retrieving it and storing the result.
+
+        @raise IOError: the cache is L{offline<isOffline>} and has no
+        entry for the URI"""
+        import urllib2
+        text = None
+        if not self.__refresh:
+            text = self.lookup(uri)
+        if text is None:
+            if self.__offline:
+                raise IOError(errno.ENOENT, 'No content cached for offline use', uri)
+            text = urllib2.urlopen(uri).read()
+            self.store(uri, text)
+        return text
+
+def TextFromURI (uri, archive_directory=None, cache=None):
     """Retrieve the contents of the uri as a text string.
 
     If the uri does not include a scheme (e.g., C{http:}), it is
-    assumed to be a file path on the local system."""
+    assumed to be a file path on the local system.
+
+    @keyword archive_directory: Optional directory into which a copy
+    of content not read from a local file is written.
+    @keyword cache: Optional L{URIContentCache} through which content
+    not read from a local file is retrieved."""
     import urllib2
     xmls = None
     try:
-        if 0 <= uri.find(':'):
-            xmls = urllib2.urlopen(uri).read()
-        else:
+        if 0 > uri.find(':'):
             xmls = file(uri).read()
             archive_directory = None
+        elif cache is not None:
+            xmls = cache.retrieve(uri)
+        else:
+            xmls = urllib2.urlopen(uri).read()
     except Exception, e:
         print 'TextFromURI: open %s caught: %s' % (uri, e)
         raise
@@ -560,11 +676,29 @@ def TextFromURI (uri, archive_directory=None):
         base_name = os.path.basename(os.path.normpath(urlparse.urlparse(uri)[2]))
         counter = 1
         dest_file = os.path.join(archive_directory, base_name)
-        while os.path.isfile(dest_file):
-            dest_file = os.path.join(archive_directory, '%s.%d' % (base_name, counter))
-            counter += 1
         try:
-            OpenOrCreate(dest_file).write(xmls)
+            try:
+                os.makedirs(archive_directory)
+            except OSError, e:
+                if errno.EEXIST != e.errno:
+                    raise
+            # Claim the name atomically: documents with the same base name
+            # may be archived concurrently (see
+            # L{pyxb.xmlschema.structures.Schema.PrefetchDocuments}).
+            while True:
+                try:
+                    fd = os.open(dest_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0666)
+                    break
+                except OSError, e:
+                    if errno.EEXIST != e.errno:
+                        raise
+                dest_file = os.path.join(archive_directory, '%s.%d' % (base_name, counter))
+                counter += 1
+            fp = os.fdopen(fd, 'w')
+            try:
+                fp.write(xmls)
+            finally:
+                fp.close()
         except OSError, e:
             print 'WARNING: Unable to save %s in %s: %s' % (uri, dest_file, e)
     return xmls
@@ -1026,6 +1160,78 @@ class Location (object):
                 pass
         return Location(self.__locationBase, line_number, column_number)
 
+    # Location bases that appear in packed locations, and the map from each
+    # base value to its index in that list.  Index zero is reserved for
+    # locations without a base.
+    __PackedBases = [ None ]
+    __PackedBaseIndex = { }
+
+    # The number of bits used for each of the line and column in a packed
+    # location
+    __PackedFieldBits = 32
+    __PackedFieldMask = (1 << __PackedFieldBits) - 1
+
+    # The index of this location's base in __PackedBases; computed when
+    # first needed.
+    __packedBaseIndex = None
+
+    @classmethod
+    def __PackedBaseIndexFor (cls, location_base):
+        value = location_base.locationBase()
+        if value is None:
+            return 0
+        try:
+            index = cls.__PackedBaseIndex.get(value)
+        except TypeError:
+            # Unhashable base; it cannot be shared
+            index = len(cls.__PackedBases)
+            cls.__PackedBases.append(location_base)
+            return index
+        if index is None:
+            index = cls.__PackedBaseIndex[value] = len(cls.__PackedBases)
+            cls.__PackedBases.append(location_base)
+        return index
+
+    def packedLocation (self, locator=None, line_number=None, column_number=None):
+        """As with L{newLocation}, but return the location as an integer.
+
+        Packed locations hold the same information as L{Location} instances,
+        without requiring an object per location.  They may be stored
+        wherever a location is accepted by L{Locatable_mixin}, and are
+        converted back with L{Unpack}.
+
+        @rtype: C{int} or C{long}
+        """
+        if locator is not None:
+            try:
+                line_number = locator.getLineNumber()
+                column_number = locator.getColumnNumber()
+            except:
+                pass
+        if self.__packedBaseIndex is None:
+            self.__packedBaseIndex = self.__PackedBaseIndexFor(self.__locationBase)
+        # Zero represents an unknown line or column
+        rv = self.__packedBaseIndex
+        for field in (line_number, column_number):
+            rv <<= self.__PackedFieldBits
+            if field is not None:
+                rv |= (field + 1) & self.__PackedFieldMask
+        return rv
+
+    @classmethod
+    def Unpack (cls, packed):
+        """Return the L{Location} instance corresponding to a value created
+        by L{packedLocation}."""
+        column_number = (packed & cls.__PackedFieldMask) - 1
+        packed >>= cls.__PackedFieldBits
+        line_number = (packed & cls.__PackedFieldMask) - 1
+        packed >>= cls.__PackedFieldBits
+        if 0 > line_number:
+            line_number = None
+        if 0 > column_number:
+            column_number = None
+        return Location(cls.__PackedBases[packed], line_number, column_number)
+
     locationBase = property(lambda _s: _s.__locationBase)
     lineNumber = property(lambda _s: _s.__lineNumber)
     columnNumber = property(lambda _s: _s.__columnNumber)
@@ -1036,6 +1242,10 @@ class Location (object):
         return '%s[%s:%s]' % (self.locationBase, self.lineNumber, self.columnNumber)
 
 class Locatable_mixin (pyxb.cscRoot):
+    # Subclasses that use slots must provide one for the location
+    __slots__ = ()
+
+    # A Location instance, or a packed location; see Location.packedLocation.
     __location = None
 
     def __init__ (self, *args, **kw):
@@ -1043,7 +1253,14 @@ class Locatable_mixin (pyxb.cscRoot):
         super(Locatable_mixin, self).__init__(*args, **kw)
 
     def _setLocation (self, location):
+        """Set the location of the object.
+
+        @param location: A L{Location} instance, or a packed location as
+        returned by L{Location.packedLocation}, or C{None}."""
         self.__location = location
 
     def _location (self):
-        return self.__location
+        location = self.__location
+        if isinstance(location, (int, long)):
+            location = Location.Unpack(location)
+        return location
@@ -82,6 +82,10 @@ def _MatchCharPropBraced (text, position):
         raise RegularExpressionError(position, "Unrecognized character property '%s'" % (char_prop,))
     return (cs, ep+1)
 
+# Map from the text of a complemented category escape (e.g., C{{IsGreek}}
+# for C{\P{IsGreek}}) to the corresponding L{unicode.CodePointSet}
+_ComplementedCharPropCache = { }
+
 def _MaybeMatchCharClassEsc (text, position, include_sce=True):
     """Attempt to match a U{character class escape
     <http://www.w3.org/TR/xmlschema-2/#nt-charClassEsc>}
@@ -117,8 +121,12 @@ def _MaybeMatchCharClassEsc (text, position, include_sce=True):
     if 'p' == nc:
         return _MatchCharPropBraced(text, np)
     if 'P' == nc:
-        (cs, np) = _MatchCharPropBraced(text, np)
-        return (cs.negate(), np)
+        (cs, ep) = _MatchCharPropBraced(text, np)
+        char_prop = text[np:ep]
+        ncs = _ComplementedCharPropCache.get(char_prop)
+        if ncs is None:
+            ncs = _ComplementedCharPropCache[char_prop] = cs.negate()
+        return (ncs, ep)
     if (not include_sce) and (nc in unicode.SingleCharEsc):
         return None
     raise RegularExpressionError(np, "Unrecognized escape identifier '\\%s'" % (nc,))
@@ -290,16 +298,28 @@ def MaybeMatchCharacterClass (text, position):
         return _MatchCharClassExpr(text, position)
     return _MaybeMatchCharClassEsc(text, position)
 
+# Map from XML patterns to their translations by XMLToPython
+__XMLToPythonCache = { }
+
 def XMLToPython (pattern):
     """Convert the given pattern to the format required for Python
     regular expressions.
 
+    Translations are remembered, so a pattern that appears in several
+    types is translated only once.
+
     @param pattern: A Unicode string defining a pattern consistent
     with U{XML regular
     expressions<http://www.w3.org/TR/xmlschema-2/index.html#regexs>}.
 
     @return: A Unicode string specifying a Python regular expression
     that matches the same language as C{pattern}."""
+    rv = __XMLToPythonCache.get(pattern)
+    if rv is None:
+        rv = __XMLToPythonCache[pattern] = _XMLToPython(pattern)
+    return rv
+
+def _XMLToPython (pattern):
     new_pattern_elts = []
     new_pattern_elts.append('^')
     position = 0
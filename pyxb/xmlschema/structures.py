@@ -51,6 +51,13 @@ import copy
 import urllib2
 import urlparse
 import os.path
+import xml.parsers.expat
+
+try:
+    import multiprocessing.dummy
+except ImportError:
+    # Python before 2.6; documents are prefetched serially
+    multiprocessing = None
 
 # Flag indicating that the built in types have been registered
 _PastAddBuiltInTypes = False
@@ -2079,7 +2086,7 @@ class ComplexTypeDefinition (_SchemaComponent_mixin, _NamedComponent_mixin, pyxb
                 if agd is None:
                     raise pyxb.SchemaValidationError('Attribute group %s cannot be found' % (ag_en,))
                 if not agd.isResolved():
-                    self._queueForResolution('unresolved attribute group')
+                    self._queueForResolution('unresolved attribute group', depends_on=agd)
                     return self
                 self.__attributeGroups.append(agd)
                 uses_c2.update(agd.attributeUses())
@@ -2087,11 +2094,11 @@ class ComplexTypeDefinition (_SchemaComponent_mixin, _NamedComponent_mixin, pyxb
             uses_c1c2 = uses_c1.union(uses_c2)
             for au in uses_c1c2:
                 if not au.isResolved():
-                    self._queueForResolution('attribute use not resolved')
+                    self._queueForResolution('attribute use not resolved', depends_on=au)
                     return self
                 ad_en = au.attributeDeclaration().expandedName()
                 if not au.attributeDeclaration().isResolved():
-                    self._queueForResolution('unresolved attribute declaration %s from base type' % (ad_en,))
+                    self._queueForResolution('unresolved attribute declaration %s from base type' % (ad_en,), depends_on=au.attributeDeclaration())
                     return self
     
             self.__usesC1C2 = frozenset([ _u._adaptForScope(self) for _u in uses_c1c2 ])
@@ -2109,11 +2116,11 @@ class ComplexTypeDefinition (_SchemaComponent_mixin, _NamedComponent_mixin, pyxb
             assert self.__baseTypeDefinition.isResolved()
             for au in uses_c3:
                 if not au.isResolved():
-                    self._queueForResolution('unresolved attribute use from base type')
+                    self._queueForResolution('unresolved attribute use from base type', depends_on=au)
                     return self
                 ad_en = au.attributeDeclaration().expandedName()
                 if not au.attributeDeclaration().isResolved():
-                    self._queueForResolution('unresolved attribute declaration %s from base type' % (ad_en,))
+                    self._queueForResolution('unresolved attribute declaration %s from base type' % (ad_en,), depends_on=au.attributeDeclaration())
                     return self
                 assert not au.attributeDeclaration()._scopeIsIndeterminate()
             
@@ -2497,7 +2504,7 @@ class ComplexTypeDefinition (_SchemaComponent_mixin, _NamedComponent_mixin, pyxb
             if not base_type.isResolved():
                 # Have to delay resolution until the type this
                 # depends on is available.
-                self._queueForResolution('unresolved base type %s' % (base_en,))
+                self._queueForResolution('unresolved base type %s' % (base_en,), depends_on=base_type)
                 return self
             self.__baseTypeDefinition = base_type
 
@@ -4285,7 +4292,7 @@ class SimpleTypeDefinition (_SchemaComponent_mixin, _NamedComponent_mixin, pyxb.
         # has been completed.
         assert self.__baseTypeDefinition != self
         if not self.__baseTypeDefinition.isResolved():
-            self._queueForResolution('base type %s is not resolved' % (self.__baseTypeDefinition,))
+            self._queueForResolution('base type %s is not resolved' % (self.__baseTypeDefinition,), depends_on=self.__baseTypeDefinition)
             return self
         if variety is None:
             # 3.14.1 specifies that the variety is the variety of the base
@@ -4351,7 +4358,7 @@ class SimpleTypeDefinition (_SchemaComponent_mixin, _NamedComponent_mixin, pyxb.
                 for mt in self.__memberTypeDefinitions:
                     assert isinstance(mt, SimpleTypeDefinition)
                     if not mt.isResolved():
-                        self._queueForResolution('member type not resolved')
+                        self._queueForResolution('member type not resolved', depends_on=mt)
                         return self
                     if self.VARIETY_union == mt.variety():
                         mtd.extend(mt.memberTypeDefinitions())
@@ -4601,6 +4608,8 @@ class _ImportElementInformationItem (_Annotated_mixin):
                 ckw = { 'absolute_schema_location' : schema_location,
                         'generation_uid' : importing_schema.generationUID(),
                         'uri_content_archive_directory' : importing_schema._uriContentArchiveDirectory(),
+                        'uri_content_cache' : importing_schema._uriContentCache(),
+                        'schema_document_map' : importing_schema._schemaDocumentMap(),
                         }
                 try:
                     schema_instance = Schema.CreateFromLocation(**ckw)
@@ -4748,6 +4757,14 @@ class Schema (_SchemaComponent_mixin):
         return self.__uriContentArchiveDirectory
     __uriContentArchiveDirectory = None
 
+    def _uriContentCache (self):
+        return self.__uriContentCache
+    __uriContentCache = None
+
+    def _schemaDocumentMap (self):
+        return self.__schemaDocumentMap
+    __schemaDocumentMap = None
+
     def __init__ (self, *args, **kw):
         # Force resolution of available namespaces if not already done
         if not kw.get('_bypass_preload', False):
@@ -4755,6 +4772,8 @@ class Schema (_SchemaComponent_mixin):
 
         assert 'schema' not in kw
         self.__uriContentArchiveDirectory = kw.get('uri_content_archive_directory')
+        self.__uriContentCache = kw.get('uri_content_cache')
+        self.__schemaDocumentMap = kw.get('schema_document_map')
         self.__location = kw.get('schema_location')
         if self.__location is not None:
             schema_path = self.__location
@@ -4821,12 +4840,133 @@ class Schema (_SchemaComponent_mixin):
         normalized, if necessary.
         @keyword absolute_schema_location: A file path or URI.  This value is
         not normalized, and supersedes C{schema_location}.
+        @keyword uri_content_cache: An optional
+        L{pyxb.utils.utility.URIContentCache} through which the document is
+        retrieved.
+        @keyword schema_document_map: An optional map from absolute schema
+        locations to document text, as filled by L{PrefetchDocuments}.  If
+        the location is present its entry is used, and removed, instead of
+        retrieving the document.
         """
         schema_location = kw.pop('absolute_schema_location', pyxb.utils.utility.NormalizeLocation(kw.get('schema_location'), kw.get('parent_uri'), kw.get('prefix_map')))
         kw['location_base'] = kw['schema_location'] = schema_location
         assert isinstance(schema_location, basestring), 'Unexpected value %s type %s for schema_location' % (schema_location, type(schema_location))
-        uri_content_archive_directory = kw.get('uri_content_archive_directory')
-        return cls.CreateFromDocument(pyxb.utils.utility.TextFromURI(schema_location, archive_directory=uri_content_archive_directory), **kw)
+        xmls = None
+        schema_document_map = kw.get('schema_document_map')
+        if schema_document_map is not None:
+            xmls = schema_document_map.pop(schema_location, None)
+        if xmls is None:
+            uri_content_archive_directory = kw.get('uri_content_archive_directory')
+            uri_content_cache = kw.get('uri_content_cache')
+            xmls = pyxb.utils.utility.TextFromURI(schema_location, archive_directory=uri_content_archive_directory, cache=uri_content_cache)
+        return cls.CreateFromDocument(xmls, **kw)
+
+    @classmethod
+    def PrefetchDocuments (cls, schema_locations, threads=1, document_map=None, **kw):
+        """Retrieve schema documents and every document they reference.
+
+        Each document is scanned only far enough to find the
+        C{schemaLocation} values of its top-level C{include}, C{import},
+        and C{redefine} elements, and those documents are retrieved in
+        turn.  As in L{_ImportElementInformationItem}, an import is not
+        followed if its namespace is built-in or can be loaded from an
+        archive.  No schema components are constructed.
+
+        Documents are retrieved and scanned concurrently, one generation
+        of references at a time, in a pool of C{threads} threads.  The
+        DOM used to construct components is not built here: its namespace
+        contexts depend on the including schema and it updates the shared
+        namespace registry, so it is built by L{CreateFromLocation} when
+        the text is taken from C{document_map}.
+
+        @param schema_locations: A sequence of file paths or URIs, which
+        are L{normalized<pyxb.utils.utility.NormalizeLocation>}.
+        @keyword threads: The number of documents retrieved concurrently.
+        @keyword document_map: If provided, a map into which the text of
+        each document is stored, keyed by its absolute location.
+        @keyword uri_content_cache: The
+        L{pyxb.utils.utility.URIContentCache} through which documents are
+        retrieved.
+        @keyword uri_content_archive_directory: As for L{CreateFromLocation}.
+        @return: The absolute locations of the documents retrieved, in the
+        order they were discovered.
+        """
+        pending = []
+        for location in schema_locations:
+            location = pyxb.utils.utility.NormalizeLocation(location)
+            if not (location in pending):
+                pending.append(location)
+        discovered = set(pending)
+        retrieved = []
+        pool = None
+        if (1 < threads) and (multiprocessing is not None):
+            pool = multiprocessing.dummy.Pool(threads)
+        try:
+            while pending:
+                retrieve_fn = lambda _l: cls.__RetrieveDocument(_l, **kw)
+                if pool is None:
+                    results = map(retrieve_fn, pending)
+                else:
+                    results = pool.map(retrieve_fn, pending)
+                next_pending = []
+                for (location, (xmls, references)) in zip(pending, results):
+                    retrieved.append(location)
+                    if document_map is not None:
+                        document_map[location] = xmls
+                    for (namespace_uri, reference) in references:
+                        if (reference in discovered) or not cls.__NeedImportedDocument(namespace_uri):
+                            continue
+                        discovered.add(reference)
+                        next_pending.append(reference)
+                pending = next_pending
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+        return retrieved
+
+    @classmethod
+    def __NeedImportedDocument (cls, namespace_uri):
+        if namespace_uri is None:
+            return True
+        ns = pyxb.namespace.NamespaceForURI(namespace_uri)
+        return (ns is None) or not (ns.isLoadable() or ns.isBuiltinNamespace())
+
+    @classmethod
+    def __RetrieveDocument (cls, location, uri_content_cache=None, uri_content_archive_directory=None):
+        """Retrieve the document at the given location and find the
+        documents it references.
+
+        This is invoked in worker threads, so it uses only a private expat
+        parser and touches no shared PyXB state.
+
+        @return: A pair consisting of the document text and a list of
+        pairs of the imported namespace URI (C{None} for C{include} and
+        C{redefine}) and the absolute location of the referenced
+        document."""
+        xmls = pyxb.utils.utility.TextFromURI(location, archive_directory=uri_content_archive_directory, cache=uri_content_cache)
+        references = []
+        depth = [ 0 ]
+        def start_element (name, attrs):
+            depth[0] += 1
+            if (2 != depth[0]) or not (' ' in name):
+                return
+            (namespace_uri, local_name) = name.split(' ', 1)
+            if (xsd.uri() != namespace_uri) or not (local_name in ( 'include', 'import', 'redefine' )):
+                return
+            schema_location = attrs.get('schemaLocation')
+            if schema_location is not None:
+                namespace_uri = None
+                if 'import' == local_name:
+                    namespace_uri = attrs.get('namespace')
+                references.append( (namespace_uri, pyxb.utils.utility.NormalizeLocation(schema_location, location)) )
+        def end_element (name):
+            depth[0] -= 1
+        parser = xml.parsers.expat.ParserCreate(namespace_separator=' ')
+        parser.StartElementHandler = start_element
+        parser.EndElementHandler = end_element
+        parser.Parse(xmls, True)
+        return (xmls, references)
 
     @classmethod
     def CreateFromStream (cls, stream, **kw):
@@ -4996,6 +5136,8 @@ class Schema (_SchemaComponent_mixin):
                    'including_context': self.__namespaceData,
                    'generation_uid': self.generationUID(),
                    'uri_content_archive_directory': self._uriContentArchiveDirectory(),
+                   'uri_content_cache': self._uriContentCache(),
+                   'schema_document_map': self._schemaDocumentMap(),
                  }
             try:
                 schema_instance = self.CreateFromLocation(**kw)
@@ -237,7 +237,7 @@ The major goals of PyXB are:
       # I normally keep these in $purelib, but distutils won't tell me where that is.
       # We don't need them in the installation anyway.
       #data_files= [ ('pyxb/standard/schemas', glob.glob(os.path.join(*'pyxb/standard/schemas/*.xsd'.split('/'))) ) ],
-      scripts=[ 'scripts/pyxbgen', 'scripts/pyxbwsdl', 'scripts/pyxbdump' ],
+      scripts=[ 'scripts/pyxbgen', 'scripts/pyxbwsdl', 'scripts/pyxbdump', 'scripts/pyxbfetch' ],
       cmdclass = { 'test' : test,
                    'update_version' : update_version },
       classifiers = [ 'Development Status :: 5 - Production/Stable'
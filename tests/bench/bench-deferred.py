@@ -0,0 +1,57 @@
+# Compare the time to parse wide records and read two fields from each,
+# with simple values converted when parsed and when first used.
+import time
+import StringIO
+import sys
+import pyxb
+import pyxb.binding.generate
+import pyxb.binding.saxer
+
+num_fields = 20
+fields = ''.join([ '<xs:element name="f%d" type="%s"/>' % (_i, ('xs:int', 'xs:string', 'xs:dateTime', 'xs:decimal')[_i % 4]) for _i in xrange(num_fields) ])
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:complexType name="tRecord">
+    <xs:sequence>%s</xs:sequence>
+    <xs:attribute name="id" type="xs:int"/>
+    <xs:attribute name="stamp" type="xs:dateTime"/>
+  </xs:complexType>
+  <xs:element name="records">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="record" type="tRecord" maxOccurs="unbounded"/>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>''' % (fields,)
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+num_records = 2000
+if 1 < len(sys.argv):
+    num_records = int(sys.argv[1])
+values = ('%d', 'text %d', '2009-07-01T12:00:%02d', '%d.25')
+def Field (i, r):
+    value = values[i % 4]
+    if '%02d' in value:
+        r = r % 60
+    return '<f%d>%s</f%d>' % (i, value % (r,), i)
+records = [ '<record id="%d" stamp="2009-07-01T12:00:00">%s</record>' % (_r, ''.join([ Field(_i, _r) for _i in xrange(num_fields) ])) for _r in xrange(num_records) ]
+xmls = '<records>%s</records>' % (''.join(records),)
+
+def Parse (**kw):
+    saxer = pyxb.binding.saxer.make_parser(fallback_namespace=Namespace.fallbackNamespace(), **kw)
+    handler = saxer.getContentHandler()
+    t0 = time.time()
+    saxer.parse(StringIO.StringIO(xmls))
+    total = 0
+    for record in handler.rootObject().record:
+        total += record.id + record.f0
+    t1 = time.time()
+    return t1 - t0
+
+immediate = Parse()
+deferred = Parse(defer_conversion=True)
+print '%d records of %d fields: immediate %f, deferred %f (%.1fx)' % (num_records, num_fields, immediate, deferred, immediate / deferred)
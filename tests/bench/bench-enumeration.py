@@ -0,0 +1,25 @@
+# Measure the time to validate values of a type with a large enumeration,
+# such as a code list.
+import time
+import sys
+import pyxb.binding.facets as facets
+import pyxb.binding.datatypes as datatypes
+
+num_codes = 2000
+if 1 < len(sys.argv):
+    num_codes = int(sys.argv[1])
+num_values = 100000
+
+class CodeList (datatypes.string, facets._Enumeration_mixin):
+    pass
+CodeList._CF_enumeration = facets.CF_enumeration(value_datatype=CodeList, super_facet=datatypes.string._CF_enumeration, enum_prefix=None)
+for i in xrange(num_codes):
+    CodeList._CF_enumeration.addEnumeration(unicode_value=u'C%05d' % (i,))
+CodeList._InitializeFacetMap(CodeList._CF_enumeration)
+
+codes = [ u'C%05d' % (_i % num_codes,) for _i in xrange(num_values) ]
+t0 = time.time()
+for c in codes:
+    CodeList(c)
+t1 = time.time()
+print '%d values of a %d-member enumeration in %f sec' % (num_values, num_codes, t1 - t0)
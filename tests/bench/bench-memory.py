@@ -0,0 +1,46 @@
+# Measure the memory used per complex type instance, for records holding a
+# few elements and attributes.
+import resource
+import sys
+import pyxb
+import pyxb.binding.generate
+
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:complexType name="tPoint">
+    <xs:attribute name="x" type="xs:int"/>
+    <xs:attribute name="y" type="xs:int"/>
+    <xs:attribute name="label" type="xs:string"/>
+  </xs:complexType>
+  <xs:complexType name="tRecord">
+    <xs:sequence>
+      <xs:element name="name" type="xs:string"/>
+      <xs:element name="point" type="tPoint"/>
+      <xs:element name="note" type="xs:string" minOccurs="0"/>
+    </xs:sequence>
+    <xs:attribute name="id" type="xs:int"/>
+  </xs:complexType>
+  <xs:element name="record" type="tRecord"/>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+num_records = 100000
+if 1 < len(sys.argv):
+    num_records = int(sys.argv[1])
+
+# Values are shared, so only the complex type instances are measured
+name = pyxb.binding.datatypes.string('n')
+coordinate = pyxb.binding.datatypes.int(3)
+label = pyxb.binding.datatypes.string('p')
+ident = pyxb.binding.datatypes.int(1)
+
+def MaxRSS ():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+before = MaxRSS()
+records = [ tRecord(name=name, point=tPoint(x=coordinate, y=coordinate, label=label), id=ident) for _i in xrange(num_records) ]
+after = MaxRSS()
+print '%d records: %d bytes per record (two complex type instances each)' % (num_records, (after - before) / num_records)
@@ -0,0 +1,61 @@
+# Compare the time to parse a document with full validation, with
+# validation disabled, and as trusted input.
+import time
+import StringIO
+import sys
+import pyxb
+import pyxb.binding.generate
+import pyxb.binding.saxer
+
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:simpleType name="tDuration">
+    <xs:restriction base="xs:int">
+      <xs:minInclusive value="0"/>
+      <xs:maxInclusive value="1440"/>
+    </xs:restriction>
+  </xs:simpleType>
+  <xs:complexType name="tSchedule">
+    <xs:sequence>
+      <xs:element name="program" type="xs:string"/>
+      <xs:element name="duration" type="tDuration"/>
+      <xs:element name="rating" type="xs:string" minOccurs="0" maxOccurs="3"/>
+    </xs:sequence>
+    <xs:attribute name="station" type="xs:int"/>
+    <xs:attribute name="time" type="xs:dateTime"/>
+  </xs:complexType>
+  <xs:element name="schedules">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="schedule" type="tSchedule" maxOccurs="unbounded"/>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+num_records = 5000
+if 1 < len(sys.argv):
+    num_records = int(sys.argv[1])
+records = [ '<schedule station="%d" time="2009-07-%02dT12:00:00"><program>P%d</program><duration>%d</duration><rating>TV-G</rating></schedule>' % (_i, 1 + (_i % 28), _i, _i % 120) for _i in xrange(num_records) ]
+xmls = '<schedules>%s</schedules>' % (''.join(records),)
+
+def Parse (**kw):
+    saxer = pyxb.binding.saxer.make_parser(fallback_namespace=Namespace.fallbackNamespace(), **kw)
+    handler = saxer.getContentHandler()
+    t0 = time.time()
+    saxer.parse(StringIO.StringIO(xmls))
+    t1 = time.time()
+    instance = handler.rootObject()
+    assert num_records == len(instance.schedule)
+    return t1 - t0
+
+validated = Parse()
+pyxb.RequireValidWhenParsing(False)
+unvalidated = Parse()
+pyxb.RequireValidWhenParsing(True)
+trusted = Parse(trust_input=True)
+print '%d records: validated %f, unvalidated %f, trusted %f (%.1fx)' % (num_records, validated, unvalidated, trusted, validated / trusted)
@@ -0,0 +1,59 @@
+# Compare the time and peak memory to serialize a large document through a
+# DOM tree and with the streaming writer.  The cached style measures
+# rewriting the document after changing one record, with the serialization
+# of the other records recorded by a previous write.
+import time
+import StringIO
+import resource
+import sys
+import pyxb
+import pyxb.binding.generate
+
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:complexType name="tRecord">
+    <xs:sequence>
+      <xs:element name="name" type="xs:string"/>
+      <xs:element name="count" type="xs:int"/>
+      <xs:element name="amount" type="xs:decimal" maxOccurs="unbounded"/>
+    </xs:sequence>
+    <xs:attribute name="id" type="xs:int"/>
+  </xs:complexType>
+  <xs:element name="records">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="record" type="tRecord" maxOccurs="unbounded"/>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+num_records = 5000
+if 1 < len(sys.argv):
+    num_records = int(sys.argv[1])
+style = 'writexml'
+if 2 < len(sys.argv):
+    style = sys.argv[2]
+
+instance = records(record=[ tRecord(name='record %d' % (_r,), count=_r, amount=[ _r + 0.5, _r + 0.25 ], id=_r) for _r in xrange(num_records) ])
+
+if 'cached' == style:
+    instance.writexml(StringIO.StringIO(), cache_fragments=True)
+    instance.record[num_records // 2].count = -1
+
+rss0 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+t0 = time.time()
+if 'toxml' == style:
+    length = len(instance.toxml())
+elif 'cached' == style:
+    length = len(instance.writexml(StringIO.StringIO(), cache_fragments=True).getvalue())
+else:
+    length = len(instance.writexml(StringIO.StringIO()).getvalue())
+t1 = time.time()
+rss1 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+# Run once per style; peak RSS does not decrease within a process.
+print '%s: %d records, %d characters in %f sec, peak RSS grew %d kB' % (style, num_records, length, t1 - t0, rss1 - rss0)
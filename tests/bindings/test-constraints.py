@@ -9,7 +9,7 @@ import pyxb.binding.datatypes as datatypes
 # 4.3.1 length
 # 4.3.2 minLength
 # 4.3.3 maxLength
-# NEED 4.3.4 pattern
+# 4.3.4 pattern
 # 4.3.5 enumeration
 # 4.3.6 whiteSpace
 # 4.3.7 maxInclusive
@@ -50,6 +50,13 @@ Cardinals.two = Cardinals._CF_enumeration.addEnumeration(unicode_value=u'two')
 Cardinals.three = Cardinals._CF_enumeration.addEnumeration(unicode_value=u'three')
 Cardinals._InitializeFacetMap(Cardinals._CF_enumeration)
 
+class CodeList (datatypes.string, facets._Enumeration_mixin):
+    pass
+CodeList._CF_enumeration = facets.CF_enumeration(value_datatype=CodeList, super_facet=datatypes.string._CF_enumeration, enum_prefix=None)
+for _i in xrange(1000):
+    CodeList._CF_enumeration.addEnumeration(unicode_value=u'C%03d' % (_i,))
+CodeList._InitializeFacetMap(CodeList._CF_enumeration)
+
 class ExclusiveFloat (datatypes.float):
     pass
 ExclusiveFloat._CF_minExclusive =  facets.CF_minExclusive(super_facet=datatypes.float._CF_minExclusive, value_datatype=datatypes.float, value=datatypes.float(-5))
@@ -72,6 +79,32 @@ class CollapseString (datatypes.string):
 CollapseString._CF_whiteSpace = facets.CF_whiteSpace(value=facets._WhiteSpace_enum.collapse, super_facet=datatypes.string._CF_whiteSpace)
 CollapseString._InitializeFacetMap(CollapseString._CF_whiteSpace)
 
+class ZipCode (datatypes.string):
+    pass
+ZipCode._CF_pattern = facets.CF_pattern()
+ZipCode._CF_pattern.addPattern(pattern=u'[0-9]{5}')
+ZipCode._CF_pattern.addPattern(pattern=u'[0-9]{5}-[0-9]{4}')
+ZipCode._InitializeFacetMap(ZipCode._CF_pattern)
+
+class Choice (datatypes.string):
+    pass
+Choice._CF_pattern = facets.CF_pattern()
+Choice._CF_pattern.addPattern(pattern=u'ab|cd')
+Choice._InitializeFacetMap(Choice._CF_pattern)
+
+class OtherZipCode (datatypes.string):
+    pass
+OtherZipCode._CF_pattern = facets.CF_pattern()
+OtherZipCode._CF_pattern.addPattern(pattern=u'[0-9]{5}')
+OtherZipCode._CF_pattern.addPattern(pattern=u'[0-9]{5}-[0-9]{4}')
+OtherZipCode._InitializeFacetMap(OtherZipCode._CF_pattern)
+
+class PatternInt (datatypes.int):
+    pass
+PatternInt._CF_pattern = facets.CF_pattern()
+PatternInt._CF_pattern.addPattern(pattern=u'[0-9]')
+PatternInt._InitializeFacetMap(PatternInt._CF_pattern)
+
 class testMaxInclusive (unittest.TestCase):
     def test (self):
         self.assertEqual(5, datatypes.byte(5))
@@ -128,6 +161,64 @@ class testEnumeration (unittest.TestCase):
         self.assertRaises(BadTypeValueError, Cardinals, 'One')
         self.assertRaises(BadTypeValueError, Cardinals, 'four')
 
+    def testLarge (self):
+        self.assertEqual(u'C000', CodeList('C000'))
+        self.assertEqual(u'C999', CodeList(u'C999'))
+        self.assertRaises(BadTypeValueError, CodeList, 'C1000')
+        self.assertEqual(u'C512', CodeList._CF_enumeration.elementForValue(CodeList('C512')).unicodeValue())
+        self.assertEqual(u'C512', CodeList.valueForUnicode(u'C512'))
+        self.assertEqual(None, CodeList.valueForUnicode(u'C1000'))
+
+class testPattern (unittest.TestCase):
+    def test (self):
+        self.assertEqual('12345', ZipCode('12345'))
+        self.assertEqual('12345-6789', ZipCode(u'12345-6789'))
+        self.assertRaises(BadTypeValueError, ZipCode, '1234')
+        self.assertRaises(BadTypeValueError, ZipCode, '12345-')
+        self.assertRaises(BadTypeValueError, ZipCode, 'x12345')
+
+    def testAnchored (self):
+        # The pattern must match the entire value
+        self.assertRaises(BadTypeValueError, ZipCode, '12345\n')
+        self.assertEqual('ab', Choice('ab'))
+        self.assertEqual('cd', Choice('cd'))
+        self.assertRaises(BadTypeValueError, Choice, 'abd')
+        self.assertRaises(BadTypeValueError, Choice, 'acd')
+
+    def testShared (self):
+        self.assertEqual('12345', OtherZipCode('12345'))
+        self.assertTrue(ZipCode._CF_pattern._validatorFor(ZipCode) == OtherZipCode._CF_pattern._validatorFor(OtherZipCode))
+
+    def testManyGroups (self):
+        many = facets.CF_pattern()
+        for i in xrange(120):
+            many.addPattern(pattern=u'(x)%d' % (i,))
+        self.assertTrue(many.validateConstraint(u'x5'))
+        self.assertTrue(many.validateConstraint(u'x119'))
+        self.assertFalse(many.validateConstraint(u'x120'))
+
+    def testNonString (self):
+        # Patterns are not checked for types that are not strings
+        self.assertEqual(123, PatternInt(123))
+
+class testValidatorFor (unittest.TestCase):
+    def testSkipped (self):
+        self.assertEqual(None, CollapseString._CF_whiteSpace._validatorFor(CollapseString))
+        self.assertEqual(None, PatternInt._CF_pattern._validatorFor(PatternInt))
+        self.assertEqual(None, facets.CF_minLength(value=datatypes.nonNegativeInteger(0))._validatorFor(datatypes.string))
+        self.assertEqual(None, datatypes.string._CF_length._validatorFor(datatypes.string))
+
+    def testSpecialized (self):
+        fn = TLA._CF_length._validatorFor(TLA)
+        self.assertTrue(fn(TLA('one')))
+        self.assertFalse(fn(datatypes.string('three')))
+        fn = ExclusiveFloat._CF_maxExclusive._validatorFor(ExclusiveFloat)
+        self.assertTrue(fn(6.5))
+        self.assertFalse(fn(7.0))
+        fn = ZipCode._CF_pattern._validatorFor(ZipCode)
+        self.assertTrue(fn(u'12345'))
+        self.assertFalse(fn(u'123456'))
+
 class testDigits (unittest.TestCase):
     def testTotalDigits (self):
         self.assertEqual(1, FixedPoint(1))
@@ -0,0 +1,263 @@
+# /dev/null
+# PyXB bindings for NamespaceModule
+# NSM:4c3db5e3d48dbb449518565e6b813eeff5281f1e
+# Generated 2026-10-18 04:46:24.094058 by PyXB version 1.1.2
+import pyxb
+import pyxb.binding
+import pyxb.binding.saxer
+import StringIO
+import pyxb.utils.utility
+import pyxb.utils.domutils
+import sys
+
+# Unique identifier for bindings created at the same time
+_GenerationUID = pyxb.utils.utility.UniqueIdentifier('urn:uuid:df120c22-caae-11f1-8cf7-02fc00000001')
+
+# Import bindings for namespaces imported into schema
+import pyxb.binding.datatypes
+
+Namespace = pyxb.namespace.NamespaceForURI(u'URN:shared-types', create_if_missing=True)
+Namespace.configureCategories(['typeBinding', 'elementBinding'])
+ModuleRecord = Namespace.lookupModuleRecordByUID(_GenerationUID, create_if_missing=True)
+ModuleRecord._setModule(sys.modules[__name__])
+
+def CreateFromDocument (xml_text, default_namespace=None, location_base=None):
+    """Parse the given XML and use the document element to create a Python instance."""
+    if not (pyxb._XMLStyle in (pyxb.XMLStyle_saxer, pyxb.XMLStyle_expat)):
+        dom = pyxb.utils.domutils.StringToDOM(xml_text)
+        return CreateFromDOM(dom.documentElement)
+    saxer = pyxb.binding.saxer.make_parser(fallback_namespace=Namespace.fallbackNamespace(), location_base=location_base)
+    handler = saxer.getContentHandler()
+    saxer.parse(StringIO.StringIO(xml_text))
+    instance = handler.rootObject()
+    return instance
+
+def IterCreateFromStream (stream, path, default_namespace=None, location_base=None):
+    """Parse the XML read from the stream, yielding a Python instance for
+    each element matching the path as soon as that element is complete.
+
+    Yielded instances are detached from their parents; see
+    L{pyxb.binding.saxer.IterParse} for details and the path syntax."""
+    return pyxb.binding.saxer.IterParse(stream, path, fallback_namespace=Namespace.fallbackNamespace(), location_base=location_base)
+
+def CreateFeedParser (location_base=None):
+    """Return a L{pyxb.binding.saxer.FeedParser} that accepts the document
+    in pieces, and creates a Python instance from its document element when
+    closed."""
+    return pyxb.binding.saxer.FeedParser(fallback_namespace=Namespace.fallbackNamespace(), location_base=location_base)
+
+def CreateFromDOM (node, default_namespace=None):
+    """Create a Python instance from the given DOM node.
+    The node tag must correspond to an element declaration in this module.
+
+    @deprecated: Forcing use of DOM interface is unnecessary; use L{CreateFromDocument}."""
+    if default_namespace is None:
+        default_namespace = Namespace.fallbackNamespace()
+    return pyxb.binding.basis.element.AnyCreateFromDOM(node, _fallback_namespace=default_namespace)
+
+
+# Atomic SimpleTypeDefinition
+class english (pyxb.binding.datatypes.string, pyxb.binding.basis.enumeration_mixin):
+
+    """Some words in English.  Note that we specifically set the whitespace handling in this one to be collapse, as opposed to the welsh enumeration, so we can test that handling.."""
+
+    _ExpandedName = pyxb.namespace.ExpandedName(Namespace, u'english')
+    _Documentation = u'Some words in English.  Note that we specifically set the whitespace handling in this one to be collapse, as opposed to the welsh enumeration, so we can test that handling..'
+english._CF_whiteSpace = pyxb.binding.facets.CF_whiteSpace(value=pyxb.binding.facets._WhiteSpace_enum.collapse)
+english._CF_enumeration = pyxb.binding.facets.CF_enumeration(value_datatype=english, enum_prefix=None)
+english.one = english._CF_enumeration.addEnumeration(unicode_value=u'one')
+english.two = english._CF_enumeration.addEnumeration(unicode_value=u'two')
+english.three = english._CF_enumeration.addEnumeration(unicode_value=u'three')
+english._InitializeFacetMap(english._CF_whiteSpace,
+   english._CF_enumeration)
+Namespace.addCategoryObject('typeBinding', u'english', english)
+
+# Atomic SimpleTypeDefinition
+class welsh (pyxb.binding.datatypes.string, pyxb.binding.basis.enumeration_mixin):
+
+    """Some words in Welsh.  Note that we specifically set the whitespace handling in this one to be replace, as opposed to the english enumeration, so we can test that handling.."""
+
+    _ExpandedName = pyxb.namespace.ExpandedName(Namespace, u'welsh')
+    _Documentation = u'Some words in Welsh.  Note that we specifically set the whitespace handling in this one to be replace, as opposed to the english enumeration, so we can test that handling..'
+welsh._CF_whiteSpace = pyxb.binding.facets.CF_whiteSpace(value=pyxb.binding.facets._WhiteSpace_enum.replace)
+welsh._CF_enumeration = pyxb.binding.facets.CF_enumeration(value_datatype=welsh, enum_prefix=None)
+welsh.un = welsh._CF_enumeration.addEnumeration(unicode_value=u'un')
+welsh.dau = welsh._CF_enumeration.addEnumeration(unicode_value=u'dau')
+welsh.tri = welsh._CF_enumeration.addEnumeration(unicode_value=u'tri')
+welsh._InitializeFacetMap(welsh._CF_whiteSpace,
+   welsh._CF_enumeration)
+Namespace.addCategoryObject('typeBinding', u'welsh', welsh)
+
+# Union SimpleTypeDefinition
+# superclasses pyxb.binding.datatypes.anySimpleType
+class words (pyxb.binding.basis.STD_union):
+
+    """Simple type that is a union of english, welsh."""
+
+    _ExpandedName = pyxb.namespace.ExpandedName(Namespace, u'words')
+    _Documentation = None
+
+    _MemberTypes = ( english, welsh, )
+words._CF_pattern = pyxb.binding.facets.CF_pattern()
+words._CF_enumeration = pyxb.binding.facets.CF_enumeration(value_datatype=words)
+words.one = u'one'                                # originally english.one
+words.two = u'two'                                # originally english.two
+words.three = u'three'                            # originally english.three
+words.un = u'un'                                  # originally welsh.un
+words.dau = u'dau'                                # originally welsh.dau
+words.tri = u'tri'                                # originally welsh.tri
+words._InitializeFacetMap(words._CF_pattern,
+   words._CF_enumeration)
+Namespace.addCategoryObject('typeBinding', u'words', words)
+
+# Complex type langwords with content type SIMPLE
+class langwords (pyxb.binding.basis.complexTypeDefinition):
+    _TypeDefinition = words
+    _ContentTypeTag = pyxb.binding.basis.complexTypeDefinition._CT_SIMPLE
+    _Abstract = False
+    _ExpandedName = pyxb.namespace.ExpandedName(Namespace, u'langwords')
+    __slots__ = ('_URNshared_types_langwords_language',)
+    # Base type is words
+    
+    # Attribute language uses Python identifier language
+    __language = pyxb.binding.content.AttributeUse(pyxb.namespace.ExpandedName(None, u'language'), 'language', '_URNshared_types_langwords_language', pyxb.binding.datatypes.language)
+    
+    language = property(__language.value, __language.set, None, None)
+
+
+    _ElementMap = {
+        
+    }
+    _AttributeMap = {
+        __language.name() : __language
+    }
+Namespace.addCategoryObject('typeBinding', u'langwords', langwords)
+
+
+# Complex type personName with content type ELEMENT_ONLY
+class personName (pyxb.binding.basis.complexTypeDefinition):
+    _TypeDefinition = None
+    _ContentTypeTag = pyxb.binding.basis.complexTypeDefinition._CT_ELEMENT_ONLY
+    _Abstract = False
+    _ExpandedName = pyxb.namespace.ExpandedName(Namespace, u'personName')
+    __slots__ = ('_URNshared_types_personName_surname', '_URNshared_types_personName_title', '_URNshared_types_personName_forename', '_URNshared_types_personName_pAttr', '_URNshared_types_personName_pUse')
+    # Base type is pyxb.binding.datatypes.anyType
+    
+    # Element surname uses Python identifier surname
+    __surname = pyxb.binding.content.ElementUse(pyxb.namespace.ExpandedName(None, u'surname'), 'surname', '_URNshared_types_personName_surname', False)
+
+    
+    surname = property(__surname.value, __surname.set, None, None)
+
+    
+    # Element title uses Python identifier title
+    __title = pyxb.binding.content.ElementUse(pyxb.namespace.ExpandedName(None, u'title'), 'title', '_URNshared_types_personName_title', False)
+
+    
+    title = property(__title.value, __title.set, None, None)
+
+    
+    # Element forename uses Python identifier forename
+    __forename = pyxb.binding.content.ElementUse(pyxb.namespace.ExpandedName(None, u'forename'), 'forename', '_URNshared_types_personName_forename', True)
+
+    
+    forename = property(__forename.value, __forename.set, None, None)
+
+    
+    # Attribute pAttr uses Python identifier pAttr
+    __pAttr = pyxb.binding.content.AttributeUse(pyxb.namespace.ExpandedName(None, u'pAttr'), 'pAttr', '_URNshared_types_personName_pAttr', pyxb.binding.datatypes.string)
+    
+    pAttr = property(__pAttr.value, __pAttr.set, None, None)
+
+    
+    # Attribute pUse uses Python identifier pUse
+    __pUse = pyxb.binding.content.AttributeUse(pyxb.namespace.ExpandedName(None, u'pUse'), 'pUse', '_URNshared_types_personName_pUse', pyxb.binding.datatypes.string)
+    
+    pUse = property(__pUse.value, __pUse.set, None, None)
+
+
+    _ElementMap = {
+        __surname.name() : __surname,
+        __title.name() : __title,
+        __forename.name() : __forename
+    }
+    _AttributeMap = {
+        __pAttr.name() : __pAttr,
+        __pUse.name() : __pUse
+    }
+Namespace.addCategoryObject('typeBinding', u'personName', personName)
+
+
+# Complex type extendedName with content type ELEMENT_ONLY
+class extendedName (personName):
+    _TypeDefinition = None
+    _ContentTypeTag = pyxb.binding.basis.complexTypeDefinition._CT_ELEMENT_ONLY
+    _Abstract = False
+    _ExpandedName = pyxb.namespace.ExpandedName(Namespace, u'extendedName')
+    __slots__ = ('_URNshared_types_extendedName_generation', '_URNshared_types_extendedName_eAttr')
+    # Base type is personName
+    
+    # Element surname (surname) inherited from {URN:shared-types}personName
+    
+    # Element generation uses Python identifier generation
+    __generation = pyxb.binding.content.ElementUse(pyxb.namespace.ExpandedName(None, u'generation'), 'generation', '_URNshared_types_extendedName_generation', False)
+
+    
+    generation = property(__generation.value, __generation.set, None, None)
+
+    
+    # Element title (title) inherited from {URN:shared-types}personName
+    
+    # Element forename (forename) inherited from {URN:shared-types}personName
+    
+    # Attribute eAttr uses Python identifier eAttr
+    __eAttr = pyxb.binding.content.AttributeUse(pyxb.namespace.ExpandedName(None, u'eAttr'), 'eAttr', '_URNshared_types_extendedName_eAttr', pyxb.binding.datatypes.string)
+    
+    eAttr = property(__eAttr.value, __eAttr.set, None, None)
+
+    
+    # Attribute pAttr inherited from {URN:shared-types}personName
+    
+    # Attribute pUse inherited from {URN:shared-types}personName
+
+    _ElementMap = personName._ElementMap.copy()
+    _ElementMap.update({
+        __generation.name() : __generation
+    })
+    _AttributeMap = personName._AttributeMap.copy()
+    _AttributeMap.update({
+        __eAttr.name() : __eAttr
+    })
+Namespace.addCategoryObject('typeBinding', u'extendedName', extendedName)
+
+
+
+
+personName._AddElement(pyxb.binding.basis.element(pyxb.namespace.ExpandedName(None, u'surname'), pyxb.binding.datatypes.anyType, scope=personName))
+
+personName._AddElement(pyxb.binding.basis.element(pyxb.namespace.ExpandedName(None, u'title'), pyxb.binding.datatypes.anyType, scope=personName))
+
+personName._AddElement(pyxb.binding.basis.element(pyxb.namespace.ExpandedName(None, u'forename'), pyxb.binding.datatypes.anyType, scope=personName))
+personName._GroupModel = pyxb.binding.content.GroupSequence(
+    pyxb.binding.content.ParticleModel(personName._UseForTag(pyxb.namespace.ExpandedName(None, u'title')), min_occurs=0L, max_occurs=1),
+    pyxb.binding.content.ParticleModel(personName._UseForTag(pyxb.namespace.ExpandedName(None, u'forename')), min_occurs=0L, max_occurs=None),
+    pyxb.binding.content.ParticleModel(personName._UseForTag(pyxb.namespace.ExpandedName(None, u'surname')), min_occurs=1, max_occurs=1)
+    )
+personName._ContentModel = pyxb.binding.content.ParticleModel(personName._GroupModel, min_occurs=1, max_occurs=1)
+
+
+
+extendedName._AddElement(pyxb.binding.basis.element(pyxb.namespace.ExpandedName(None, u'generation'), pyxb.binding.datatypes.anyType, scope=extendedName))
+extendedName._GroupModel_ = pyxb.binding.content.GroupSequence(
+    pyxb.binding.content.ParticleModel(extendedName._UseForTag(pyxb.namespace.ExpandedName(None, u'title')), min_occurs=0L, max_occurs=1),
+    pyxb.binding.content.ParticleModel(extendedName._UseForTag(pyxb.namespace.ExpandedName(None, u'forename')), min_occurs=0L, max_occurs=None),
+    pyxb.binding.content.ParticleModel(extendedName._UseForTag(pyxb.namespace.ExpandedName(None, u'surname')), min_occurs=1, max_occurs=1)
+    )
+extendedName._GroupModel_2 = pyxb.binding.content.GroupSequence(
+    pyxb.binding.content.ParticleModel(extendedName._UseForTag(pyxb.namespace.ExpandedName(None, u'generation')), min_occurs=0L, max_occurs=1)
+    )
+extendedName._GroupModel = pyxb.binding.content.GroupSequence(
+    pyxb.binding.content.ParticleModel(extendedName._GroupModel_, min_occurs=1, max_occurs=1),
+    pyxb.binding.content.ParticleModel(extendedName._GroupModel_2, min_occurs=1, max_occurs=1)
+    )
+extendedName._ContentModel = pyxb.binding.content.ParticleModel(extendedName._GroupModel, min_occurs=1, max_occurs=1)
@@ -0,0 +1,223 @@
+# /dev/null
+# PyXB bindings for NamespaceModule
+# NSM:32cdf6ff8661336d082ead34216f16150f14edd4
+# Generated 2026-10-18 04:46:24.114510 by PyXB version 1.1.2
+import pyxb
+import pyxb.binding
+import pyxb.binding.saxer
+import StringIO
+import pyxb.utils.utility
+import pyxb.utils.domutils
+import sys
+
+# Unique identifier for bindings created at the same time
+_GenerationUID = pyxb.utils.utility.UniqueIdentifier('urn:uuid:df12075e-caae-11f1-8cf7-02fc00000001')
+
+# Import bindings for namespaces imported into schema
+import pyxb.binding.datatypes
+import st
+
+Namespace = pyxb.namespace.NamespaceForURI(u'URN:test-external', create_if_missing=True)
+Namespace.configureCategories(['typeBinding', 'elementBinding'])
+ModuleRecord = Namespace.lookupModuleRecordByUID(_GenerationUID, create_if_missing=True)
+ModuleRecord._setModule(sys.modules[__name__])
+
+def CreateFromDocument (xml_text, default_namespace=None, location_base=None):
+    """Parse the given XML and use the document element to create a Python instance."""
+    if not (pyxb._XMLStyle in (pyxb.XMLStyle_saxer, pyxb.XMLStyle_expat)):
+        dom = pyxb.utils.domutils.StringToDOM(xml_text)
+        return CreateFromDOM(dom.documentElement)
+    saxer = pyxb.binding.saxer.make_parser(fallback_namespace=Namespace.fallbackNamespace(), location_base=location_base)
+    handler = saxer.getContentHandler()
+    saxer.parse(StringIO.StringIO(xml_text))
+    instance = handler.rootObject()
+    return instance
+
+def IterCreateFromStream (stream, path, default_namespace=None, location_base=None):
+    """Parse the XML read from the stream, yielding a Python instance for
+    each element matching the path as soon as that element is complete.
+
+    Yielded instances are detached from their parents; see
+    L{pyxb.binding.saxer.IterParse} for details and the path syntax."""
+    return pyxb.binding.saxer.IterParse(stream, path, fallback_namespace=Namespace.fallbackNamespace(), location_base=location_base)
+
+def CreateFeedParser (location_base=None):
+    """Return a L{pyxb.binding.saxer.FeedParser} that accepts the document
+    in pieces, and creates a Python instance from its document element when
+    closed."""
+    return pyxb.binding.saxer.FeedParser(fallback_namespace=Namespace.fallbackNamespace(), location_base=location_base)
+
+def CreateFromDOM (node, default_namespace=None):
+    """Create a Python instance from the given DOM node.
+    The node tag must correspond to an element declaration in this module.
+
+    @deprecated: Forcing use of DOM interface is unnecessary; use L{CreateFromDocument}."""
+    if default_namespace is None:
+        default_namespace = Namespace.fallbackNamespace()
+    return pyxb.binding.basis.element.AnyCreateFromDOM(node, _fallback_namespace=default_namespace)
+
+
+# Atomic SimpleTypeDefinition
+class STD_ANON (pyxb.binding.datatypes.string, pyxb.binding.basis.enumeration_mixin):
+
+    """An atomic simple type."""
+
+    _ExpandedName = None
+    _Documentation = None
+STD_ANON._CF_enumeration = pyxb.binding.facets.CF_enumeration(value_datatype=STD_ANON, enum_prefix=None)
+STD_ANON.ichi = STD_ANON._CF_enumeration.addEnumeration(unicode_value=u'ichi')
+STD_ANON.ni = STD_ANON._CF_enumeration.addEnumeration(unicode_value=u'ni')
+STD_ANON.san = STD_ANON._CF_enumeration.addEnumeration(unicode_value=u'san')
+STD_ANON._InitializeFacetMap(STD_ANON._CF_enumeration)
+
+# Union SimpleTypeDefinition
+# superclasses pyxb.binding.datatypes.anySimpleType
+class uMorewords (pyxb.binding.basis.STD_union):
+
+    """Simple type that is a union of st.english, st.welsh, STD_ANON."""
+
+    _ExpandedName = pyxb.namespace.ExpandedName(Namespace, u'uMorewords')
+    _Documentation = None
+
+    _MemberTypes = ( st.english, st.welsh, STD_ANON, )
+uMorewords._CF_pattern = pyxb.binding.facets.CF_pattern()
+uMorewords._CF_enumeration = pyxb.binding.facets.CF_enumeration(value_datatype=uMorewords)
+uMorewords.one = u'one'                           # originally st.english.one
+uMorewords.two = u'two'                           # originally st.english.two
+uMorewords.three = u'three'                       # originally st.english.three
+uMorewords.un = u'un'                             # originally st.welsh.un
+uMorewords.dau = u'dau'                           # originally st.welsh.dau
+uMorewords.tri = u'tri'                           # originally st.welsh.tri
+uMorewords.ichi = u'ichi'                         # originally STD_ANON.ichi
+uMorewords.ni = u'ni'                             # originally STD_ANON.ni
+uMorewords.san = u'san'                           # originally STD_ANON.san
+uMorewords._InitializeFacetMap(uMorewords._CF_pattern,
+   uMorewords._CF_enumeration)
+Namespace.addCategoryObject('typeBinding', u'uMorewords', uMorewords)
+
+# Complex type extlangword with content type SIMPLE
+class extlangword (st.langwords):
+    _TypeDefinition = st.words
+    _ContentTypeTag = pyxb.binding.basis.complexTypeDefinition._CT_SIMPLE
+    _Abstract = False
+    _ExpandedName = pyxb.namespace.ExpandedName(Namespace, u'extlangword')
+    __slots__ = ('_URNtest_external_extlangword_newlanguage',)
+    # Base type is st.langwords
+    
+    # Attribute newlanguage uses Python identifier newlanguage
+    __newlanguage = pyxb.binding.content.AttributeUse(pyxb.namespace.ExpandedName(None, u'newlanguage'), 'newlanguage', '_URNtest_external_extlangword_newlanguage', pyxb.binding.datatypes.anySimpleType, unicode_default=u'welsh')
+    
+    newlanguage = property(__newlanguage.value, __newlanguage.set, None, None)
+
+    
+    # Attribute language inherited from {URN:shared-types}langwords
+
+    _ElementMap = st.langwords._ElementMap.copy()
+    _ElementMap.update({
+        
+    })
+    _AttributeMap = st.langwords._AttributeMap.copy()
+    _AttributeMap.update({
+        __newlanguage.name() : __newlanguage
+    })
+Namespace.addCategoryObject('typeBinding', u'extlangword', extlangword)
+
+
+# Complex type word_ with content type ELEMENT_ONLY
+class word_ (pyxb.binding.basis.complexTypeDefinition):
+    _TypeDefinition = None
+    _ContentTypeTag = pyxb.binding.basis.complexTypeDefinition._CT_ELEMENT_ONLY
+    _Abstract = False
+    _ExpandedName = pyxb.namespace.ExpandedName(Namespace, u'word')
+    __slots__ = ('_URNtest_external_word__to', '_URNtest_external_word__from')
+    # Base type is pyxb.binding.datatypes.anyType
+    
+    # Element to uses Python identifier to
+    __to = pyxb.binding.content.ElementUse(pyxb.namespace.ExpandedName(None, u'to'), 'to', '_URNtest_external_word__to', False)
+
+    
+    to = property(__to.value, __to.set, None, None)
+
+    
+    # Element from uses Python identifier from_
+    __from = pyxb.binding.content.ElementUse(pyxb.namespace.ExpandedName(None, u'from'), 'from_', '_URNtest_external_word__from', False)
+
+    
+    from_ = property(__from.value, __from.set, None, None)
+
+
+    _ElementMap = {
+        __to.name() : __to,
+        __from.name() : __from
+    }
+    _AttributeMap = {
+        
+    }
+Namespace.addCategoryObject('typeBinding', u'word', word_)
+
+
+# Complex type restExtName with content type ELEMENT_ONLY
+class restExtName (st.extendedName):
+    _TypeDefinition = None
+    _ContentTypeTag = pyxb.binding.basis.complexTypeDefinition._CT_ELEMENT_ONLY
+    _Abstract = False
+    _ExpandedName = pyxb.namespace.ExpandedName(Namespace, u'restExtName')
+    __slots__ = ()
+    # Base type is st.extendedName
+    
+    # Element forename (forename) inherited from {URN:shared-types}personName
+    
+    # Element generation (generation) inherited from {URN:shared-types}extendedName
+    
+    # Element title (title) inherited from {URN:shared-types}personName
+    
+    # Element surname (surname) inherited from {URN:shared-types}personName
+    
+    # Attribute eAttr inherited from {URN:shared-types}extendedName
+    
+    # Attribute pAttr inherited from {URN:shared-types}personName
+    
+    # Attribute pUse inherited from {URN:shared-types}personName
+
+    _ElementMap = st.extendedName._ElementMap.copy()
+    _ElementMap.update({
+        
+    })
+    _AttributeMap = st.extendedName._AttributeMap.copy()
+    _AttributeMap.update({
+        
+    })
+Namespace.addCategoryObject('typeBinding', u'restExtName', restExtName)
+
+
+lwords = pyxb.binding.basis.element(pyxb.namespace.ExpandedName(Namespace, u'lwords'), extlangword)
+Namespace.addCategoryObject('elementBinding', lwords.name().localName(), lwords)
+
+word = pyxb.binding.basis.element(pyxb.namespace.ExpandedName(Namespace, u'word'), word_)
+Namespace.addCategoryObject('elementBinding', word.name().localName(), word)
+
+morewords = pyxb.binding.basis.element(pyxb.namespace.ExpandedName(Namespace, u'morewords'), uMorewords)
+Namespace.addCategoryObject('elementBinding', morewords.name().localName(), morewords)
+
+english = pyxb.binding.basis.element(pyxb.namespace.ExpandedName(Namespace, u'english'), st.english)
+Namespace.addCategoryObject('elementBinding', english.name().localName(), english)
+
+
+
+word_._AddElement(pyxb.binding.basis.element(pyxb.namespace.ExpandedName(None, u'to'), st.welsh, scope=word_))
+
+word_._AddElement(pyxb.binding.basis.element(pyxb.namespace.ExpandedName(None, u'from'), st.english, scope=word_))
+word_._GroupModel = pyxb.binding.content.GroupSequence(
+    pyxb.binding.content.ParticleModel(word_._UseForTag(pyxb.namespace.ExpandedName(None, u'from')), min_occurs=1, max_occurs=1),
+    pyxb.binding.content.ParticleModel(word_._UseForTag(pyxb.namespace.ExpandedName(None, u'to')), min_occurs=1, max_occurs=1)
+    )
+word_._ContentModel = pyxb.binding.content.ParticleModel(word_._GroupModel, min_occurs=1, max_occurs=1)
+
+
+restExtName._GroupModel_3 = pyxb.binding.content.GroupSequence(
+    pyxb.binding.content.ParticleModel(restExtName._UseForTag(pyxb.namespace.ExpandedName(None, u'title')), min_occurs=0L, max_occurs=1),
+    pyxb.binding.content.ParticleModel(restExtName._UseForTag(pyxb.namespace.ExpandedName(None, u'forename')), min_occurs=0L, max_occurs=None),
+    pyxb.binding.content.ParticleModel(restExtName._UseForTag(pyxb.namespace.ExpandedName(None, u'surname')), min_occurs=1, max_occurs=1),
+    pyxb.binding.content.ParticleModel(restExtName._UseForTag(pyxb.namespace.ExpandedName(None, u'generation')), min_occurs=1L, max_occurs=1)
+    )
+restExtName._ContentModel_ = pyxb.binding.content.ParticleModel(restExtName._GroupModel_3, min_occurs=1, max_occurs=1)
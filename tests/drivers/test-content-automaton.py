@@ -0,0 +1,166 @@
+import pyxb.binding.generate
+import pyxb.binding.content
+import pyxb.utils.domutils
+
+import os.path
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:complexType name="tCounted">
+    <xs:sequence>
+      <xs:sequence minOccurs="2" maxOccurs="3">
+        <xs:element name="a" type="xs:int"/>
+        <xs:element name="b" type="xs:int" minOccurs="0"/>
+      </xs:sequence>
+      <xs:element name="c" type="xs:int" minOccurs="0"/>
+    </xs:sequence>
+  </xs:complexType>
+  <xs:element name="counted" type="tCounted"/>
+  <xs:complexType name="tChoices">
+    <xs:choice maxOccurs="unbounded">
+      <xs:element name="a" type="xs:int"/>
+      <xs:sequence>
+        <xs:element name="b" type="xs:int"/>
+        <xs:element name="c" type="xs:int" maxOccurs="2"/>
+      </xs:sequence>
+    </xs:choice>
+  </xs:complexType>
+  <xs:element name="choices" type="tChoices"/>
+  <xs:complexType name="tAll">
+    <xs:all>
+      <xs:element name="a" type="xs:int"/>
+      <xs:element name="b" type="xs:int" minOccurs="0"/>
+      <xs:element name="c" type="xs:int"/>
+    </xs:all>
+  </xs:complexType>
+  <xs:element name="all" type="tAll"/>
+  <xs:complexType name="tWild">
+    <xs:sequence>
+      <xs:element name="a" type="xs:int"/>
+      <xs:any processContents="lax" namespace="##any" minOccurs="0" maxOccurs="2"/>
+    </xs:sequence>
+  </xs:complexType>
+  <xs:element name="wild" type="tWild"/>
+  <xs:complexType name="tS">
+    <xs:sequence>
+      <xs:sequence minOccurs="0" maxOccurs="unbounded">
+        <xs:element name="a" type="xs:int"/>
+        <xs:element name="b" type="xs:int"/>
+      </xs:sequence>
+      <xs:element name="c" type="xs:int"/>
+      <xs:element name="a" type="xs:int" minOccurs="0"/>
+    </xs:sequence>
+  </xs:complexType>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+from pyxb.exceptions_ import *
+
+def CreateFromDOMText (xmls):
+    return CreateFromDOM(pyxb.utils.domutils.StringToDOM(xmls))
+
+import unittest
+
+class TestContentAutomaton (unittest.TestCase):
+    Engine = pyxb.binding.content.ENGINE_AUTOMATON
+
+    def setUp (self):
+        self.__engine = pyxb.binding.content.CURRENT_ENGINE
+        pyxb.binding.content.ConfigureContentModelEngine(self.Engine)
+
+    def tearDown (self):
+        pyxb.binding.content.ConfigureContentModelEngine(self.__engine)
+
+    def testEngine (self):
+        self.assertEqual(self.Engine, pyxb.binding.content.CURRENT_ENGINE)
+        self.assertRaises(pyxb.LogicError, pyxb.binding.content.ConfigureContentModelEngine, 'bogus')
+
+    def testAutomatonCached (self):
+        cm = tCounted._ContentModel
+        self.assertTrue(cm.automaton() is cm.automaton())
+
+    def testCounted (self):
+        instance = CreateFromDocument('<counted><a>1</a><a>2</a></counted>')
+        self.assertEqual([1, 2], instance.a)
+        instance = CreateFromDocument('<counted><a>1</a><b>2</b><a>3</a><a>4</a><c>5</c></counted>')
+        self.assertEqual([1, 3, 4], instance.a)
+        self.assertEqual([2], instance.b)
+        self.assertEqual(5, instance.c)
+
+    def testCountedTooFew (self):
+        self.assertRaises(MissingContentError, CreateFromDOMText, '<counted><a>1</a></counted>')
+        self.assertRaises(UnrecognizedContentError, CreateFromDocument, '<counted><a>1</a><c>2</c></counted>')
+
+    def testCountedTooMany (self):
+        self.assertRaises(ExtraContentError, CreateFromDocument, '<counted><a>1</a><a>2</a><a>3</a><a>4</a></counted>')
+
+    def testChoices (self):
+        instance = CreateFromDocument('<choices><a>1</a><b>2</b><c>3</c><c>4</c><a>5</a><b>6</b><c>7</c></choices>')
+        self.assertEqual([1, 5], instance.a)
+        self.assertEqual([2, 6], instance.b)
+        self.assertEqual([3, 4, 7], instance.c)
+        self.assertRaises(UnrecognizedContentError, CreateFromDocument, '<choices><b>2</b><a>1</a></choices>')
+        self.assertRaises(ExtraContentError, CreateFromDocument, '<choices><b>2</b><c>3</c><c>4</c><c>5</c></choices>')
+
+    def testAll (self):
+        instance = CreateFromDocument('<all><c>3</c><a>1</a></all>')
+        self.assertEqual(1, instance.a)
+        self.assertEqual(3, instance.c)
+        instance = CreateFromDocument('<all><b>2</b><c>3</c><a>1</a></all>')
+        self.assertEqual(2, instance.b)
+        self.assertRaises(MissingContentError, CreateFromDOMText, '<all><b>2</b><c>3</c></all>')
+        self.assertRaises(ExtraContentError, CreateFromDocument, '<all><a>1</a><c>3</c><a>1</a></all>')
+
+    def testWildcard (self):
+        instance = CreateFromDocument('<wild><a>1</a><x/><y/></wild>')
+        self.assertEqual(2, len(instance.wildcardElements()))
+        self.assertRaises(ExtraContentError, CreateFromDocument, '<wild><a>1</a><x/><y/><z/></wild>')
+
+    def testPositional (self):
+        instance = tCounted(1, 2, 3)
+        self.assertEqual([1, 3], instance.a)
+        self.assertEqual([2], instance.b)
+        instance = tChoices(1, 2)
+        self.assertEqual([1, 2], instance.a)
+
+    def testOrdering (self):
+        xmls = '<counted><a>1</a><b>2</b><a>3</a><a>4</a><c>5</c></counted>'
+        instance = CreateFromDocument(xmls)
+        self.assertEqual(xmls, instance.toxml(root_only=True))
+        instance = tCounted(a=[1, 3], b=[2], c=5)
+        self.assertEqual('<tCounted><a>1</a><b>2</b><a>3</a><c>5</c></tCounted>', instance.toxml(root_only=True))
+        instance = tCounted(a=[1, 2, 3, 4])
+        self.assertRaises(pyxb.BindingValidationError, instance.toxml)
+        instance = tCounted(a=[1])
+        self.assertRaises(pyxb.DOMGenerationError, instance.toxml)
+
+    def testOrderingBacktrack (self):
+        # Taking both values of a in the repetition leaves no b to follow
+        # the second; the order is only found by backtracking.
+        instance = tS(a=[1, 4], b=[2], c=3)
+        self.assertEqual('<tS><a>1</a><b>2</b><c>3</c><a>4</a></tS>', instance.toxml(root_only=True))
+        instance = tS(a=[1, 4], b=[2])
+        self.assertRaises(pyxb.DOMGenerationError, instance.toxml)
+
+    def testOrderingAll (self):
+        xmls = '<all><c>3</c><b>2</b><a>1</a></all>'
+        instance = CreateFromDocument(xmls)
+        self.assertEqual('<all><a>1</a><b>2</b><c>3</c></all>', instance.toxml(root_only=True))
+
+    def testOrderingLarge (self):
+        instance = tChoices(a=range(500), b=[1], c=[2, 3])
+        order = instance._validatedChildren()
+        self.assertEqual(503, len(order))
+        self.assertEqual([ 'a' ] * 500 + [ 'b', 'c', 'c' ], [ _eu.id() for (_eu, _v) in order ])
+        self.assertEqual(range(500), [ _v for (_eu, _v) in order[:500] ])
+
+class TestParticleStateEngine (TestContentAutomaton):
+    Engine = pyxb.binding.content.ENGINE_PARTICLE_STATE
+
+    def testCountedTooFew (self):
+        self.assertRaises(MissingContentError, CreateFromDOMText, '<counted><a>1</a></counted>')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+import pyxb.binding.generate
+import pyxb.binding.saxer
+import pyxb.utils.domutils
+import StringIO
+
+import os.path
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:simpleType name="tSmall">
+    <xs:restriction base="xs:int">
+      <xs:maxInclusive value="10"/>
+    </xs:restriction>
+  </xs:simpleType>
+  <xs:complexType name="tMeasure">
+    <xs:simpleContent>
+      <xs:extension base="tSmall">
+        <xs:attribute name="unit" type="xs:string"/>
+      </xs:extension>
+    </xs:simpleContent>
+  </xs:complexType>
+  <xs:complexType name="tRecord">
+    <xs:sequence>
+      <xs:element name="name" type="xs:string"/>
+      <xs:element name="size" type="tSmall" maxOccurs="unbounded"/>
+      <xs:element name="weight" type="tMeasure" minOccurs="0"/>
+      <xs:element name="note" type="xs:string" minOccurs="0" nillable="true"/>
+    </xs:sequence>
+    <xs:attribute name="rank" type="tSmall"/>
+  </xs:complexType>
+  <xs:element name="record" type="tRecord"/>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+from pyxb.exceptions_ import *
+
+import unittest
+
+def CreateDeferred (xmls):
+    saxer = pyxb.binding.saxer.make_parser(fallback_namespace=Namespace.fallbackNamespace(), defer_conversion=True)
+    handler = saxer.getContentHandler()
+    saxer.parse(StringIO.StringIO(xmls))
+    return handler.rootObject()
+
+def StoredValue (instance, name):
+    return tRecord._ElementMap[pyxb.namespace.ExpandedName(None, name)]._storedValue(instance)
+
+class TestDeferredParse (unittest.TestCase):
+    def testEquivalent (self):
+        xmls = '<record rank="3"><name>n</name><size>1</size><size>2</size><weight unit="kg">4</weight></record>'
+        validated = CreateFromDocument(xmls)
+        deferred = CreateDeferred(xmls)
+        self.assertEqual(validated.name, deferred.name)
+        self.assertEqual(validated.size, deferred.size)
+        self.assertTrue(isinstance(deferred.size[0], tSmall))
+        self.assertEqual(validated.weight.value(), deferred.weight.value())
+        self.assertEqual('kg', deferred.weight.unit)
+        self.assertEqual(3, deferred.rank)
+        self.assertTrue(isinstance(deferred.rank, tSmall))
+        self.assertEqual(xmls, deferred.toxml(root_only=True))
+
+    def testDeferred (self):
+        deferred = CreateDeferred('<record><name>n</name><size>1</size><size>2</size></record>')
+        self.assertTrue(isinstance(StoredValue(deferred, 'name'), pyxb.binding.basis._DeferredValue))
+        self.assertTrue(isinstance(StoredValue(deferred, 'size')[1], pyxb.binding.basis._DeferredValue))
+        name = deferred.name
+        self.assertTrue(isinstance(name, pyxb.binding.datatypes.string))
+        self.assertTrue(name is StoredValue(deferred, 'name'))
+        self.assertTrue(name is deferred.name)
+        self.assertEqual(name._element(), tRecord._ElementMap[pyxb.namespace.ExpandedName(None, 'name')].elementBinding())
+        self.assertTrue(isinstance(StoredValue(deferred, 'size')[1], pyxb.binding.basis._DeferredValue))
+        size = deferred.size
+        self.assertEqual([1, 2], size)
+        self.assertTrue(size[1] is StoredValue(deferred, 'size')[1])
+
+    def testContent (self):
+        deferred = CreateDeferred('<record><name>n</name><size>1</size><size>2</size></record>')
+        content = deferred.content()
+        self.assertEqual(3, len(content))
+        self.assertTrue(content[0] is deferred.name)
+        self.assertTrue(content[2] is deferred.size[1])
+
+    def testErrorOnAccess (self):
+        xmls = '<record rank="30"><name>n</name><size>1</size><size>20</size></record>'
+        self.assertRaises(BadTypeValueError, CreateFromDocument, xmls)
+        deferred = CreateDeferred(xmls)
+        self.assertEqual('n', deferred.name)
+        self.assertRaises(BadTypeValueError, getattr, deferred, 'size')
+        self.assertRaises(BadTypeValueError, getattr, deferred, 'rank')
+
+    def testValidateBinding (self):
+        # Explicit validation checks the deferred values, as parsing
+        # without deferral would
+        deferred = CreateDeferred('<record><name>n</name><size>1</size><size>20</size></record>')
+        self.assertRaises(BadTypeValueError, deferred.validateBinding)
+        self.assertRaises(BadTypeValueError, deferred.toxml)
+        deferred = CreateDeferred('<record rank="30"><name>n</name><size>1</size></record>')
+        self.assertRaises(BadTypeValueError, deferred.validateBinding)
+        self.assertRaises(BadTypeValueError, deferred.toxml)
+        deferred = CreateDeferred('<record rank="3"><name>n</name><size>1</size><size>2</size></record>')
+        self.assertTrue(deferred.validateBinding())
+        self.assertFalse(isinstance(StoredValue(deferred, 'size')[1], pyxb.binding.basis._DeferredValue))
+        self.assertTrue(isinstance(deferred.rank, tSmall))
+
+    def testStructureValidated (self):
+        self.assertRaises(BindingValidationError, CreateDeferred, '<record><name>n</name></record>')
+        self.assertRaises(UnrecognizedContentError, CreateDeferred, '<record><size>1</size></record>')
+        self.assertRaises(UnrecognizedContentError, CreateDeferred, '<record><name>n</name><name>m</name></record>')
+
+    def testNil (self):
+        deferred = CreateDeferred('<record xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"><name>n</name><size>1</size><note xsi:nil="true"/></record>')
+        self.assertFalse(isinstance(StoredValue(deferred, 'note'), pyxb.binding.basis._DeferredValue))
+        self.assertTrue(deferred.note._isNil())
+
+    def testGlobal (self):
+        self.assertFalse(pyxb.DeferConversionWhenParsing())
+        try:
+            self.assertTrue(pyxb.DeferConversionWhenParsing(True))
+            instance = CreateFromDocument('<record><name>n</name><size>11</size></record>')
+            self.assertTrue(isinstance(StoredValue(instance, 'size')[0], pyxb.binding.basis._DeferredValue))
+        finally:
+            pyxb.DeferConversionWhenParsing(False)
+        self.assertRaises(BadTypeValueError, CreateFromDocument, '<record><name>n</name><size>11</size></record>')
+
+if __name__ == '__main__':
+    unittest.main()
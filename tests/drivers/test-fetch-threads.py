@@ -0,0 +1,65 @@
+import pyxb.binding.generate
+import pyxb.xmlschema
+import pyxb.utils.utility
+import os.path
+import tempfile
+import shutil
+
+schema_dir = os.path.realpath('%s/../schemas' % (os.path.dirname(__file__),))
+def SchemaPath (name):
+    return os.path.join(schema_dir, name)
+
+generator = pyxb.binding.generate.Generator(SchemaPath('test-multidoc.xsd'), generate_to_files=False, fetch_threads=4)
+modules = generator.bindingModules()
+
+import unittest
+
+class TestFetchThreads (unittest.TestCase):
+    def testPrefetch (self):
+        document_map = { }
+        locations = pyxb.xmlschema.schema.PrefetchDocuments([ SchemaPath('test-multidoc.xsd') ], threads=4, document_map=document_map)
+        self.assertEqual([ SchemaPath(_n) for _n in ( 'test-multidoc.xsd', 'test-multidoc-part1.xsd', 'test-multidoc-part2.xsd', 'test-multidoc-other.xsd' ) ], locations)
+        self.assertEqual(locations, pyxb.xmlschema.schema.PrefetchDocuments([ SchemaPath('test-multidoc.xsd') ]))
+        self.assertEqual(set(locations), set(document_map.keys()))
+        self.assertEqual(file(SchemaPath('test-multidoc-part1.xsd')).read(), document_map[SchemaPath('test-multidoc-part1.xsd')])
+
+    def testDocumentMap (self):
+        location = SchemaPath('absent/mapped.xsd')
+        other_xsd = file(SchemaPath('test-multidoc-other.xsd')).read()
+        document_map = { location : other_xsd.replace('urn:multidoc:other', 'urn:multidoc:mapped') }
+        schema = pyxb.xmlschema.schema.CreateFromLocation(absolute_schema_location=location, schema_document_map=document_map, generation_uid=pyxb.utils.utility.UniqueIdentifier())
+        self.assertEqual('urn:multidoc:mapped', schema.targetNamespace().uri())
+        self.assertEqual(location, schema.location())
+        self.assertEqual(0, len(document_map))
+
+    def testArchiveSameBaseName (self):
+        # Many documents with the same base name, retrieved concurrently,
+        # must each be archived under a distinct name.
+        num_parts = 200
+        part2_xsd = file(SchemaPath('test-multidoc-part2.xsd')).read()
+        root = tempfile.mkdtemp()
+        try:
+            part_root = os.path.join(root, 'parts')
+            includes = []
+            for i in xrange(num_parts):
+                os.makedirs(os.path.join(part_root, 'd%d' % (i,)))
+                file(os.path.join(part_root, 'd%d' % (i,), 'x.xsd'), 'w').write(part2_xsd.replace('tPart2', 'tPart2_%d' % (i,)))
+                includes.append('<xs:include schemaLocation="d%d/x.xsd"/>' % (i,))
+            file(os.path.join(part_root, 'x.xsd'), 'w').write(part2_xsd.replace('</xs:schema>', '%s</xs:schema>' % (''.join(includes),)))
+            archive_directory = os.path.join(root, 'archive')
+            locations = pyxb.xmlschema.schema.PrefetchDocuments([ 'file://%s/x.xsd' % (part_root,) ], threads=16, uri_content_archive_directory=archive_directory)
+            self.assertEqual(1 + num_parts, len(locations))
+            archived = os.listdir(archive_directory)
+            self.assertEqual(1 + num_parts, len(archived))
+            self.assertTrue('x.xsd' in archived)
+            self.assertTrue('x.xsd.%d' % (num_parts,) in archived)
+        finally:
+            shutil.rmtree(root)
+
+    def testGenerate (self):
+        self.assertEqual(4, generator.fetchThreads())
+        self.assertEqual(set([ 'urn:multidoc', 'urn:multidoc:other' ]), set([ _m.namespace().uri() for _m in modules ]))
+        self.assertEqual(3, pyxb.binding.generate.Generator(argv=['--fetch-threads=3']).fetchThreads())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import pyxb.binding.generate
+import os.path
+import tempfile
+import shutil
+import glob
+
+schema_dir = '%s/../schemas' % (os.path.dirname(__file__),)
+
+# Generation writes into the directory holding the schemas, and the tests
+# modify one of them, so work on copies.
+root = tempfile.mkdtemp()
+def RootPath (name):
+    return os.path.join(root, name)
+for path in glob.glob(os.path.join(schema_dir, 'test-multidoc*.xsd')):
+    shutil.copy(path, root)
+part_path = RootPath('test-multidoc-part2.xsd')
+part_xsd = file(part_path).read()
+
+def MakeGenerator (**kw):
+    kw.setdefault('incremental', True)
+    kw.setdefault('module_list', [ 'inc' ])
+    return pyxb.binding.generate.Generator(RootPath('test-multidoc.xsd'), binding_root=root, archive_to_file=RootPath('inc.wxs'),
+                                           namespace_module_map={ 'urn:multidoc:other' : 'inc_other' }, **kw)
+
+generator = MakeGenerator()
+initially_up_to_date = generator.isUpToDate()
+for m in generator.bindingModules():
+    m.writeToModuleFile()
+generator.writeNamespaceArchive()
+generator.writeSignatures()
+
+import unittest
+
+class TestGenerateIncremental (unittest.TestCase):
+    def tearDown (self):
+        file(part_path, 'w').write(part_xsd)
+
+    def testOptions (self):
+        self.assertFalse(pyxb.binding.generate.Generator().incremental())
+        g = pyxb.binding.generate.Generator(argv=['--incremental', '--signature-file=sigs'])
+        self.assertTrue(g.incremental())
+        self.assertEqual('sigs', g.signatureFile())
+
+    def testRecorded (self):
+        self.assertFalse(initially_up_to_date)
+        self.assertTrue(os.path.exists(RootPath(generator.signatureFile())))
+        self.assertTrue(MakeGenerator().isUpToDate())
+        self.assertFalse(MakeGenerator(incremental=False).isUpToDate())
+
+    def testConfiguration (self):
+        self.assertFalse(MakeGenerator(module_list=[ 'inc2' ]).isUpToDate())
+        self.assertFalse(MakeGenerator(signature_file='other.sig').isUpToDate())
+
+    def testIncludeChanged (self):
+        file(part_path, 'w').write(part_xsd.replace('name=', 'label='))
+        self.assertFalse(MakeGenerator().isUpToDate())
+        file(part_path, 'w').write(part_xsd)
+        self.assertTrue(MakeGenerator().isUpToDate())
+
+    def testOutputChanged (self):
+        module_path = RootPath('inc.py')
+        text = file(module_path).read()
+        file(module_path, 'w').write(text + '# edited\n')
+        self.assertFalse(MakeGenerator().isUpToDate())
+        file(module_path, 'w').write(text)
+        self.assertTrue(MakeGenerator().isUpToDate())
+
+    def testSchemaInstance (self):
+        g = MakeGenerator()
+        g.addSchema(object())
+        self.assertFalse(g.isUpToDate())
+
+if __name__ == '__main__':
+    try:
+        unittest.main()
+    finally:
+        shutil.rmtree(root)
@@ -0,0 +1,51 @@
+import pyxb.binding.generate
+import pyxb.utils.domutils
+import sys
+import imp
+
+import os.path
+schema_path = '%s/../schemas/test-jobs-a.xsd' % (os.path.dirname(__file__),)
+
+generator = pyxb.binding.generate.Generator(generate_to_files=False, module_prefix='jobs', jobs=2)
+generator.addSchemaLocation(schema_path)
+modules = generator.bindingModules()
+
+# Install the generated modules so the import of the B bindings within the A
+# bindings is resolved.
+jobs = sys.modules['jobs'] = imp.new_module('jobs')
+bindings = {}
+for m in modules:
+    module_path = m.modulePath()
+    if module_path is None:
+        module_path = 'jobs.a'
+    bindings[m.namespace().uri()] = module = imp.new_module(module_path)
+    sys.modules[module_path] = module
+    setattr(jobs, module_path.split('.')[-1], module)
+    exec compile(m.moduleContents(), module_path, 'exec') in module.__dict__
+a = bindings['urn:jobs:a']
+b = bindings['urn:jobs:b']
+
+import unittest
+
+class TestGenerateJobs (unittest.TestCase):
+    def testJobs (self):
+        self.assertEqual(2, generator.jobs())
+        self.assertEqual(1, pyxb.binding.generate.Generator().jobs())
+        g = pyxb.binding.generate.Generator(argv=['--jobs=4'])
+        self.assertEqual(4, g.jobs())
+
+    def testModules (self):
+        self.assertEqual(2, len(modules))
+        for m in modules:
+            self.assertEqual(1, m.moduleContents().count('# PyXB bindings for NamespaceModule'))
+
+    def testBindings (self):
+        xmls = '<a:a xmlns:a="urn:jobs:a" name="x"><a:b><b:amount xmlns:b="urn:jobs:b">3</b:amount></a:b><a:code>one</a:code><a:code>two</a:code></a:a>'
+        instance = a.CreateFromDocument(xmls)
+        self.assertTrue(isinstance(instance.b, b.tB))
+        self.assertEqual(3, instance.b.amount)
+        self.assertEqual([ b.tCode.one, b.tCode.two ], instance.code)
+        self.assertEqual(3, a.CreateFromDocument(instance.toxml()).b.amount)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+import pyxb.binding.generate
+import pyxb.binding.saxer
+import pyxb.utils.domutils
+import StringIO
+import xml.sax
+
+import os.path
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:complexType name="tSchedule">
+    <xs:sequence>
+      <xs:element name="program" type="xs:string"/>
+      <xs:element name="duration" type="xs:int"/>
+    </xs:sequence>
+    <xs:attribute name="station" type="xs:int"/>
+  </xs:complexType>
+  <xs:element name="listing">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="title" type="xs:string"/>
+        <xs:element name="schedules">
+          <xs:complexType>
+            <xs:sequence>
+              <xs:element name="schedule" type="tSchedule" maxOccurs="unbounded"/>
+            </xs:sequence>
+          </xs:complexType>
+        </xs:element>
+        <xs:element name="schedule" type="tSchedule" minOccurs="0"/>
+        <xs:element name="count" type="xs:int"/>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+from pyxb.exceptions_ import *
+
+import unittest
+
+def MakeListing (count, extra=False):
+    schedules = [ '<schedule station="%d"><program>p%d</program><duration>%d</duration></schedule>' % (_i, _i, 30 * _i) for _i in xrange(count) ]
+    if extra:
+        trailer = '<schedule station="-1"><program>extra</program><duration>5</duration></schedule>'
+    else:
+        trailer = ''
+    return '<listing><title>Listing</title><schedules>%s</schedules>%s<count>%d</count></listing>' % (''.join(schedules), trailer, count)
+
+class TestIterParse (unittest.TestCase):
+    def testBasic (self):
+        xmls = MakeListing(5)
+        schedules = list(IterCreateFromStream(StringIO.StringIO(xmls), 'schedules/schedule'))
+        self.assertEqual(5, len(schedules))
+        for i in xrange(5):
+            self.assertTrue(isinstance(schedules[i], tSchedule))
+            self.assertEqual(i, schedules[i].station)
+            self.assertEqual('p%d' % (i,), schedules[i].program)
+            self.assertEqual(30 * i, schedules[i].duration)
+
+    def testSuffixMatch (self):
+        xmls = MakeListing(3, extra=True)
+        schedules = list(IterCreateFromStream(StringIO.StringIO(xmls), 'schedule'))
+        self.assertEqual(4, len(schedules))
+        self.assertEqual([0, 1, 2, -1], [ _s.station for _s in schedules ])
+        schedules = list(IterCreateFromStream(StringIO.StringIO(xmls), '/listing/schedule'))
+        self.assertEqual(1, len(schedules))
+        self.assertEqual('extra', schedules[0].program)
+        self.assertEqual([], list(IterCreateFromStream(StringIO.StringIO(xmls), '/schedules/schedule')))
+        self.assertEqual(3, len(list(IterCreateFromStream(StringIO.StringIO(xmls), '{}schedules/{}schedule'))))
+        self.assertEqual(0, len(list(IterCreateFromStream(StringIO.StringIO(xmls), '{urn:other}schedules/schedule'))))
+
+    def testSimpleContent (self):
+        xmls = MakeListing(2)
+        self.assertEqual([0, 30], list(IterCreateFromStream(StringIO.StringIO(xmls), 'schedule/duration')))
+
+    def testIncremental (self):
+        xmls = MakeListing(50)
+        stream = StringIO.StringIO(xmls)
+        chunk_size = pyxb.binding.saxer._IterParseChunkSize
+        pyxb.binding.saxer._IterParseChunkSize = 256
+        try:
+            schedules = IterCreateFromStream(stream, 'schedule')
+            first = schedules.next()
+            self.assertEqual(0, first.station)
+            self.assertTrue(stream.tell() < len(xmls))
+            self.assertEqual(49, len(list(schedules)))
+        finally:
+            pyxb.binding.saxer._IterParseChunkSize = chunk_size
+
+    def testDetached (self):
+        xmls = MakeListing(4)
+        saxer = pyxb.binding.saxer.make_parser(fallback_namespace=Namespace.fallbackNamespace(), stream_path='schedules/schedule')
+        handler = saxer.getContentHandler()
+        saxer.parse(StringIO.StringIO(xmls))
+        self.assertEqual(4, len(handler.streamedObjects()))
+        self.assertEqual(0, len(handler.streamedObjects()))
+        instance = handler.rootObject()
+        self.assertEqual('Listing', instance.title)
+        self.assertEqual(4, instance.count)
+        self.assertEqual(0, len(instance.schedules.schedule))
+
+    def testInvalidRecord (self):
+        xmls = '<listing><title>t</title><schedules><schedule><program>p</program></schedule></schedules><count>1</count></listing>'
+        self.assertRaises(pyxb.BindingValidationError, list, IterCreateFromStream(StringIO.StringIO(xmls), 'schedule'))
+
+    def testBadPath (self):
+        self.assertRaises(pyxb.UsageError, pyxb.binding.saxer.make_parser, stream_path='schedules//schedule')
+
+class TestFeedParser (unittest.TestCase):
+    def testFeed (self):
+        xmls = MakeListing(20)
+        parser = CreateFeedParser()
+        for i in xrange(0, len(xmls), 7):
+            parser.feed(xmls[i:i+7])
+        instance = parser.close()
+        self.assertEqual('Listing', instance.title)
+        self.assertEqual(20, len(instance.schedules.schedule))
+        self.assertEqual(19, instance.schedules.schedule[19].station)
+        self.assertEqual(20, instance.count)
+
+    def testReuse (self):
+        parser = CreateFeedParser()
+        instance = parser.feed(MakeListing(2)).close()
+        self.assertEqual(2, instance.count)
+        instance = parser.feed(MakeListing(3)).close()
+        self.assertEqual(3, instance.count)
+        self.assertEqual(3, len(instance.schedules.schedule))
+
+    def testProgress (self):
+        xmls = MakeListing(3)
+        parser = pyxb.binding.saxer.FeedParser(fallback_namespace=Namespace.fallbackNamespace(), stream_path='schedule')
+        split = xmls.index('</schedule>') + len('</schedule>')
+        parser.feed(xmls[:split])
+        self.assertEqual(1, len(parser.streamedObjects()))
+        parser.feed(xmls[split:])
+        self.assertEqual(2, len(parser.streamedObjects()))
+        instance = parser.close()
+        self.assertEqual(3, instance.count)
+
+    def testIncomplete (self):
+        parser = CreateFeedParser()
+        parser.feed(MakeListing(2)[:40])
+        self.assertRaises(xml.sax.SAXParseException, parser.close)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import pyxb.binding.generate
+import pyxb.utils.domutils
+import pyxb.namespace
+from xml.dom import Node
+
+import os.path
+
+# A derivation chain declared with each type preceding its base, so that every
+# type is encountered before the type it depends on has been resolved.
+Depth = 100
+types = [ '<xs:simpleType name="s0"><xs:restriction base="xs:string"/></xs:simpleType>',
+          '<xs:complexType name="t0"><xs:simpleContent><xs:extension base="tns:s0"><xs:attribute name="a0" type="xs:int"/></xs:extension></xs:simpleContent></xs:complexType>' ]
+for i in range(1, Depth):
+    types.append('<xs:simpleType name="s%d"><xs:restriction base="tns:s%d"/></xs:simpleType>' % (i, i-1))
+    types.append('<xs:complexType name="t%d"><xs:simpleContent><xs:extension base="tns:t%d"><xs:attribute name="a%d" type="xs:int"/></xs:extension></xs:simpleContent></xs:complexType>' % (i, i-1, i))
+types.reverse()
+
+xsd = '''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" targetNamespace="urn:worklist" xmlns:tns="urn:worklist">
+%s
+<xs:element name="top" type="tns:t%d"/>
+<xs:element name="leaf" type="tns:s%d"/>
+</xs:schema>''' % ("\n".join(types), Depth-1, Depth-1)
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+from pyxb.exceptions_ import *
+
+import unittest
+
+class TestResolutionWorklist (unittest.TestCase):
+    def testResolveCallCount (self):
+        ns = pyxb.namespace.NamespaceForURI('urn:worklist')
+        self.assertFalse(ns.needsResolution())
+        # Each component is retried at most once after the component it
+        # waits on has been resolved.
+        self.assertTrue(ns.resolveCallCount() < 6 * Depth)
+
+    def testBindings (self):
+        instance = top('text', a0=0, a99=99)
+        self.assertEqual('text', instance.value())
+        self.assertEqual(0, instance.a0)
+        self.assertEqual(99, instance.a99)
+        xml = instance.toxml()
+        instance = CreateFromDocument(xml)
+        self.assertEqual(99, instance.a99)
+        self.assertTrue(issubclass(s99, s0))
+        self.assertTrue(issubclass(t99, t0))
+
+if __name__ == '__main__':
+    unittest.main()
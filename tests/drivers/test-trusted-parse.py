@@ -0,0 +1,89 @@
+import pyxb.binding.generate
+import pyxb.binding.saxer
+import pyxb.utils.domutils
+import StringIO
+
+import os.path
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:simpleType name="tSmall">
+    <xs:restriction base="xs:int">
+      <xs:maxInclusive value="10"/>
+    </xs:restriction>
+  </xs:simpleType>
+  <xs:complexType name="tMeasure">
+    <xs:simpleContent>
+      <xs:extension base="tSmall">
+        <xs:attribute name="unit" type="xs:string"/>
+      </xs:extension>
+    </xs:simpleContent>
+  </xs:complexType>
+  <xs:complexType name="tRecord">
+    <xs:sequence>
+      <xs:element name="name" type="xs:string"/>
+      <xs:element name="size" type="tSmall" maxOccurs="unbounded"/>
+      <xs:element name="weight" type="tMeasure" minOccurs="0"/>
+      <xs:any processContents="skip" minOccurs="0"/>
+    </xs:sequence>
+    <xs:attribute name="rank" type="tSmall"/>
+  </xs:complexType>
+  <xs:element name="record" type="tRecord"/>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+from pyxb.exceptions_ import *
+
+import unittest
+
+def CreateTrusted (xmls):
+    saxer = pyxb.binding.saxer.make_parser(fallback_namespace=Namespace.fallbackNamespace(), trust_input=True)
+    handler = saxer.getContentHandler()
+    saxer.parse(StringIO.StringIO(xmls))
+    return handler.rootObject()
+
+class TestTrustedParse (unittest.TestCase):
+    def testEquivalent (self):
+        xmls = '<record rank="3"><name>n</name><size>1</size><size>2</size><weight unit="kg">4</weight><extra/></record>'
+        validated = CreateFromDocument(xmls)
+        trusted = CreateTrusted(xmls)
+        self.assertEqual(validated.name, trusted.name)
+        self.assertEqual(validated.size, trusted.size)
+        self.assertTrue(isinstance(trusted.size[0], tSmall))
+        self.assertEqual(validated.weight.value(), trusted.weight.value())
+        self.assertEqual('kg', trusted.weight.unit)
+        self.assertEqual(3, trusted.rank)
+        self.assertTrue(isinstance(trusted.rank, tSmall))
+        self.assertEqual(1, len(trusted.wildcardElements()))
+
+    def testRoundTrip (self):
+        xmls = '<record rank="3"><name>n</name><size>1</size><size>2</size><weight unit="kg">4</weight></record>'
+        self.assertEqual(CreateFromDocument(xmls).toxml(), CreateTrusted(xmls).toxml())
+
+    def testNoFacetChecks (self):
+        xmls = '<record rank="30"><name>n</name><size>20</size></record>'
+        self.assertRaises(BadTypeValueError, CreateFromDocument, xmls)
+        trusted = CreateTrusted(xmls)
+        self.assertEqual(30, trusted.rank)
+        self.assertEqual([20], trusted.size)
+
+    def testNoContentModel (self):
+        xmls = '<record><size>1</size></record>'
+        trusted = CreateTrusted(xmls)
+        self.assertEqual(None, trusted.name)
+        self.assertEqual([1], trusted.size)
+
+    def testGlobal (self):
+        self.assertFalse(pyxb.TrustInputWhenParsing())
+        try:
+            self.assertTrue(pyxb.TrustInputWhenParsing(True))
+            instance = CreateFromDocument('<record><name>n</name><size>11</size></record>')
+            self.assertEqual([11], instance.size)
+        finally:
+            pyxb.TrustInputWhenParsing(False)
+        self.assertRaises(BadTypeValueError, CreateFromDocument, '<record><name>n</name><size>11</size></record>')
+
+if __name__ == '__main__':
+    unittest.main()
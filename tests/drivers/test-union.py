@@ -26,6 +26,45 @@ class TestUnion (unittest.TestCase):
         self.assertEqual(english.one, myUnion.Factory('one'))
         self.assertRaises(LogicError, myUnion, 'five')
 
+    def testCompatibleValue (self):
+        for v in (4, 4):
+            cv = myUnion._CompatibleValue(v)
+            self.assertTrue(isinstance(cv, singleDigit))
+            self.assertEqual(4, cv)
+        self.assertEqual(english.one, myUnion._CompatibleValue('one', _convert_string_values=False))
+        self.assertTrue(isinstance(myUnion._CompatibleValue(u'un', _convert_string_values=False), welsh))
+        self.assertRaises(BadTypeValueError, myUnion._CompatibleValue, 10)
+        self.assertRaises(BadTypeValueError, myUnion._CompatibleValue, 'five', _convert_string_values=False)
+        self.assertRaises(BadTypeValueError, myUnion._CompatibleValue, 1.5)
+        self.assertRaises(BadTypeValueError, words._CompatibleValue, 1)
+        # Only the member that can hold an int is tried for int values
+        path = myUnion._TypeBinding_mixin__CompatibleValuePath(4, True)
+        self.assertEqual((singleDigit,), path[0])
+
+    def testMemberTypesForValue (self):
+        self.assertEqual((singleDigit, english, welsh), myUnion._MemberTypesForValue(' 5 '))
+        self.assertEqual((english, welsh), myUnion._MemberTypesForValue('one'))
+        self.assertEqual((english, welsh), myUnion._MemberTypesForValue('5.5'))
+        self.assertEqual(myUnion._MemberTypes, myUnion._MemberTypesForValue(5))
+        self.assertTrue(isinstance(myUnion.Factory(' 5 '), singleDigit))
+        self.assertRaises(BadTypeValueError, myUnion.Factory, '5.5')
+
+    def testNumericShapes (self):
+        xs = pyxb.binding.datatypes
+        class numOrToken (pyxb.binding.basis.STD_union):
+            _MemberTypes = ( xs.int, xs.double, xs.boolean, xs.token )
+        numOrToken._InitializeFacetMap()
+        self.assertEqual(numOrToken._MemberTypes, numOrToken._MemberTypesForValue('1'))
+        self.assertEqual((xs.double, xs.token), numOrToken._MemberTypesForValue('-1.5e3'))
+        self.assertEqual((xs.double, xs.token), numOrToken._MemberTypesForValue('INF'))
+        self.assertEqual((xs.boolean, xs.token), numOrToken._MemberTypesForValue('true'))
+        self.assertEqual((xs.token,), numOrToken._MemberTypesForValue('unknown'))
+        self.assertTrue(isinstance(numOrToken.Factory('12'), xs.int))
+        self.assertTrue(isinstance(numOrToken.Factory('12.5'), xs.double))
+        self.assertTrue(isinstance(numOrToken.Factory('false'), xs.boolean))
+        self.assertTrue(isinstance(numOrToken.Factory('missing'), xs.token))
+        self.assertTrue(isinstance(numOrToken.Factory('1 2'), xs.token))
+
     def testList (self):
         my_list = unionList([ myUnion.Factory(4), myUnion.Factory('one')])
         self.assertEqual(2, len(my_list))
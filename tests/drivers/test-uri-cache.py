@@ -0,0 +1,49 @@
+import pyxb.binding.generate
+import pyxb.utils.utility
+import pyxb.xmlschema
+import os.path
+import tempfile
+import shutil
+import glob
+
+schema_dir = '%s/../schemas' % (os.path.dirname(__file__),)
+
+root = tempfile.mkdtemp()
+schema_root = os.path.join(root, 'schemas')
+cache_directory = os.path.join(root, 'cache')
+os.makedirs(schema_root)
+for path in glob.glob(os.path.join(schema_dir, 'test-multidoc*.xsd')):
+    shutil.copy(path, schema_root)
+main_uri = 'file://%s/test-multidoc.xsd' % (schema_root,)
+
+# Populate the cache, then remove the originals so that generation can only
+# succeed from the cache.
+prefetched = pyxb.xmlschema.schema.PrefetchDocuments([ main_uri ], uri_content_cache=pyxb.utils.utility.URIContentCache(cache_directory))
+shutil.rmtree(schema_root)
+
+generator = pyxb.binding.generate.Generator(main_uri, generate_to_files=False, uri_content_cache_directory=cache_directory, offline=True)
+modules = generator.bindingModules()
+
+import unittest
+
+class TestURICache (unittest.TestCase):
+    def testPrefetch (self):
+        self.assertEqual([ main_uri.replace('.xsd', _s) for _s in ( '.xsd', '-part1.xsd', '-part2.xsd', '-other.xsd' ) ], prefetched)
+
+    def testOffline (self):
+        self.assertTrue(generator.uriContentCache().isOffline())
+        self.assertEqual(cache_directory, generator.uriContentCache().directory())
+        self.assertEqual(set([ 'urn:multidoc', 'urn:multidoc:other' ]), set([ _m.namespace().uri() for _m in modules ]))
+        g = pyxb.binding.generate.Generator(argv=['--offline', '--uri-content-cache-directory=%s' % (cache_directory,)])
+        self.assertTrue(g.uriContentCache().isOffline())
+        self.assertRaises(IOError, pyxb.utils.utility.TextFromURI, 'file://%s/absent.xsd' % (root,), cache=g.uriContentCache())
+
+    def testNoCache (self):
+        self.assertEqual(None, pyxb.binding.generate.Generator().uriContentCache())
+        self.assertRaises(pyxb.UsageError, pyxb.binding.generate.Generator(offline=True).uriContentCache)
+
+if __name__ == '__main__':
+    try:
+        unittest.main()
+    finally:
+        shutil.rmtree(root)
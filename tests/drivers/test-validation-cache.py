@@ -0,0 +1,127 @@
+import pyxb.binding.generate
+import pyxb.utils.domutils
+
+import os.path
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:simpleType name="tSmall">
+    <xs:restriction base="xs:int">
+      <xs:maxInclusive value="10"/>
+    </xs:restriction>
+  </xs:simpleType>
+  <xs:complexType name="tItem">
+    <xs:sequence>
+      <xs:element name="a" type="tSmall" maxOccurs="2"/>
+    </xs:sequence>
+    <xs:attribute name="code" type="xs:string"/>
+  </xs:complexType>
+  <xs:complexType name="tList">
+    <xs:sequence>
+      <xs:element name="item" type="tItem" maxOccurs="unbounded"/>
+      <xs:element name="label" type="xs:string" minOccurs="0"/>
+    </xs:sequence>
+  </xs:complexType>
+  <xs:element name="list" type="tList"/>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+from pyxb.exceptions_ import *
+
+import unittest
+
+class TestValidationCache (unittest.TestCase):
+    def setUp (self):
+        self.__symbolSets = 0
+        def counting_symbol_set (instance, _symbol_set=pyxb.binding.basis.complexTypeDefinition._symbolSet):
+            self.__symbolSets += 1
+            return _symbol_set(instance)
+        tItem._symbolSet = counting_symbol_set
+        self.__itemValidations = 0
+        def counting_validate (instance, _validate=pyxb.binding.basis.complexTypeDefinition._validateBinding_vx):
+            self.__itemValidations += 1
+            return _validate(instance)
+        tItem._validateBinding_vx = counting_validate
+
+    def tearDown (self):
+        del tItem._symbolSet
+        del tItem._validateBinding_vx
+
+    def testUnchanged (self):
+        instance = CreateFromDocument('<list><item><a>1</a></item><item><a>2</a><a>3</a></item></list>')
+        self.assertTrue(instance.validateBinding())
+        self.assertEqual(2, self.__symbolSets)
+        self.assertTrue(instance.validateBinding())
+        xmls = instance.toxml(root_only=True)
+        self.assertEqual('<list><item><a>1</a></item><item><a>2</a><a>3</a></item></list>', xmls)
+        self.assertEqual(2, self.__symbolSets)
+
+    def testUnchangedSubtree (self):
+        instance = CreateFromDocument('<list><item><a>1</a></item><item><a>2</a></item></list>')
+        self.assertTrue(instance.validateBinding())
+        validations = self.__itemValidations
+        self.assertTrue(instance.validateBinding())
+        self.assertEqual(validations, self.__itemValidations)
+        instance.label = 'x'
+        self.assertTrue(instance.validateBinding())
+        self.assertEqual(validations, self.__itemValidations)
+        instance.item[1].a.append(tSmall(3))
+        self.assertTrue(instance.validateBinding())
+        self.assertEqual(validations + 1, self.__itemValidations)
+        self.assertTrue(instance.validateBinding())
+        self.assertEqual(validations + 1, self.__itemValidations)
+        instance.item[1].a.append(tSmall(4))
+        self.assertRaises(pyxb.BindingValidationError, instance.validateBinding)
+
+    def testElementSet (self):
+        instance = CreateFromDocument('<list><item><a>1</a></item><item><a>2</a></item></list>')
+        self.assertTrue(instance.validateBinding())
+        instance.item[1].a = [ 4, 5 ]
+        self.assertTrue(instance.validateBinding())
+        self.assertEqual(3, self.__symbolSets)
+        self.assertEqual('<list><item><a>1</a></item><item><a>4</a><a>5</a></item></list>', instance.toxml(root_only=True))
+        instance.item[0].a = [ 1, 2, 3 ]
+        self.assertRaises(pyxb.BindingValidationError, instance.validateBinding)
+        self.assertRaises(pyxb.BindingValidationError, instance.toxml)
+
+    def testAppend (self):
+        instance = CreateFromDocument('<list><item><a>1</a></item></list>')
+        self.assertTrue(instance.validateBinding())
+        self.assertEqual(1, self.__symbolSets)
+        instance.item[0].append(tSmall(7))
+        self.assertEqual('<list><item><a>1</a><a>7</a></item></list>', instance.toxml(root_only=True))
+        self.assertEqual(2, self.__symbolSets)
+
+    def testInPlace (self):
+        instance = CreateFromDocument('<list><item><a>1</a></item></list>')
+        self.assertTrue(instance.validateBinding())
+        instance.item[0].a.append(tSmall(2))
+        self.assertEqual('<list><item><a>1</a><a>2</a></item></list>', instance.toxml(root_only=True))
+        instance.item[0].a[1] = tSmall(3)
+        self.assertEqual('<list><item><a>1</a><a>3</a></item></list>', instance.toxml(root_only=True))
+        instance.item[0].a.append(tSmall(4))
+        self.assertRaises(pyxb.BindingValidationError, instance.validateBinding)
+        instance.item[0].a.pop()
+        self.assertTrue(instance.validateBinding())
+        instance.item.append(tItem())
+        self.assertRaises(pyxb.BindingValidationError, instance.validateBinding)
+
+    def testAttribute (self):
+        instance = CreateFromDocument('<list><item code="x"><a>1</a></item></list>')
+        self.assertTrue(instance.validateBinding())
+        self.assertEqual(1, self.__symbolSets)
+        instance.item[0].code = 'y'
+        self.assertTrue(instance.validateBinding())
+        self.assertEqual(2, self.__symbolSets)
+        self.assertEqual('<list><item code="y"><a>1</a></item></list>', instance.toxml(root_only=True))
+
+    def testReset (self):
+        instance = CreateFromDocument('<list><item><a>1</a></item></list>')
+        self.assertTrue(instance.validateBinding())
+        instance.item[0].reset()
+        self.assertRaises(pyxb.BindingValidationError, instance.validateBinding)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+import pyxb.binding.generate
+import pyxb.utils.domutils
+import StringIO
+import xml.dom.minidom
+
+import os.path
+xsd='''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" targetNamespace="urn:writexml" xmlns:tns="urn:writexml" elementFormDefault="qualified">
+  <xs:complexType name="tBase">
+    <xs:sequence>
+      <xs:element name="name" type="xs:string"/>
+      <xs:element name="sub" type="tns:tBase" minOccurs="0" maxOccurs="unbounded"/>
+    </xs:sequence>
+  </xs:complexType>
+  <xs:complexType name="tDerived">
+    <xs:complexContent>
+      <xs:extension base="tns:tBase">
+        <xs:sequence>
+          <xs:element name="size" type="xs:int"/>
+        </xs:sequence>
+      </xs:extension>
+    </xs:complexContent>
+  </xs:complexType>
+  <xs:complexType name="tRecord">
+    <xs:sequence>
+      <xs:element name="label" type="xs:string" maxOccurs="unbounded"/>
+      <xs:element name="item" type="tns:tBase" minOccurs="0" maxOccurs="unbounded"/>
+      <xs:element name="note" type="xs:string" minOccurs="0" nillable="true"/>
+      <xs:any processContents="skip" minOccurs="0"/>
+    </xs:sequence>
+    <xs:attribute name="code" type="xs:string"/>
+  </xs:complexType>
+  <xs:element name="record" type="tns:tRecord"/>
+</xs:schema>'''
+
+code = pyxb.binding.generate.GeneratePython(schema_text=xsd)
+rv = compile(code, 'test', 'exec')
+eval(rv)
+
+from pyxb.exceptions_ import *
+
+import unittest
+
+def WriteXML (instance, **kw):
+    return instance.writexml(StringIO.StringIO(), **kw).getvalue()
+
+class TestWriteXML (unittest.TestCase):
+    def testSameAsDOM (self):
+        xmls = '<ns1:record code="a&amp;&quot;b" xmlns:ns1="urn:writexml"><ns1:label>x &lt; y</ns1:label><ns1:label>z</ns1:label></ns1:record>'
+        instance = CreateFromDocument(xmls)
+        self.assertEqual(instance.toxml(), WriteXML(instance))
+        self.assertEqual(instance.toxml(root_only=True), WriteXML(instance, root_only=True))
+        self.assertEqual(xmls, WriteXML(instance, root_only=True))
+
+    def testDefaultNamespace (self):
+        instance = record(label=['x'], code='c')
+        xmls = '<record code="c" xmlns="urn:writexml"><label>x</label></record>'
+        self.assertEqual(xmls, WriteXML(instance, root_only=True, default_namespace=Namespace))
+        bds = pyxb.utils.domutils.BindingDOMSupport(default_namespace=Namespace)
+        self.assertEqual(xmls, instance.toxml(bds, root_only=True))
+
+    def testEncoding (self):
+        instance = record(label=[u'\u00e9'])
+        xmls = WriteXML(instance, encoding='utf-8')
+        self.assertTrue(isinstance(xmls, str))
+        self.assertEqual('<?xml version="1.0" encoding="utf-8"?>' + instance.toxml(root_only=True).encode('utf-8'), xmls)
+
+    def testNestedDeclarations (self):
+        xmls = '<ns1:record xmlns:ns1="urn:writexml" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"><ns1:label>x</ns1:label><ns1:item><ns1:name>n</ns1:name></ns1:item><ns1:note xsi:nil="true"/></ns1:record>'
+        instance = CreateFromDocument(xmls)
+        self.assertTrue(instance.note._isNil())
+        xmls = WriteXML(instance, root_only=True)
+        self.assertEqual('<ns1:record xmlns:ns1="urn:writexml"><ns1:label>x</ns1:label><ns1:item><ns1:name>n</ns1:name></ns1:item><ns1:note xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:nil="true"></ns1:note></ns1:record>', xmls)
+        copy = CreateFromDocument(xmls)
+        self.assertTrue(copy.note._isNil())
+        self.assertEqual('n', copy.item[0].name)
+
+    def testDeclared (self):
+        xmls = '<ns1:record xmlns:ns1="urn:writexml" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"><ns1:label>x</ns1:label><ns1:note xsi:nil="true"/></ns1:record>'
+        instance = CreateFromDocument(xmls)
+        output = StringIO.StringIO()
+        bds = pyxb.utils.domutils.BindingXMLWriter(output, xml_declaration=False)
+        bds.declareNamespace(pyxb.namespace.XMLSchema_instance)
+        instance.writexml(output, bds=bds)
+        self.assertEqual(instance.toxml(root_only=True), output.getvalue())
+
+    def testWildcard (self):
+        xmls = '<ns1:record xmlns:ns1="urn:writexml"><ns1:label>x</ns1:label><o:other xmlns:o="urn:other">text</o:other></ns1:record>'
+        instance = CreateFromDOM(xml.dom.minidom.parseString(xmls))
+        self.assertEqual(1, len(instance.wildcardElements()))
+        self.assertEqual(xmls, WriteXML(instance, root_only=True))
+
+    def testValidation (self):
+        instance = record()
+        self.assertRaises(pyxb.DOMGenerationError, WriteXML, instance)
+
+class TestFragmentCache (unittest.TestCase):
+    xmls = '<ns1:record xmlns:ns1="urn:writexml"><ns1:label>x</ns1:label><ns1:item><ns1:name>a</ns1:name><ns1:sub><ns1:name>a1</ns1:name></ns1:sub></ns1:item><ns1:item><ns1:name>b</ns1:name></ns1:item></ns1:record>'
+
+    def testReuse (self):
+        instance = CreateFromDocument(self.xmls)
+        self.assertEqual(None, instance.item[0]._xmlFragment())
+        self.assertEqual(self.xmls, WriteXML(instance, root_only=True, cache_fragments=True))
+        fragments = [ _i._xmlFragment() for _i in instance.item ]
+        self.assertFalse(None in fragments)
+        self.assertEqual(self.xmls, WriteXML(instance, root_only=True, cache_fragments=True))
+        self.assertEqual(fragments, [ _i._xmlFragment() for _i in instance.item ])
+
+    def testDisabled (self):
+        instance = CreateFromDocument(self.xmls)
+        self.assertEqual(self.xmls, WriteXML(instance, root_only=True))
+        self.assertEqual(None, instance.item[0]._xmlFragment())
+
+    def testModified (self):
+        instance = CreateFromDocument(self.xmls)
+        WriteXML(instance, root_only=True, cache_fragments=True)
+        fragment = instance.item[1]._xmlFragment()
+        instance.item[0].sub[0].name = 'c1'
+        self.assertEqual(None, instance.item[0].sub[0]._xmlFragment())
+        xmls = self.xmls.replace('a1', 'c1')
+        self.assertEqual(xmls, WriteXML(instance, root_only=True, cache_fragments=True))
+        self.assertTrue(fragment is instance.item[1]._xmlFragment())
+        instance.item[0].sub.append(tBase(name='a2'))
+        xmls = xmls.replace('</ns1:sub></ns1:item>', '</ns1:sub><ns1:sub><ns1:name>a2</ns1:name></ns1:sub></ns1:item>')
+        self.assertEqual(xmls, WriteXML(instance, root_only=True, cache_fragments=True))
+        self.assertEqual(xmls, WriteXML(instance, root_only=True))
+
+    def testContext (self):
+        instance = CreateFromDocument(self.xmls)
+        WriteXML(instance, root_only=True, cache_fragments=True)
+        xmls = self.xmls.replace('ns1:', '').replace('xmlns:ns1', 'xmlns')
+        self.assertEqual(xmls, WriteXML(instance, root_only=True, cache_fragments=True, default_namespace=Namespace))
+        self.assertEqual(self.xmls, WriteXML(instance, root_only=True, cache_fragments=True))
+
+if __name__ == '__main__':
+    unittest.main()
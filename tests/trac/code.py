@@ -0,0 +1,186 @@
+# /dev/null
+# PyXB bindings for NamespaceModule
+# NSM:e92452c8d3e28a9e27abfc9994d2007779e7f4c9
+# Generated 2026-10-18 04:46:18.182900 by PyXB version 1.1.2
+import pyxb
+import pyxb.binding
+import pyxb.binding.saxer
+import StringIO
+import pyxb.utils.utility
+import pyxb.utils.domutils
+import sys
+
+# Unique identifier for bindings created at the same time
+_GenerationUID = pyxb.utils.utility.UniqueIdentifier('urn:uuid:db8cb84a-caae-11f1-be38-02fc00000001')
+
+# Import bindings for namespaces imported into schema
+import pyxb.binding.datatypes
+
+Namespace = pyxb.namespace.CreateAbsentNamespace()
+Namespace.configureCategories(['typeBinding', 'elementBinding'])
+ModuleRecord = Namespace.lookupModuleRecordByUID(_GenerationUID, create_if_missing=True)
+ModuleRecord._setModule(sys.modules[__name__])
+
+def CreateFromDocument (xml_text, default_namespace=None, location_base=None):
+    """Parse the given XML and use the document element to create a Python instance."""
+    if not (pyxb._XMLStyle in (pyxb.XMLStyle_saxer, pyxb.XMLStyle_expat)):
+        dom = pyxb.utils.domutils.StringToDOM(xml_text)
+        return CreateFromDOM(dom.documentElement)
+    saxer = pyxb.binding.saxer.make_parser(fallback_namespace=Namespace.fallbackNamespace(), location_base=location_base)
+    handler = saxer.getContentHandler()
+    saxer.parse(StringIO.StringIO(xml_text))
+    instance = handler.rootObject()
+    return instance
+
+def IterCreateFromStream (stream, path, default_namespace=None, location_base=None):
+    """Parse the XML read from the stream, yielding a Python instance for
+    each element matching the path as soon as that element is complete.
+
+    Yielded instances are detached from their parents; see
+    L{pyxb.binding.saxer.IterParse} for details and the path syntax."""
+    return pyxb.binding.saxer.IterParse(stream, path, fallback_namespace=Namespace.fallbackNamespace(), location_base=location_base)
+
+def CreateFeedParser (location_base=None):
+    """Return a L{pyxb.binding.saxer.FeedParser} that accepts the document
+    in pieces, and creates a Python instance from its document element when
+    closed."""
+    return pyxb.binding.saxer.FeedParser(fallback_namespace=Namespace.fallbackNamespace(), location_base=location_base)
+
+def CreateFromDOM (node, default_namespace=None):
+    """Create a Python instance from the given DOM node.
+    The node tag must correspond to an element declaration in this module.
+
+    @deprecated: Forcing use of DOM interface is unnecessary; use L{CreateFromDocument}."""
+    if default_namespace is None:
+        default_namespace = Namespace.fallbackNamespace()
+    return pyxb.binding.basis.element.AnyCreateFromDOM(node, _fallback_namespace=default_namespace)
+
+
+# Complex type tAddress with content type ELEMENT_ONLY
+class tAddress (pyxb.binding.basis.complexTypeDefinition):
+    _TypeDefinition = None
+    _ContentTypeTag = pyxb.binding.basis.complexTypeDefinition._CT_ELEMENT_ONLY
+    _Abstract = False
+    _ExpandedName = pyxb.namespace.ExpandedName(Namespace, u'tAddress')
+    __slots__ = ('_AbsentNamespace0_tAddress_Line2', '_AbsentNamespace0_tAddress_Line1', '_AbsentNamespace0_tAddress_Missing')
+    # Base type is pyxb.binding.datatypes.anyType
+    
+    # Element Line2 uses Python identifier Line2
+    __Line2 = pyxb.binding.content.ElementUse(pyxb.namespace.ExpandedName(None, u'Line2'), 'Line2', '_AbsentNamespace0_tAddress_Line2', False)
+
+    
+    Line2 = property(__Line2.value, __Line2.set, None, None)
+
+    
+    # Element Line1 uses Python identifier Line1
+    __Line1 = pyxb.binding.content.ElementUse(pyxb.namespace.ExpandedName(None, u'Line1'), 'Line1', '_AbsentNamespace0_tAddress_Line1', False)
+
+    
+    Line1 = property(__Line1.value, __Line1.set, None, None)
+
+    
+    # Element Missing uses Python identifier Missing
+    __Missing = pyxb.binding.content.ElementUse(pyxb.namespace.ExpandedName(None, u'Missing'), 'Missing', '_AbsentNamespace0_tAddress_Missing', False)
+
+    
+    Missing = property(__Missing.value, __Missing.set, None, None)
+
+
+    _ElementMap = {
+        __Line2.name() : __Line2,
+        __Line1.name() : __Line1,
+        __Missing.name() : __Missing
+    }
+    _AttributeMap = {
+        
+    }
+Namespace.addCategoryObject('typeBinding', u'tAddress', tAddress)
+
+
+# Complex type tOther with content type ELEMENT_ONLY
+class tOther (pyxb.binding.basis.complexTypeDefinition):
+    _TypeDefinition = None
+    _ContentTypeTag = pyxb.binding.basis.complexTypeDefinition._CT_ELEMENT_ONLY
+    _Abstract = False
+    _ExpandedName = pyxb.namespace.ExpandedName(Namespace, u'tOther')
+    __slots__ = ('_AbsentNamespace0_tOther_Common', '_AbsentNamespace0_tOther_Special', '_AbsentNamespace0_tOther_Header')
+    # Base type is pyxb.binding.datatypes.anyType
+    
+    # Element Common uses Python identifier Common
+    __Common = pyxb.binding.content.ElementUse(pyxb.namespace.ExpandedName(None, u'Common'), 'Common', '_AbsentNamespace0_tOther_Common', False)
+
+    
+    Common = property(__Common.value, __Common.set, None, None)
+
+    
+    # Element Special uses Python identifier Special
+    __Special = pyxb.binding.content.ElementUse(pyxb.namespace.ExpandedName(None, u'Special'), 'Special', '_AbsentNamespace0_tOther_Special', False)
+
+    
+    Special = property(__Special.value, __Special.set, None, None)
+
+    
+    # Element Header uses Python identifier Header
+    __Header = pyxb.binding.content.ElementUse(pyxb.namespace.ExpandedName(None, u'Header'), 'Header', '_AbsentNamespace0_tOther_Header', False)
+
+    
+    Header = property(__Header.value, __Header.set, None, None)
+
+
+    _ElementMap = {
+        __Common.name() : __Common,
+        __Special.name() : __Special,
+        __Header.name() : __Header
+    }
+    _AttributeMap = {
+        
+    }
+Namespace.addCategoryObject('typeBinding', u'tOther', tOther)
+
+
+elt = pyxb.binding.basis.element(pyxb.namespace.ExpandedName(Namespace, u'elt'), tOther)
+Namespace.addCategoryObject('elementBinding', elt.name().localName(), elt)
+
+
+
+tAddress._AddElement(pyxb.binding.basis.element(pyxb.namespace.ExpandedName(None, u'Line2'), pyxb.binding.datatypes.string, scope=tAddress))
+
+tAddress._AddElement(pyxb.binding.basis.element(pyxb.namespace.ExpandedName(None, u'Line1'), pyxb.binding.datatypes.string, scope=tAddress))
+
+tAddress._AddElement(pyxb.binding.basis.element(pyxb.namespace.ExpandedName(None, u'Missing'), pyxb.binding.datatypes.string, scope=tAddress))
+tAddress._GroupModel_ = pyxb.binding.content.GroupSequence(
+    pyxb.binding.content.ParticleModel(tAddress._UseForTag(pyxb.namespace.ExpandedName(None, u'Line1')), min_occurs=1, max_occurs=1),
+    pyxb.binding.content.ParticleModel(tAddress._UseForTag(pyxb.namespace.ExpandedName(None, u'Line2')), min_occurs=1, max_occurs=1)
+    )
+tAddress._GroupModel_2 = pyxb.binding.content.GroupSequence(
+    pyxb.binding.content.ParticleModel(tAddress._UseForTag(pyxb.namespace.ExpandedName(None, u'Missing')), min_occurs=1, max_occurs=1)
+    )
+tAddress._GroupModel = pyxb.binding.content.GroupChoice(
+    pyxb.binding.content.ParticleModel(tAddress._GroupModel_, min_occurs=1, max_occurs=1),
+    pyxb.binding.content.ParticleModel(tAddress._GroupModel_2, min_occurs=1, max_occurs=1)
+    )
+tAddress._ContentModel = pyxb.binding.content.ParticleModel(tAddress._GroupModel, min_occurs=1, max_occurs=1)
+
+
+
+tOther._AddElement(pyxb.binding.basis.element(pyxb.namespace.ExpandedName(None, u'Common'), tAddress, scope=tOther))
+
+tOther._AddElement(pyxb.binding.basis.element(pyxb.namespace.ExpandedName(None, u'Special'), tAddress, scope=tOther))
+
+tOther._AddElement(pyxb.binding.basis.element(pyxb.namespace.ExpandedName(None, u'Header'), pyxb.binding.datatypes.string, scope=tOther))
+tOther._GroupModel_2 = pyxb.binding.content.GroupSequence(
+    pyxb.binding.content.ParticleModel(tOther._UseForTag(pyxb.namespace.ExpandedName(None, u'Special')), min_occurs=1, max_occurs=1),
+    pyxb.binding.content.ParticleModel(tOther._UseForTag(pyxb.namespace.ExpandedName(None, u'Common')), min_occurs=0L, max_occurs=1)
+    )
+tOther._GroupModel_3 = pyxb.binding.content.GroupSequence(
+    pyxb.binding.content.ParticleModel(tOther._UseForTag(pyxb.namespace.ExpandedName(None, u'Common')), min_occurs=1, max_occurs=1)
+    )
+tOther._GroupModel_ = pyxb.binding.content.GroupChoice(
+    pyxb.binding.content.ParticleModel(tOther._GroupModel_2, min_occurs=1, max_occurs=1),
+    pyxb.binding.content.ParticleModel(tOther._GroupModel_3, min_occurs=1, max_occurs=1)
+    )
+tOther._GroupModel = pyxb.binding.content.GroupSequence(
+    pyxb.binding.content.ParticleModel(tOther._UseForTag(pyxb.namespace.ExpandedName(None, u'Header')), min_occurs=1, max_occurs=1),
+    pyxb.binding.content.ParticleModel(tOther._GroupModel_, min_occurs=1, max_occurs=1)
+    )
+tOther._ContentModel = pyxb.binding.content.ParticleModel(tOther._GroupModel, min_occurs=1, max_occurs=1)
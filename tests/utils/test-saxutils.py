@@ -3,6 +3,7 @@ from pyxb.utils.saxutils import *
 from xml.dom import Node
 import xml.dom
 import pyxb.namespace
+import xml.sax
 
 class TestState (SAXElementState):
     StateSequence = []
@@ -115,6 +116,115 @@ class TestInScopeNames (unittest.TestCase):
         self.assertEqual(1, len(xmlns_map))
         self.assertEqual('http://www.w3.org/XML/1998/namespace', xmlns_map['xml'].uri())
 
+class TestSharedContexts (unittest.TestCase):
+    def tearDown (self):
+        TestState.StateSequence[:] = []
+
+    def testShared (self):
+        xmls = '<root xmlns="urn:a"><a/><b xmlns:x="urn:x"><c/></b><d/></root>'
+        saxer = make_parser(element_state_constructor=TestState)
+        saxer.parse(StringIO.StringIO(xmls))
+        ( doc, root, a, b, c, d ) = TestState.StateSequence
+        self.assertTrue(doc.namespaceContext() is root.namespaceContext())
+        self.assertTrue(root.namespaceContext() is a.namespaceContext())
+        self.assertTrue(root.namespaceContext() is d.namespaceContext())
+        self.assertTrue(b.namespaceContext() is not root.namespaceContext())
+        self.assertTrue(b.namespaceContext() is c.namespaceContext())
+        self.assertEqual('urn:x', c.namespaceContext().inScopeNamespaces()['x'].uri())
+        self.assertEqual(None, d.namespaceContext().inScopeNamespaces().get('x'))
+        self.assertEqual('urn:a', d.namespaceContext().defaultNamespace().uri())
+
+class TestLocations (unittest.TestCase):
+    def tearDown (self):
+        TestState.StateSequence[:] = []
+
+    def testTracked (self):
+        saxer = make_parser(element_state_constructor=TestState, location_base='testTracked')
+        saxer.parse(StringIO.StringIO('<root>\n  <a/></root>'))
+        a = TestState.StateSequence[2]
+        self.assertTrue(isinstance(a.packedLocation(), (int, long)))
+        self.assertEqual(2, a.location().lineNumber)
+        self.assertEqual(2, a.location().columnNumber)
+        self.assertEqual('testTracked[2:2]', str(a.location()))
+
+    def testUntracked (self):
+        saxer = make_parser(element_state_constructor=TestState, track_locations=False)
+        saxer.parse(StringIO.StringIO('<root><a/></root>'))
+        a = TestState.StateSequence[2]
+        self.assertEqual(None, a.packedLocation())
+        self.assertEqual(None, a.location())
+
+    def testGlobal (self):
+        self.assertTrue(pyxb.TrackLocationsWhenParsing())
+        try:
+            self.assertFalse(pyxb.TrackLocationsWhenParsing(False))
+            saxer = make_parser(element_state_constructor=TestState)
+            saxer.parse(StringIO.StringIO('<root/>'))
+            self.assertEqual(None, TestState.StateSequence[1].location())
+        finally:
+            pyxb.TrackLocationsWhenParsing(True)
+
+class TestInternedNames (unittest.TestCase):
+    def tearDown (self):
+        TestState.StateSequence[:] = []
+
+    def testShared (self):
+        xmls = '<root xmlns:b="urn:b"><a/><b:a/><a/><b:a/></root>'
+        saxer = make_parser(element_state_constructor=TestState, fallback_namespace=BogusNamespace)
+        saxer.parse(StringIO.StringIO(xmls))
+        ( root, a1, ba1, a2, ba2 ) = TestState.StateSequence[1:]
+        self.assertTrue(a1.expandedName() is a2.expandedName())
+        self.assertTrue(ba1.expandedName() is ba2.expandedName())
+        self.assertNotEqual(a1.expandedName(), ba1.expandedName())
+        self.assertEqual('urn:b', ba1.expandedName().namespaceURI())
+
+    def testFallback (self):
+        en = InternedExpandedName((None, 'a'))
+        self.assertTrue(en is InternedExpandedName((None, 'a')))
+        self.assertTrue(en.namespace() is None)
+        absent = pyxb.namespace.CreateAbsentNamespace()
+        aen = InternedExpandedName((None, 'a'), absent)
+        self.assertTrue(aen.namespace() is absent)
+        self.assertTrue(aen is not en)
+
+class TestDirectExpat (TestInScopeNames):
+    def setUp (self):
+        self.__style = pyxb._XMLStyle
+        pyxb._SetXMLStyle(pyxb.XMLStyle_expat)
+
+    def tearDown (self):
+        pyxb._SetXMLStyle(self.__style)
+        super(TestDirectExpat, self).tearDown()
+
+    def testParser (self):
+        self.assertTrue(isinstance(make_parser(), DirectExpatParser))
+
+    def testLocation (self):
+        xmls = '''<?xml version="1.0"?>
+<root xmlns:b="urn:b" a="1" b:c="2">
+  <b:child/>
+</root>'''
+        saxer = make_parser(element_state_constructor=TestState, location_base='testLocation')
+        saxer.parse(StringIO.StringIO(xmls))
+        child = TestState.StateSequence[2]
+        self.assertEqual(('urn:b', 'child'), child.expandedName().uriTuple())
+        self.assertEqual(3, child.location().lineNumber)
+        self.assertEqual(2, child.location().columnNumber)
+
+    def testFeed (self):
+        xmls = '<root><a>text</a><b/></root>'
+        saxer = make_parser(element_state_constructor=TestState)
+        for i in xrange(len(xmls)):
+            saxer.feed(xmls[i])
+        saxer.close()
+        self.assertEqual(['root', 'a', 'b'], [ _s.expandedName().localName() for _s in TestState.StateSequence[1:] ])
+        self.assertEqual([ ('text', None, False) ], TestState.StateSequence[2].content())
+
+    def testError (self):
+        saxer = make_parser()
+        self.assertRaises(xml.sax.SAXParseException, saxer.parse, StringIO.StringIO('<root><a></root>'))
+        saxer.parse(StringIO.StringIO('<root/>'))
+
 if '__main__' == __name__:
     unittest.main()
     
@@ -136,6 +136,36 @@ class TestCodePointSet (unittest.TestCase):
         self.assertEqual(u"\u0041", CodePointSet(65).asSingleCharacter())
         self.assertEqual(u"\uFFFF", CodePointSet(0xFFFF).asSingleCharacter())
 
+    def testSetOperands (self):
+        c = CodePointSet((10, 20), (30, 40))
+        c.extend(CodePointSet((15, 32), 50))
+        self.assertEqual(c.asTuples(), [ (10, 40), (50, 50) ])
+        c.subtract(CodePointSet((12, 13), (35, 60)))
+        self.assertEqual(c.asTuples(), [ (10, 11), (14, 34) ])
+        c.subtract(CodePointSet(12).negate())
+        self.assertEqual(c.asTuples(), [])
+
+class TestCodePointSetMap (unittest.TestCase):
+    def testBlockMap (self):
+        self.assertEqual(96, len(BlockMap))
+        self.assertTrue('Arrows' in BlockMap)
+        self.assertFalse('Bogus' in BlockMap)
+        self.assertEqual(None, BlockMap.get('Bogus'))
+        self.assertRaises(KeyError, lambda: BlockMap['Bogus'])
+        self.assertEqual(BlockMap['Arrows'].asTuples(), [ (0x2190, 0x21ff) ])
+        self.assertTrue(BlockMap['Arrows'] is BlockMap.get('Arrows'))
+
+    def testPropertyMap (self):
+        self.assertTrue('Nd' in PropertyMap.keys())
+        self.assertEqual(PropertyMap['Zs'].asTuples()[:2], [ (0x20, 0x20), (0xa0, 0xa0) ])
+        self.assertTrue(PropertyMap['Nd'] is MultiCharEsc['d'])
+
+    def testMultiCharEsc (self):
+        self.assertEqual(10, len(MultiCharEsc))
+        self.assertEqual(MultiCharEsc['s'].asTuples(), [ (9, 10), (13, 13), (32, 32) ])
+        self.assertEqual(MultiCharEsc['S'], MultiCharEsc['s'].negate())
+        self.assertTrue(MultiCharEsc['S'] is MultiCharEsc['S'])
+
 if '__main__' == __name__:
     unittest.main()
             
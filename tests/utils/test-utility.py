@@ -577,6 +577,87 @@ class TestGetMatchingFiles (unittest.TestCase):
         self.assertEqual(files, set(['d1/f1c', 'd2/f2b']))
 
 
+class TestPackedLocation (unittest.TestCase):
+    def testRoundTrip (self):
+        template = Location('doc.xml')
+        packed = template.packedLocation(line_number=12, column_number=3)
+        self.assertTrue(isinstance(packed, (int, long)))
+        location = Location.Unpack(packed)
+        self.assertEqual('doc.xml', location.locationBase.locationBase())
+        self.assertEqual(12, location.lineNumber)
+        self.assertEqual(3, location.columnNumber)
+        self.assertEqual(str(template.newLocation(line_number=12, column_number=3)), str(location))
+
+    def testLargeValues (self):
+        location = Location.Unpack(Location().packedLocation(line_number=0, column_number=3000000000))
+        self.assertTrue(location.locationBase.locationBase() is None)
+        self.assertEqual(0, location.lineNumber)
+        self.assertEqual(3000000000, location.columnNumber)
+
+    def testUnknown (self):
+        location = Location.Unpack(Location('doc.xml').packedLocation())
+        self.assertEqual(None, location.lineNumber)
+        self.assertEqual(None, location.columnNumber)
+
+    def testSharedBase (self):
+        p1 = Location('a.xml').packedLocation(line_number=1, column_number=1)
+        p2 = Location('a.xml').packedLocation(line_number=1, column_number=1)
+        p3 = Location('b.xml').packedLocation(line_number=1, column_number=1)
+        self.assertEqual(p1, p2)
+        self.assertNotEqual(p1, p3)
+
+    def testLocatable (self):
+        class Locatable (Locatable_mixin):
+            pass
+        instance = Locatable()
+        instance._setLocation(Location('c.xml').packedLocation(line_number=4, column_number=5))
+        self.assertEqual(4, instance._location().lineNumber)
+        location = Location('c.xml', 6, 7)
+        instance._setLocation(location)
+        self.assertTrue(location is instance._location())
+
+import shutil
+class TestURIContentCache (unittest.TestCase):
+    def setUp (self):
+        self.__directory = tempfile.mkdtemp()
+        self.__cacheDirectory = os.path.join(self.__directory, 'cache')
+        self.__path = os.path.join(self.__directory, 'doc.xml')
+        self.__uri = 'file://' + self.__path
+        file(self.__path, 'w').write('<doc/>')
+
+    def tearDown (self):
+        shutil.rmtree(self.__directory)
+
+    def testRetrieve (self):
+        cache = URIContentCache(self.__cacheDirectory)
+        self.assertEqual(None, cache.lookup(self.__uri))
+        self.assertEqual('<doc/>', TextFromURI(self.__uri, cache=cache))
+        self.assertEqual('<doc/>', cache.lookup(self.__uri))
+        file(self.__path, 'w').write('<changed/>')
+        self.assertEqual('<doc/>', TextFromURI(self.__uri, cache=cache))
+        self.assertEqual('<changed/>', TextFromURI(self.__uri))
+        cache = URIContentCache(self.__cacheDirectory, refresh=True)
+        self.assertEqual('<changed/>', TextFromURI(self.__uri, cache=cache))
+        self.assertEqual('<changed/>', cache.lookup(self.__uri))
+
+    def testContentAddressed (self):
+        cache = URIContentCache(self.__cacheDirectory)
+        signature = cache.store('http://example.com/a.xsd', '<doc/>')
+        self.assertEqual(HashForText('<doc/>'), signature)
+        self.assertEqual(signature, cache.store('http://example.com/b.xsd', '<doc/>'))
+        self.assertEqual(3, len(os.listdir(self.__cacheDirectory)))
+        self.assertEqual('<doc/>', cache.lookup('http://example.com/b.xsd'))
+        file(os.path.join(self.__cacheDirectory, signature), 'w').write('<damaged/>')
+        self.assertEqual(None, cache.lookup('http://example.com/a.xsd'))
+
+    def testOffline (self):
+        self.assertEqual('<doc/>', TextFromURI(self.__uri, cache=URIContentCache(self.__cacheDirectory)))
+        os.unlink(self.__path)
+        cache = URIContentCache(self.__cacheDirectory, offline=True)
+        self.assertEqual('<doc/>', TextFromURI(self.__uri, cache=cache))
+        self.assertRaises(IOError, cache.retrieve, 'http://example.com/absent.xsd')
+        self.assertRaises(pyxb.UsageError, URIContentCache, self.__cacheDirectory, offline=True, refresh=True)
+
 if '__main__' == __name__:
     unittest.main()
             
@@ -61,6 +61,7 @@ class TestXMLRE (unittest.TestCase):
         (charset, position) = xmlre.MaybeMatchCharacterClass(text, 0)
         self.assertEqual(position, len(text))
         self.assertEqual(charset.negate(), unicode.PropertyMap['N'])
+        self.assertTrue(charset is xmlre.MaybeMatchCharacterClass(text, 0)[0])
         text = r'\p{Sm}'
         (charset, position) = xmlre.MaybeMatchCharacterClass(text, 0)
         self.assertEqual(position, len(text))
@@ -163,6 +164,10 @@ class TestXMLRE (unittest.TestCase):
         # converted to character classes.
         self.assertEqual(r'^Why[ ]not[?]$', xmlre.XMLToPython(r'Why[ ]not\?'))
 
+    def testXMLToPythonCached (self):
+        text = u'[\i-[:]][\c-[:]]*'
+        self.assertTrue(xmlre.XMLToPython(text) is xmlre.XMLToPython(text))
+
     def testRegularExpressions (self):
         text = u'[\i-[:]][\c-[:]]*'
         compiled_re = re.compile(xmlre.XMLToPython(text))